@@ -1,16 +1,17 @@
 #!zsh
-export GEOCODE_CACHE_FILE=".geocode_cache.json"
+export GEOCODE_CACHE_FILE=".geocode_cache.sqlite"
+export HTTP_CACHE_DIR=".http_cache"
+export FINGERPRINT_STORE_FILE=".fingerprints.sqlite"
 
+resume=""
 while true
 do
-    python -m trouver_une_fresque_scraper.scrape --skip-dirty-check
+    python -m trouver_une_fresque_scraper.scrape --skip-dirty-check $resume
     if [ $? != 0 ]; then  # if the command fails (returns a non-zero exit code)
         echo "Command failed, retrying..."
+        resume="--resume"  # only retry the sources that haven't been completed
         sleep 5  # wait for 5 seconds before retrying
     else
         break  # if the command succeeds, exit the loop
     fi
 done
-
-# Clean up the disk cache after a successful run
-rm -f "$GEOCODE_CACHE_FILE"
@@ -1,15 +1,15 @@
 import json
 import requests
-import time
 import logging
 
 from datetime import datetime
 
-from trouver_une_fresque_scraper.db.records import get_record_dict
+from trouver_une_fresque_scraper.db.records import get_record_dict, refresh_records
+from trouver_une_fresque_scraper.utils import http_cache
 from trouver_une_fresque_scraper.utils.errors import FreskError
 from trouver_une_fresque_scraper.utils.keywords import *
 from trouver_une_fresque_scraper.utils.language import detect_language_code
-from trouver_une_fresque_scraper.utils.location import get_address
+from trouver_une_fresque_scraper.utils.location import get_address, prefetch_address
 
 
 def get_glorieuses_data(source):
@@ -17,19 +17,29 @@ def get_glorieuses_data(source):
 
     json_records = []
     records = []
+    records_key = json.dumps(source, sort_keys=True)
 
     try:
-        response = requests.get(source["url"])
+        response = http_cache.get(source["url"])
         # Check if the request was successful (status code 200)
         if response.status_code == 200:
+            # Skip parsing (and geocoding) if the API response hasn't changed.
+            cached_records = http_cache.load_records(records_key) if response.from_cache else None
+            if cached_records is not None:
+                logging.info(f"API response unchanged, reusing {len(cached_records)} records.")
+                return refresh_records(cached_records)
             json_records = response.json()
         else:
             logging.info(f"Request failed with status code: {response.status_code}")
     except requests.RequestException as e:
         logging.info(f"An error occurred: {e}")
 
+    # Geocode the addresses in the background while records are parsed
+    for json_record in json_records:
+        if json_record.get("Adresse"):
+            prefetch_address(f"{json_record['Adresse']}, {json_record.get('Ville')}")
+
     for json_record in json_records:
-        time.sleep(1.5)
         logging.info("")
 
         ################################################################
@@ -173,4 +183,5 @@ def get_glorieuses_data(source):
         records.append(record)
         logging.info(f"Successfully API record\n{json.dumps(record, indent=4)}")
 
+    http_cache.store_records(records_key, records)
     return records
@@ -6,10 +6,11 @@ import re
 import requests
 import logging
 
-from trouver_une_fresque_scraper.db.records import get_record_dict
+from trouver_une_fresque_scraper.db.records import get_record_dict, refresh_records
 from ics import Calendar
 import re
 from trouver_une_fresque_scraper.utils.errors import FreskError
+from trouver_une_fresque_scraper.utils import http_cache
 from trouver_une_fresque_scraper.utils.language import detect_language_code
 from trouver_une_fresque_scraper.utils.location import get_address
 import xml.etree.ElementTree as ET
@@ -90,11 +91,24 @@ def get_ics_data(source):
 
     calendar = None
     records = []
+    records_key = json.dumps(source, sort_keys=True)
 
     try:
-        response = requests.get(source["url"])
+        response = http_cache.get(source["url"])
         # Check if the request was successful (status code 200).
         if response.status_code == 200:
+            # Skip parsing (and geocoding) if the calendar hasn't changed.
+            cached_records = http_cache.load_records(records_key) if response.from_cache else None
+            if cached_records is not None:
+                now = datetime.datetime.now(datetime.timezone.utc)
+                records = [
+                    r
+                    for r in cached_records
+                    if datetime.datetime.fromisoformat(r["start_date"]) >= now
+                ]
+                logging.info(f"Calendar unchanged, reusing {len(records)} records.")
+                return refresh_records(records)
+
             # Remove VALARMs which incorrectly crash the ics library.
             text = re.sub("BEGIN:VALARM.*END:VALARM", "", response.text, flags=re.DOTALL)
             calendar = Calendar(text)
@@ -243,5 +257,6 @@ def get_ics_data(source):
         records.append(record)
         logging.info(f"Successfully got record\n{json.dumps(record, indent=4)}")
 
+    http_cache.store_records(records_key, records)
     logging.info(f"Got {len(records)} records.")
     return records
@@ -1,5 +1,8 @@
+import logging
 import pandas as pd
 
+from concurrent.futures import ThreadPoolExecutor
+
 from trouver_une_fresque_scraper.apis.ics import get_ics_data
 from trouver_une_fresque_scraper.apis.glorieuses import get_glorieuses_data
 from trouver_une_fresque_scraper.apis.mobilite import get_mobilite_data
@@ -12,12 +15,45 @@ APIS_FNS = {
 }
 
 
-def main(apis):
+def fetch_source(fn, api, checkpoint=None):
+    if checkpoint is None:
+        return fn(api) or []
+    return checkpoint.run(api, lambda: fn(api) or [])
+
+
+def main(apis, max_workers=1, checkpoint=None):
+    """
+    Fetches all the API sources.
+
+    Args:
+        apis: List of source configurations of type "api"
+        max_workers: Number of sources fetched concurrently. Requests share the
+            connection pool of utils.http_cache, which also limits the number
+            of concurrent requests per host.
+        checkpoint: utils.checkpoint.Checkpoint saving the records of each
+            source, and recording failures instead of raising them
+
+    Returns:
+        DataFrame of event records
+    """
     records = []
 
+    jobs = []
     for sourcek in APIS_FNS:
         for api in apis:
             if sourcek in api["url"]:
-                records += APIS_FNS[sourcek](api)
+                jobs.append((APIS_FNS[sourcek], api))
+
+    if max_workers <= 1:
+        for fn, api in jobs:
+            records += fetch_source(fn, api, checkpoint)
+        return pd.DataFrame(records)
+
+    logging.info(f"Fetching {len(jobs)} API sources with {max_workers} workers")
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(fetch_source, fn, api, checkpoint) for fn, api in jobs]
+        # Merge in submission order so that the output stays deterministic
+        for future in futures:
+            records += future.result()
 
     return pd.DataFrame(records)
@@ -5,7 +5,8 @@ import pandas as pd
 
 from datetime import datetime, timedelta
 
-from trouver_une_fresque_scraper.db.records import get_record_dict
+from trouver_une_fresque_scraper.db.records import get_record_dict, refresh_records
+from trouver_une_fresque_scraper.utils import http_cache
 from trouver_une_fresque_scraper.utils.errors import FreskError
 from trouver_une_fresque_scraper.utils.keywords import is_online, is_training, is_for_kids
 from trouver_une_fresque_scraper.utils.language import detect_language_code
@@ -13,28 +14,49 @@ from trouver_une_fresque_scraper.utils.location import get_address
 
 
 def get_df(source):
+    """
+    Returns the results of a Make webhook as a DataFrame, along with whether
+    the response is unchanged since the previous run.
+    """
     try:
-        response = requests.get(source)
+        response = http_cache.get(source)
         # Check if the request was successful (status code 200)
         if response.status_code == 200:
             try:
-                return pd.json_normalize(response.json()["response"]["results"])
+                return (
+                    pd.json_normalize(response.json()["response"]["results"]),
+                    response.from_cache,
+                )
             except KeyError as e:
                 logging.info(f"incorrect results key in source json: {e}")
         else:
             logging.info(f"request failed with status code: {response.status_code}")
     except requests.RequestException as e:
         logging.info(f"request error occurred: {e}")
+    return None, False
 
 
 def get_mobilite_data(source):
     logging.info("Getting data from Fresque de la Mobilité API")
 
     records = []
+    records_key = json.dumps(source, sort_keys=True)
 
     # Get two make results and merge them
-    df_sessions = get_df("https://hook.eu1.make.com/ui9bvl4c3w69dxdlb7goskl3o22x74um")
-    df_versions = get_df("https://hook.eu1.make.com/sy4ud6vxutts9h62t4tt6gv0xr5rrkyd")
+    df_sessions, sessions_unchanged = get_df(
+        "https://hook.eu1.make.com/ui9bvl4c3w69dxdlb7goskl3o22x74um"
+    )
+    df_versions, versions_unchanged = get_df(
+        "https://hook.eu1.make.com/sy4ud6vxutts9h62t4tt6gv0xr5rrkyd"
+    )
+
+    # Skip parsing (and geocoding) if neither response has changed.
+    if sessions_unchanged and versions_unchanged:
+        cached_records = http_cache.load_records(records_key)
+        if cached_records is not None:
+            logging.info(f"API responses unchanged, reusing {len(cached_records)} records.")
+            return refresh_records(cached_records)
+
     try:
         df_sessions = df_sessions.merge(
             df_versions,
@@ -151,4 +173,5 @@ def get_mobilite_data(source):
         records.append(record)
         logging.info(f"Successfully API record\n{json.dumps(record, indent=4)}")
 
+    http_cache.store_records(records_key, records)
     return records
@@ -1,11 +1,96 @@
 import psycopg
 
+from trouver_une_fresque_scraper.db.schema import (
+    EVENT_COLUMNS,
+    EVENT_KEY,
+    db_rows,
+    pg_types,
+    quoted_column_list,
+    to_db_frame,
+)
+from trouver_une_fresque_scraper.db.session import unit_of_work
 
-def update_most_recent(conn, table):
+
+# Events removed from events_future before their start date are only marked
+# as most recent once it has passed: those that started since the previous
+# push are checked again, and at least those that started within this period.
+MOST_RECENT_LOOKBACK = "7 days"
+
+
+def get_keys(conn, table):
+    """Returns the (id, workshop_type) keys of the rows of a table."""
+    with conn.cursor() as cursor:
+        cursor.execute('SELECT DISTINCT "id", "workshop_type" FROM %s' % table, prepare=True)
+        return set(cursor.fetchall())
+
+
+def get_previous_push(conn):
+    """
+    Returns the date of the previous push, from private.events_last_push, or
+    else the latest scrape date of private.events_future, read before it is
+    replaced. None if both are empty.
+    """
+    with conn.cursor() as cursor:
+        cursor.execute(
+            'SELECT COALESCE((SELECT "push_date" FROM private.events_last_push), '
+            '(SELECT MAX("scrape_date") FROM private.events_future))',
+            prepare=True,
+        )
+        return cursor.fetchone()[0]
+
+
+def record_push(conn, df):
+    """
+    Records the date of this push, and the latest scrape date of its events,
+    in the single row of private.events_last_push.
+
+    Rows of private.events_future keep the scrape date of their last change,
+    so that unchanged events aren't rewritten: this row tells when they were
+    last seen.
+    """
+    scrape_dates = [d for (d,) in db_rows(df, ["scrape_date"]) if d is not None]
+    with conn.cursor() as cursor:
+        cursor.execute(
+            'INSERT INTO private.events_last_push ("push_date", "scrape_date") '
+            "VALUES (current_timestamp, %s) "
+            'ON CONFLICT ("id") DO UPDATE SET "push_date" = EXCLUDED."push_date", '
+            '"scrape_date" = EXCLUDED."scrape_date"',
+            (max(scrape_dates, default=None),),
+            prepare=True,
+        )
+
+
+def update_most_recent(conn, table, removed_keys, previous_push):
+    """
+    Marks as most recent the last scraped row of the past events which are
+    not in private.events_future anymore.
+
+    Only the events removed from private.events_future in this run, and
+    those that started since the previous push (or within
+    MOST_RECENT_LOOKBACK, if that is longer), are considered, so that the
+    cost of the update depends on the size of a run rather than on the whole
+    history. Without a previous push, all the past events are considered.
+    """
+    removed_keys = sorted(removed_keys)
     query = f"""
-    WITH MissingRows AS (
+    WITH TouchedKeys AS (
+        SELECT R."id", R."workshop_type"
+        FROM unnest(%(ids)s::character varying[], %(workshop_types)s::bigint[])
+            AS R("id", "workshop_type")
+        UNION
+        SELECT S."id", S."workshop_type"
+        FROM {table} S
+        WHERE S."start_date" >= LEAST(
+            COALESCE(%(previous_push)s::timestamptz, '-infinity'),
+            current_timestamp - interval '{MOST_RECENT_LOOKBACK}'
+        )
+        AND S."start_date" < current_timestamp AND NOT S."most_recent"
+    ),
+    MissingRows AS (
         SELECT S."id", S."workshop_type", MAX(S."scrape_date") AS max_scrape_date
         FROM {table} S
+        JOIN TouchedKeys T
+        ON S."id" = T."id" AND S."workshop_type" = T."workshop_type"
         LEFT JOIN private.events_future F
         ON S."id" = F."id" AND S."workshop_type" = F."workshop_type"
         WHERE F."id" IS NULL
@@ -14,70 +99,155 @@ def update_most_recent(conn, table):
     UPDATE {table} S
     SET "most_recent" = TRUE
     FROM MissingRows M
-    WHERE S."id" = M."id" AND S."workshop_type" = M."workshop_type" AND S."scrape_date" = M.max_scrape_date AND S."start_date" < current_timestamp;
+    WHERE S."id" = M."id" AND S."workshop_type" = M."workshop_type" AND S."scrape_date" = M.max_scrape_date AND S."start_date" < current_timestamp AND NOT S."most_recent";
     """
-    cursor = conn.cursor()
+    params = {
+        "ids": [key[0] for key in removed_keys],
+        "workshop_types": [key[1] for key in removed_keys],
+        "previous_push": previous_push,
+    }
     print(query)
-    try:
-        cursor.execute(query)
-        conn.commit()
-    except (Exception, psycopg.DatabaseError) as error:
-        print("Error: %s" % error)
-        conn.rollback()
-        cursor.close()
-        return 1
-    cursor.close()
+    with conn.cursor() as cursor:
+        cursor.execute(query, params, prepare=True)
+
+
+def get_columns(df, table):
+    """Returns the columns of a DataFrame, in the order of the table schema."""
+    unknown_columns = [c for c in df.columns if c not in EVENT_COLUMNS]
+    if unknown_columns:
+        raise ValueError("Columns missing from the %s schema: %s" % (table, unknown_columns))
+    return [c for c in EVENT_COLUMNS if c in df.columns]
 
 
 def insert(conn, df, table, most_recent=False):
+    """
+    Inserts the events of a DataFrame converted by db.schema.to_db_frame
+    into a table, streaming them with COPY FROM STDIN in binary format.
+
+    Columns are copied in the order of the table schema (see db.schema).
+    """
     df["most_recent"] = most_recent
-    tuples = [tuple(x) for x in df.to_numpy()]
-    cols = ",".join(list(df.columns))
+    columns = get_columns(df, table)
 
-    print(list(df.columns))
+    print(columns)
 
-    # SQL query to execute
-    cursor = conn.cursor()
-    try:
-        cursor.executemany(
-            "INSERT INTO %s(%s) VALUES (%%s, %%s, %%s, %%s, %%s, %%s, %%s, %%s, %%s, %%s, %%s, %%s, %%s, %%s, %%s, %%s, %%s, %%s, %%s, %%s, %%s, %%s, %%s, %%s)"
-            % (table, cols),
-            tuples,
-            returning=True,
+    with conn.cursor() as cursor:
+        with cursor.copy(
+            "COPY %s (%s) FROM STDIN (FORMAT BINARY)" % (table, quoted_column_list(columns))
+        ) as copy:
+            copy.set_types(pg_types(columns))
+            for row in db_rows(df, columns):
+                copy.write_row(row)
+
+
+def merge(conn, df, table, most_recent=False):
+    """
+    Replaces the rows of a table by the events of a DataFrame converted by
+    db.schema.to_db_frame, only writing the differences, in the transaction
+    of the connection.
+
+    The events are copied to a staging table first. Rows are then matched on
+    (id, workshop_type): rows missing from the events are deleted, changed
+    rows are updated and new events are inserted, so that readers never see
+    the table empty or half filled.
+
+    The scrape date alone doesn't make a row changed: it is only updated
+    along with the other columns (see record_push).
+    """
+    df["most_recent"] = most_recent
+    columns = get_columns(df, table)
+    df = df.drop_duplicates(subset=list(EVENT_KEY), keep="last")
+
+    key = " AND ".join(f'T."{c}" = S."{c}"' for c in EVENT_KEY)
+    compared = [c for c in columns if c not in EVENT_KEY and c != "scrape_date"]
+    assignments = ", ".join(f'"{c}" = S."{c}"' for c in columns if c not in EVENT_KEY)
+
+    with conn.cursor() as cursor:
+        cursor.execute("CREATE TEMPORARY TABLE events_staging (LIKE %s) ON COMMIT DROP" % table)
+        with cursor.copy(
+            "COPY events_staging (%s) FROM STDIN (FORMAT BINARY)" % quoted_column_list(columns)
+        ) as copy:
+            copy.set_types(pg_types(columns))
+            for row in db_rows(df, columns):
+                copy.write_row(row)
+
+        cursor.execute(
+            "DELETE FROM %s T WHERE NOT EXISTS (SELECT 1 FROM events_staging S WHERE %s)"
+            % (table, key)
         )
-        conn.commit()
-    except (Exception, psycopg.DatabaseError) as error:
-        print("Error: %s" % error)
-        conn.rollback()
-        cursor.close()
-        return 1
-    cursor.close()
+        deleted = cursor.rowcount
+        cursor.execute(
+            "UPDATE %s T SET %s FROM events_staging S WHERE %s AND (%s) IS DISTINCT FROM (%s)"
+            % (
+                table,
+                assignments,
+                key,
+                ", ".join(f'T."{c}"' for c in compared),
+                ", ".join(f'S."{c}"' for c in compared),
+            )
+        )
+        updated = cursor.rowcount
+        cursor.execute(
+            "INSERT INTO %s (%s) SELECT %s FROM events_staging S "
+            "WHERE NOT EXISTS (SELECT 1 FROM %s T WHERE %s)"
+            % (
+                table,
+                quoted_column_list(columns),
+                ", ".join(f'S."{c}"' for c in columns),
+                table,
+                key,
+            )
+        )
+        inserted = cursor.rowcount
+    print(f"Merged {table}: {inserted} inserted, {updated} updated, {deleted} deleted")
 
 
 def truncate(conn, table):
     query = "TRUNCATE TABLE %s" % table
-    cursor = conn.cursor()
-    try:
+    with conn.cursor() as cursor:
         cursor.execute(query)
-        conn.commit()
-    except (Exception, psycopg.DatabaseError) as error:
-        print("Error: %s" % error)
-        conn.rollback()
-        cursor.close()
-        return 1
-    cursor.close()
 
 
-def etl(conn, df):
-    df = df.astype(str)
+def etl(conn, df, merge_future=True):
+    """
+    Loads the events of a run into the events tables, on a connection of
+    db.session.unit_of_work so that all the steps are committed together.
+    """
+    df = to_db_frame(df)
 
     # Insert all events to the historical table. Setting most_recent to False,
     # but maybe the call to `update_most_recent()` below will change this.
     insert(conn, df, "private.events_scraped", most_recent=False)
 
-    # Delete all future events before inserting them again, so that they are
-    # updated
-    truncate(conn, "private.events_future")
-    insert(conn, df, "private.events_future", most_recent=True)
+    # Events of the previous run which aren't in this one
+    new_keys = set(db_rows(df, list(EVENT_KEY)))
+    removed_keys = get_keys(conn, "private.events_future") - new_keys
+    previous_push = get_previous_push(conn)
+
+    if merge_future:
+        # Only apply the differences with the previous run, so that the
+        # public view never sees an empty table
+        merge(conn, df, "private.events_future", most_recent=True)
+    else:
+        # Delete all future events before inserting them again, so that they
+        # are updated
+        truncate(conn, "private.events_future")
+        insert(conn, df, "private.events_future", most_recent=True)
+
+    update_most_recent(conn, "private.events_scraped", removed_keys, previous_push)
+    record_push(conn, df)
+
 
-    update_most_recent(conn, "private.events_scraped")
+def push(pool, df, merge_future=True):
+    """
+    Runs the ETL of the events of a DataFrame in a unit of work of the pool.
+
+    Returns:
+        1 if it failed, in which case nothing was written
+    """
+    try:
+        with unit_of_work(pool) as conn:
+            etl(conn, df, merge_future=merge_future)
+    except (Exception, psycopg.DatabaseError) as error:
+        print("Error: %s" % error)
+        return 1
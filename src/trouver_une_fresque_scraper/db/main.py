@@ -1,12 +1,12 @@
 import json
 import argparse
+import sys
 import pandas as pd
 import psycopg
 
-from psycopg.conninfo import make_conninfo
-
-from trouver_une_fresque_scraper.db.etl import etl, insert, truncate
-from trouver_une_fresque_scraper.utils.utils import get_config
+from trouver_une_fresque_scraper.db.etl import insert, push, truncate
+from trouver_une_fresque_scraper.db.schema import to_db_frame
+from trouver_une_fresque_scraper.db.session import create_pool, unit_of_work
 
 
 def main():
@@ -23,6 +23,12 @@ def main():
         default=False,
         help="truncate db before inserting again",
     )
+    parser.add_argument(
+        "--truncate-future",
+        action="store_true",
+        default=False,
+        help="in the full ETL cycle, truncate and reinsert future events instead of merging them",
+    )
     parser.add_argument(
         "--input",
         type=str,
@@ -34,24 +40,21 @@ def main():
     if args.full_etl and args.truncate_first:
         raise Exception
 
-    credentials = get_config()
-    host = credentials["host"]
-    port = credentials["port"]
-    user = credentials["user"]
-    psw = credentials["psw"]
-    database = credentials["database"]
-
-    with psycopg.connect(
-        make_conninfo(dbname=database, user=user, password=psw, host=host, port=port)
-    ) as conn:
-        input_records = open(args.input, "r")
-        input_records = json.loads(input_records.read())
-        df = pd.DataFrame.from_dict(pd.json_normalize(input_records), orient="columns")
-        print(df)
+    input_records = open(args.input, "r")
+    input_records = json.loads(input_records.read())
+    df = pd.DataFrame.from_dict(pd.json_normalize(input_records), orient="columns")
+    print(df)
 
+    with create_pool(max_size=1) as pool:
         if args.full_etl:
-            etl(conn, df)
+            if push(pool, df, merge_future=not args.truncate_future):
+                sys.exit(1)
         else:
-            if args.truncate_first:
-                truncate(conn, "private.events_future")
-            insert(conn, df, "private.events_future")
+            try:
+                with unit_of_work(pool) as conn:
+                    if args.truncate_first:
+                        truncate(conn, "private.events_future")
+                    insert(conn, to_db_frame(df), "private.events_future")
+            except (Exception, psycopg.DatabaseError) as error:
+                print("Error: %s" % error)
+                sys.exit(1)
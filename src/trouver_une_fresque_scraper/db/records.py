@@ -4,6 +4,19 @@ from zoneinfo import ZoneInfo
 from trouver_une_fresque_scraper.utils.utils import get_config
 
 
+def get_scrape_date():
+    timezone = get_config("timezone")
+    return pd.to_datetime("now", utc=True).tz_convert(timezone).isoformat()
+
+
+def refresh_records(records):
+    """Updates the scrape date of records reused from a previous run."""
+    scrape_date = get_scrape_date()
+    for record in records:
+        record["scrape_date"] = scrape_date
+    return records
+
+
 def get_record_dict(
     uuid,
     ids,
@@ -56,5 +69,5 @@ def get_record_dict(
         "source_link": event_link,
         "tickets_link": tickets_link,
         "description": description,
-        "scrape_date": pd.to_datetime("now", utc=True).tz_convert(timezone).isoformat(),
+        "scrape_date": get_scrape_date(),
     }
@@ -0,0 +1,84 @@
+import pandas as pd
+
+# Columns of the private.events_future and private.events_scraped tables, in
+# the order of supabase/tables.sql, along with their PostgreSQL type.
+# schema_test.py checks that both stay in sync.
+EVENT_COLUMNS = {
+    "id": "character varying",
+    "workshop_type": "bigint",
+    "title": "text",
+    "description": "text",
+    "online": "boolean",
+    "training": "boolean",
+    "sold_out": "boolean",
+    "kids": "boolean",
+    "start_date": "timestamptz",
+    "end_date": "timestamptz",
+    "zip_code": "character varying",
+    "latitude": "character varying",
+    "longitude": "character varying",
+    "source_link": "character varying",
+    "tickets_link": "character varying",
+    "country_code": "character varying",
+    "department": "character varying",
+    "city": "character varying",
+    "address": "character varying",
+    "location_name": "character varying",
+    "full_location": "character varying",
+    "language_code": "character varying",
+    "scrape_date": "timestamp with time zone",
+    "most_recent": "boolean",
+}
+
+# Columns identifying an event
+EVENT_KEY = ("id", "workshop_type")
+
+
+def quoted_column_list(columns):
+    """Returns the SQL column list of columns, e.g. for INSERT or COPY."""
+    return ", ".join(f'"{column}"' for column in columns)
+
+
+BOOLEAN_VALUES = {True: True, False: False, "True": True, "False": False}
+
+
+def to_db_frame(df):
+    """
+    Converts the columns of an events DataFrame to the types of their table
+    column, with vectorised casts:
+    - boolean columns to the nullable boolean dtype, from booleans or their
+      string representation,
+    - bigint columns to the nullable Int64 dtype,
+    - timestamp columns to UTC datetimes, from ISO 8601 strings,
+    - text columns to strings.
+
+    Missing values (None, NaN, unparsable values) become NA instead of the
+    "None" and "nan" strings. Columns unknown to the schema are kept as is.
+    """
+    df = df.copy()
+    for column in df.columns.intersection(list(EVENT_COLUMNS)):
+        pg_type = EVENT_COLUMNS[column]
+        if pg_type == "boolean":
+            df[column] = df[column].map(BOOLEAN_VALUES).astype("boolean")
+        elif pg_type == "bigint":
+            df[column] = pd.to_numeric(df[column], errors="coerce").astype("Int64")
+        elif pg_type.startswith("timestamp"):
+            df[column] = pd.to_datetime(df[column], utc=True, format="ISO8601", errors="coerce")
+        else:
+            df[column] = df[column].astype("string")
+    return df
+
+
+def db_rows(df, columns):
+    """
+    Yields the rows of a DataFrame converted by to_db_frame as tuples of
+    native Python values, with None for missing values, as psycopg expects.
+    """
+    values = df[columns].astype(object)
+    values = values.where(values.notna(), None)
+    return values.itertuples(index=False, name=None)
+
+
+def pg_types(columns):
+    """Returns the PostgreSQL types of columns, e.g. for Copy.set_types()."""
+    return [EVENT_COLUMNS[column] for column in columns]
@@ -0,0 +1,71 @@
+import logging
+import re
+
+from pathlib import Path
+
+import pandas as pd
+
+from trouver_une_fresque_scraper.db.schema import EVENT_COLUMNS, db_rows, to_db_frame
+
+TABLES_SQL = Path(__file__).resolve().parents[3] / "supabase" / "tables.sql"
+
+
+def run_tables_sql_tests():
+    if not TABLES_SQL.exists():
+        logging.info(f"Skipping schema tests: {TABLES_SQL} not found")
+        return
+
+    sql = TABLES_SQL.read_text(encoding="utf-8")
+    match = re.search(r'create table "private"."events_future" \((?P<body>.*?)\n\);', sql, re.S)
+    if not match:
+        logging.error("Schema: events_future table not found in tables.sql")
+        return
+
+    columns = {}
+    for line in match.group("body").strip().splitlines():
+        column = re.match(r'\s*"(?P<name>\w+)" (?P<type>[\w ]+?)( default .*)?,?$', line)
+        columns[column.group("name")] = column.group("type")
+
+    if columns != EVENT_COLUMNS or list(columns) != list(EVENT_COLUMNS):
+        logging.error(
+            f"Schema: EVENT_COLUMNS doesn't match tables.sql\n"
+            f"EXPECTED: {columns}\nACTUAL:   {EVENT_COLUMNS}"
+        )
+
+
+def run_conversion_tests():
+    df = pd.DataFrame(
+        [
+            {
+                "id": "1",
+                "workshop_type": 300,
+                "online": "True",
+                "kids": False,
+                "latitude": 48.85,
+                "department": "01",
+                "start_date": "2026-11-03T18:30:00+01:00",
+            },
+            {
+                "id": "2",
+                "workshop_type": "301",
+                "online": None,
+                "kids": "False",
+                "latitude": float("nan"),
+                "department": None,
+                "start_date": None,
+            },
+        ]
+    )
+    columns = list(df.columns)
+    expected = [
+        ("1", 300, True, False, "48.85", "01", pd.Timestamp("2026-11-03T17:30:00Z")),
+        ("2", 301, None, False, None, None, None),
+    ]
+    rows = list(db_rows(to_db_frame(df), columns))
+    if rows != expected:
+        logging.error(f"Schema: unexpected conversion\nEXPECTED: {expected}\nACTUAL:   {rows}")
+
+
+def run_tests():
+    run_tables_sql_tests()
+    run_conversion_tests()
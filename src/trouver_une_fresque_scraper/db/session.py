@@ -0,0 +1,52 @@
+from contextlib import contextmanager
+
+from psycopg.conninfo import make_conninfo
+from psycopg_pool import ConnectionPool
+
+from trouver_une_fresque_scraper.utils.utils import get_config
+
+# Connections kept open by a pool, each unit of work holding one of them
+POOL_MIN_SIZE = 1
+POOL_MAX_SIZE = 4
+
+# Key of the advisory lock held by the units of work writing the events tables
+EVENTS_LOCK_KEY = 0x7475665F6574
+
+
+def get_conninfo():
+    """Returns the connection string of the database set in config.json."""
+    credentials = get_config()
+    return make_conninfo(
+        dbname=credentials["database"],
+        user=credentials["user"],
+        password=credentials["psw"],
+        host=credentials["host"],
+        port=credentials["port"],
+    )
+
+
+def create_pool(max_size=POOL_MAX_SIZE):
+    """
+    Returns a pool of connections to the database, opened when entering it
+    as a context manager and closed on exit.
+
+    Connections are reused from a push to the next, along with the
+    statements prepared on them.
+    """
+    return ConnectionPool(get_conninfo(), min_size=POOL_MIN_SIZE, max_size=max_size, open=False)
+
+
+@contextmanager
+def unit_of_work(pool):
+    """
+    Yields a connection of the pool in a transaction, committed when the block
+    exits or rolled back if it raises, so that the events tables are either
+    fully updated or left untouched.
+
+    Each unit of work replaces the snapshot of private.events_future: those
+    running concurrently are serialized with a transaction-level advisory
+    lock rather than interleaving their writes.
+    """
+    with pool.connection() as conn, conn.transaction():
+        conn.execute("SELECT pg_advisory_xact_lock(%s)", (EVENTS_LOCK_KEY,))
+        yield conn
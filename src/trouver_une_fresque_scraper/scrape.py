@@ -4,14 +4,16 @@ import logging
 import subprocess
 import sys
 import pandas as pd
-import psycopg
 
 from datetime import datetime
 from pathlib import Path
-from psycopg.conninfo import make_conninfo
 
 from trouver_une_fresque_scraper.apis import main as main_apis
+from trouver_une_fresque_scraper.db.etl import push
+from trouver_une_fresque_scraper.db.session import create_pool
 from trouver_une_fresque_scraper.scraper import main as main_scraper
+from trouver_une_fresque_scraper.utils.checkpoint import Checkpoint, latest_run_path
+from trouver_une_fresque_scraper.utils.location import log_geocode_cache_stats
 
 
 def configure_logging(log_file_path, error_log_file_path):
@@ -118,6 +120,42 @@ if __name__ == "__main__":
         default=False,
         help="run scraping in headless mode",
     )
+    parser.add_argument(
+        "--parallel",
+        action="store_true",
+        default=False,
+        help="run each platform scraper in its own worker process",
+    )
+    parser.add_argument(
+        "--max-workers",
+        type=int,
+        default=None,
+        help="maximum number of concurrent worker processes in parallel mode",
+    )
+    parser.add_argument(
+        "--page-workers",
+        type=int,
+        default=1,
+        help="number of pages processing event links concurrently in Playwright scrapers",
+    )
+    parser.add_argument(
+        "--page-backend",
+        choices=["threads", "async"],
+        default="threads",
+        help="run concurrent pages of the browser in threads (threads) or in one asyncio loop",
+    )
+    parser.add_argument(
+        "--api-workers",
+        type=int,
+        default=1,
+        help="number of API sources fetched concurrently",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        default=False,
+        help="resume the last run, only scraping the sources not completed yet",
+    )
     parser.add_argument(
         "--push-to-db",
         action="store_true",
@@ -153,11 +191,13 @@ if __name__ == "__main__":
     # Parse the sources
     scrapers, apis = get_sources(content)
 
-    # Build the results path for this run
-    dt = datetime.now()
-    scraping_time = dt.strftime("%Y%m%d_%H%M%S")
-    results_path = Path(f"results/{args.country}/{scraping_time}")
-    results_path.mkdir(parents=True, exist_ok=True)
+    # Build the results path for this run, or reuse the one of the run to resume
+    results_path = latest_run_path(args.country) if args.resume else None
+    if results_path is None:
+        dt = datetime.now()
+        scraping_time = dt.strftime("%Y%m%d_%H%M%S")
+        results_path = Path(f"results/{args.country}/{scraping_time}")
+        results_path.mkdir(parents=True, exist_ok=True)
     commit_hash = get_git_commit_hash()
     with open(f"{results_path}/commit_hash.txt", "w") as file:
         file.write(commit_hash)
@@ -168,10 +208,32 @@ if __name__ == "__main__":
     log_path = results_path / Path("log.txt")
     errors_path = results_path / Path("error_log.txt")
     configure_logging(log_path, errors_path)
+    if args.resume:
+        logging.info(f"Resuming run {results_path}")
+    checkpoint = Checkpoint(results_path)
 
     # Launch the scraper
-    df1 = main_scraper(scrapers, headless=args.headless)
-    df2 = main_apis(apis)
+    df1 = main_scraper(
+        scrapers,
+        headless=args.headless,
+        parallel=args.parallel,
+        max_workers=args.max_workers,
+        page_workers=args.page_workers,
+        page_backend=args.page_backend,
+        checkpoint=checkpoint,
+    )
+    df2 = main_apis(apis, max_workers=args.api_workers, checkpoint=checkpoint)
+    log_geocode_cache_stats()
+
+    failed_sources = checkpoint.failed_sources()
+    if failed_sources:
+        for failure in failed_sources.values():
+            logging.error(f"Failed source {failure['url']}: {failure['error']}")
+        logging.error(
+            f"{len(failed_sources)} sources failed, run again with --resume to retry them."
+        )
+        sys.exit(1)
+
     df_merged = pd.concat([df1, df2])
 
     dt = datetime.now()
@@ -182,16 +244,12 @@ if __name__ == "__main__":
     # Push the resulting json file to the database
     if args.push_to_db:
         logging.info("Pushing scraped results into db...")
-        credentials = get_config()
-        host = credentials["host"]
-        port = credentials["port"]
-        user = credentials["user"]
-        psw = credentials["psw"]
-        database = credentials["database"]
-
-        with psycopg.connect(
-            make_conninfo(dbname=database, user=user, password=psw, host=host, port=port)
-        ) as conn:
-            etl(conn, df_merged)
+        with create_pool(max_size=1) as pool:
+            if push(pool, df_merged):
+                # The run stays unfinished, so that --resume pushes its records again
+                logging.error("Pushing to db failed, nothing was written")
+                sys.exit(1)
 
         logging.info("Done")
+
+    checkpoint.finish()
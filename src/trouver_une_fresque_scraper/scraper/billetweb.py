@@ -12,11 +12,119 @@ from selenium.webdriver.support import expected_conditions as EC
 from trouver_une_fresque_scraper.db.records import get_record_dict
 from trouver_une_fresque_scraper.utils.date_and_time import get_dates
 from trouver_une_fresque_scraper.utils.errors import FreskError
+from trouver_une_fresque_scraper.utils.fingerprints import reuse_unchanged, store_results
 from trouver_une_fresque_scraper.utils.keywords import *
 from trouver_une_fresque_scraper.utils.language import detect_language_code
 from trouver_une_fresque_scraper.utils.location import get_address
 
 
+def extract_event_id(link):
+    match = re.search(r"/([^/]+?)&", link)
+    return match.group(1) if match else None
+
+
+def build_records(page, link, description, event_info):
+    """
+    Builds the records of the sessions of an event.
+
+    Args:
+        page: Source page configuration dict
+        link: URL of the event page
+        description: Description of the event
+        event_info: List of [title, event_time, full_location, sold_out,
+            ticket_link, uuid] for each session
+
+    Returns:
+        List of event records
+    """
+    records = []
+    for index, (title, event_time, full_location, sold_out, ticket_link, uuid) in enumerate(
+        event_info
+    ):
+        logging.info(f"\n-> Processing session {index+1}/{len(event_info)} {ticket_link} ...")
+        if is_gift_card(title):
+            logging.info("Rejecting record: gift card")
+            continue
+
+        ################################################################
+        # Date and time
+        ################################################################
+        try:
+            event_start_datetime, event_end_datetime = get_dates(event_time)
+        except Exception as e:
+            logging.info(f"Rejecting record: {e}")
+            continue
+
+        if event_end_datetime - event_start_datetime > timedelta(days=1):
+            logging.info(f"Rejecting record: event is too long: {event_time}")
+            continue
+
+        # Is it an online event?
+        online = is_online(title) or is_online(full_location)
+        title = title.replace(" Online event", "")  # Button added by billetweb
+
+        ################################################################
+        # Location data
+        ################################################################
+        location_name = address = city = department = ""
+        longitude = latitude = zip_code = country_code = ""
+        if not online:
+            try:
+                address_dict = get_address(full_location)
+                (
+                    location_name,
+                    address,
+                    city,
+                    department,
+                    zip_code,
+                    country_code,
+                    latitude,
+                    longitude,
+                ) = address_dict.values()
+            except FreskError as error:
+                logging.info(f"Rejecting record: {error}.")
+                continue
+
+        # Training?
+        training = is_training(title)
+
+        # Is it suited for kids?
+        kids = is_for_kids(title) and not training  # no trainings for kids
+
+        # Building final object
+        record = get_record_dict(
+            f"{page['id']}-{uuid}",
+            page["id"],
+            title,
+            event_start_datetime,
+            event_end_datetime,
+            full_location,
+            location_name,
+            address,
+            city,
+            department,
+            zip_code,
+            country_code,
+            latitude,
+            longitude,
+            page.get(
+                "language_code",
+                detect_language_code(title, description),
+            ),
+            online,
+            training,
+            sold_out,
+            kids,
+            link,
+            ticket_link,
+            description,
+        )
+        records.append(record)
+        logging.info(f"Successfully scraped:\n{json.dumps(record, indent=4)}")
+
+    return records
+
+
 def get_billetweb_data(sources, service, options):
     logging.info("Scraping data from www.billetweb.fr")
 
@@ -38,6 +146,10 @@ def get_billetweb_data(sources, service, options):
         wait.until(lambda driver: driver.execute_script("return document.readyState") == "complete")
         ele = driver.find_elements(By.CSS_SELECTOR, "a.naviguate")
         links = [e.get_attribute("href") for e in ele]
+        cards = {e.get_attribute("href"): e.find_element(By.XPATH, "..").text for e in ele}
+        links, reused_records = reuse_unchanged(page, links, cards, extract_event_id)
+        records += reused_records
+        first_new_record = len(records)
 
         for link in links:
             logging.info(f"------------------\nProcessing event {link}")
@@ -214,95 +326,11 @@ def get_billetweb_data(sources, service, options):
                     [main_title, event_time, main_full_location, sold_out, link, event_id]
                 )
 
-            ################################################################
-            # Session loop
-            ################################################################
-            for index, (title, event_time, full_location, sold_out, ticket_link, uuid) in enumerate(
-                event_info
-            ):
-                logging.info(
-                    f"\n-> Processing session {index+1}/{len(event_info)} {ticket_link} ..."
-                )
-                if is_gift_card(title):
-                    logging.info("Rejecting record: gift card")
-                    continue
-
-                ################################################################
-                # Date and time
-                ################################################################
-                try:
-                    event_start_datetime, event_end_datetime = get_dates(event_time)
-                except Exception as e:
-                    logging.info(f"Rejecting record: {e}")
-                    continue
+            records += build_records(page, link, description, event_info)
 
-                if event_end_datetime - event_start_datetime > timedelta(days=1):
-                    logging.info(f"Rejecting record: event is too long: {event_time}")
-                    continue
-
-                # Is it an online event?
-                online = is_online(title) or is_online(full_location)
-                title = title.replace(" Online event", "")  # Button added by billetweb
-
-                ################################################################
-                # Location data
-                ################################################################
-                location_name = address = city = department = longitude = latitude = zip_code = (
-                    country_code
-                ) = ""
-                if not online:
-                    try:
-                        address_dict = get_address(full_location)
-                        (
-                            location_name,
-                            address,
-                            city,
-                            department,
-                            zip_code,
-                            country_code,
-                            latitude,
-                            longitude,
-                        ) = address_dict.values()
-                    except FreskError as error:
-                        logging.info(f"Rejecting record: {error}.")
-                        continue
-
-                # Training?
-                training = is_training(title)
-
-                # Is it suited for kids?
-                kids = is_for_kids(title) and not training  # no trainings for kids
-
-                # Building final object
-                record = get_record_dict(
-                    f"{page['id']}-{uuid}",
-                    page["id"],
-                    title,
-                    event_start_datetime,
-                    event_end_datetime,
-                    full_location,
-                    location_name,
-                    address,
-                    city,
-                    department,
-                    zip_code,
-                    country_code,
-                    latitude,
-                    longitude,
-                    page.get(
-                        "language_code",
-                        detect_language_code(title, description),
-                    ),
-                    online,
-                    training,
-                    sold_out,
-                    kids,
-                    link,
-                    ticket_link,
-                    description,
-                )
-                records.append(record)
-                logging.info(f"Successfully scraped:\n{json.dumps(record, indent=4)}")
+        new_records = records[first_new_record:]
+        results = [[r for r in new_records if r["source_link"] == link] for link in links]
+        store_results(page, links, cards, extract_event_id, results)
 
     driver.quit()
 
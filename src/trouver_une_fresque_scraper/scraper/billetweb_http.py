@@ -0,0 +1,228 @@
+import logging
+import re
+
+import requests
+
+from concurrent.futures import ThreadPoolExecutor
+
+from trouver_une_fresque_scraper.scraper.billetweb import (
+    build_records,
+    extract_event_id,
+    get_billetweb_data,
+)
+from trouver_une_fresque_scraper.utils.fingerprints import reuse_unchanged, store_results
+from trouver_une_fresque_scraper.utils.html import fetch, first, get_text, has_class
+from trouver_une_fresque_scraper.utils.keywords import has_external_tickets
+
+# Number of session pages of a multi-time event fetched concurrently
+# (http_cache also limits the number of concurrent requests per host)
+SESSION_WORKERS = 4
+
+
+def shows_sold_out(tree):
+    # The presence of div.block indicates that the event is sold out,
+    # except if the text below is displayed.
+    empty = first(tree, f"//div[{has_class('block')}]")
+    return empty is not None and not has_external_tickets(get_text(empty))
+
+
+def parse_session(sessions_link, event_id, main_title, main_full_location):
+    """
+    Fetches the page of a session of a multi-time event.
+
+    Returns:
+        [title, event_time, full_location, sold_out, ticket_link, uuid]
+    """
+    session = fetch(sessions_link)
+    context_el = first(session, '//*[@id="context_title"]')
+    context = get_text(context_el) if context_el is not None else ""
+
+    # Parse title, dates, location
+    if match := re.match(
+        r"\s*((?P<title>.*) : )?(?P<event_time>.*)(\n\s*(?P<full_location>.*))?",
+        context,
+    ):
+        if not match.group("title"):
+            sub_title = main_title
+        elif "atelier" in match.group("title").lower():
+            sub_title = match.group("title")
+        else:
+            sub_title = main_title + " - " + match.group("title")
+
+        event_time = match.group("event_time")
+        sub_full_location = (
+            match.group("full_location") if match.group("full_location") else main_full_location
+        )
+    else:
+        raise ValueError(f"Unexpected session context: {context}")
+
+    # Is it full?
+    sold_out = shows_sold_out(session)
+
+    # Parse session id
+    session_id = re.search(r"&session=(\d+)", sessions_link).group(1)
+    uuid = f"{event_id}-{session_id}"
+
+    return [sub_title, event_time, sub_full_location, sold_out, sessions_link, uuid]
+
+
+def get_billetweb_http_data(sources, service=None, options=None):
+    """
+    Scrape Billetweb events over plain HTTP.
+
+    Billetweb pages are rendered server-side: the event listing, event pages
+    and shop iframes are fetched directly and parsed with lxml, the same way
+    as get_billetweb_data does in Firefox.
+
+    Args:
+        sources: List of source page configurations (dicts with 'id', 'url'
+            and 'iframe')
+        service: Selenium service, used as a fallback when the listing
+            iframe isn't part of the page HTML
+        options: Selenium options, used along with service
+
+    Returns:
+        List of event records
+    """
+    logging.info("Scraping data from www.billetweb.fr (HTTP)")
+
+    records = []
+
+    for page in sources:
+        logging.info(f"==================\nProcessing page {page}")
+        tree = fetch(page["url"])
+
+        iframe = first(tree, f'//iframe[@id="{page["iframe"]}"]')
+        if iframe is None or not iframe.get("src"):
+            if service is not None and options is not None:
+                logging.info("Listing iframe not found in HTML, falling back to the browser")
+                records += get_billetweb_data([page], service, options)
+            else:
+                logging.info("Rejecting record: iframe not found")
+            continue
+
+        listing = fetch(iframe.get("src"))
+        ele = listing.xpath(f"//a[{has_class('naviguate')}]")
+        links = [e.get("href") for e in ele]
+        cards = {e.get("href"): get_text(e.getparent()) for e in ele}
+        links, reused_records = reuse_unchanged(page, links, cards, extract_event_id)
+        records += reused_records
+        first_new_record = len(records)
+
+        for link in links:
+            logging.info(f"------------------\nProcessing event {link}")
+
+            # Useful for different workshops sharing same event link
+            if "filter" in page:
+                if page["filter"] not in link:
+                    logging.info(
+                        "Rejecting filter: expected filter keyword not present in current link"
+                    )
+                    continue
+
+            try:
+                event = fetch(link)
+            except requests.RequestException as e:
+                logging.info(f"Rejecting record: {e}")
+                continue
+
+            # Description, including the part shown by the "more info" button
+            description_el = first(event, '//*[@id="description"]')
+            if description_el is None:
+                logging.info("Rejecting record: no description")
+                continue
+            description = get_text(description_el, include_hidden=True)
+            if not description:
+                logging.info("Rejecting record: empty description")
+                continue
+
+            # Parse event id
+            event_id = extract_event_id(link)
+            if not event_id:
+                logging.info("Rejecting record: event_id not found")
+                continue
+
+            # Parse main title
+            title_el = first(
+                event,
+                f'//*[@id="event_title"]/div[{has_class("event_name")}]',
+                f'//*[@id="description_block"]/div[{has_class("event_title")}]'
+                f'/div[{has_class("event_name")}]',
+            )
+            main_title = get_text(title_el) if title_el is not None else ""
+
+            # Location data
+            location_el = first(
+                event,
+                f"//div[{has_class('location_summary')}]",
+                f'//*[@id="page_block_location"]/div[{has_class("location")}]'
+                f'/div[{has_class("location_info")}]/div[{has_class("address")}]/a',
+            )
+            main_full_location = get_text(location_el) if location_el is not None else ""
+
+            event_info = []
+
+            # Retrieve sessions if exist
+            shop = None
+            shop_iframe = first(event, '//*[@id="shop_block"]//iframe')
+            if shop_iframe is not None and shop_iframe.get("src"):
+                shop = fetch(shop_iframe.get("src"))
+            else:
+                logging.info("Shop iframe not found")
+
+            sessions_links = []  # No sessions for Mono-time
+            if shop is not None:
+                back_link = first(
+                    shop, f"//*[{has_class('back_header_link')} and {has_class('summarizable')}]"
+                )
+                sessions_page = shop
+                if back_link is not None:
+                    # Case of Multi-time with only one date, we arrive directly to Basket, so get back to sessions
+                    sessions_page = fetch(back_link.get("href"))
+                sessions_links = [
+                    s.get("href") for s in sessions_page.xpath(f"//a[{has_class('sesssion_href')}]")
+                ]
+
+            ################################################################
+            # Multi-time management
+            ################################################################
+            # Sessions are fetched concurrently, and kept in their original order
+            with ThreadPoolExecutor(max_workers=SESSION_WORKERS) as executor:
+                event_info += executor.map(
+                    lambda sessions_link: parse_session(
+                        sessions_link, event_id, main_title, main_full_location
+                    ),
+                    sessions_links,
+                )
+
+            ################################################################
+            # Mono-time management
+            ################################################################
+            if not sessions_links:
+                # Parse start and end dates
+                time_el = first(
+                    event,
+                    f'//*[@id="event_title"]/div[{has_class("event_start_time")}]'
+                    f'/span[{has_class("text")}]',
+                    f'//*[@id="description_block"]/div[{has_class("event_title")}]'
+                    f'/span/a/div[{has_class("event_start_time")}]',
+                )
+                if time_el is None:
+                    logging.info("Rejecting record: date not found")
+                    continue
+                event_time = get_text(time_el)
+
+                # Is it full?
+                sold_out = shop is not None and shows_sold_out(shop)
+
+                event_info.append(
+                    [main_title, event_time, main_full_location, sold_out, link, event_id]
+                )
+
+            records += build_records(page, link, description, event_info)
+
+        new_records = records[first_new_record:]
+        results = [[r for r in new_records if r["source_link"] == link] for link in links]
+        store_results(page, links, cards, extract_event_id, results)
+
+    return records
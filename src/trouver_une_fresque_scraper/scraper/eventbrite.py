@@ -18,7 +18,15 @@ from trouver_une_fresque_scraper.utils.keywords import (
 )
 from trouver_une_fresque_scraper.utils.language import detect_language_code
 from trouver_une_fresque_scraper.utils.location import get_address
-from trouver_une_fresque_scraper.utils.browser import managed_browser, DEFAULT_TIMEOUT
+from trouver_une_fresque_scraper.utils.browser import (
+    managed_browser,
+    wait_for,
+    wait_for_more,
+    wait_until_ready,
+    DEFAULT_TIMEOUT,
+)
+
+EVENT_CARDS_SELECTOR = "div.event-card"
 
 
 def extract_event_uuid(url: str) -> str | None:
@@ -30,8 +38,8 @@ def extract_event_uuid(url: str) -> str | None:
 def delete_cookies_overlay(page: Page):
     """Remove cookie consent overlay if present."""
     try:
-        # Wait a bit for the overlay to appear
-        page.wait_for_timeout(1000)
+        # The overlay is there once the page is ready
+        wait_until_ready(page)
 
         # The cookie consent is in a shadow DOM
         # Use evaluate to handle shadow DOM reliably
@@ -56,7 +64,6 @@ def delete_cookies_overlay(page: Page):
 
         if clicked:
             logging.debug("Cookie consent rejected")
-            page.wait_for_timeout(500)
         else:
             logging.debug("Cookie consent overlay not found or already dismissed")
     except Exception as e:
@@ -79,19 +86,19 @@ def scroll_to_bottom(page: Page):
             # Scroll down
             page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
 
-            # Wait for any dynamic content to load
-            page.wait_for_timeout(1000)
-
             # Try to click the next button
             next_button = page.locator(
                 "div.organizer-profile__section--content div.organizer-profile__show-more > button"
             ).first
-            if next_button.is_visible(timeout=2000):
+            if wait_for(next_button, name="show more button"):
+                card_count = page.locator(EVENT_CARDS_SELECTOR).count()
                 next_button.scroll_into_view_if_needed(timeout=5000)
                 next_button.click()
-                consecutive_failures = 0  # Reset on success
-                # Wait after clicking to let content load
-                page.wait_for_timeout(1500)
+                # Wait for the next batch of events to be rendered
+                if wait_for_more(page, EVENT_CARDS_SELECTOR, card_count):
+                    consecutive_failures = 0  # Reset on success
+                else:
+                    consecutive_failures += 1
             else:
                 more_content = False
                 logging.debug("Reached end of content - no more buttons")
@@ -152,7 +159,7 @@ def get_eventbrite_data(sources, service=None, options=None):
                 # page.wait_for_selector('div[data-testid="organizer-profile__future-events"]', timeout=DEFAULT_TIMEOUT)
 
                 # Extract links
-                event_cards = page.locator("div.event-card").all()
+                event_cards = page.locator(EVENT_CARDS_SELECTOR).all()
                 logging.info(f"Found {len(event_cards)} events")
 
                 links = []
@@ -554,8 +561,8 @@ def process_event_page(page: Page, link: str, source: dict):
                                     )
                                     continue
 
-                                # Wait for time slot content to stabilize
-                                page.wait_for_timeout(500)
+                                # Wait for time slot content to be rendered
+                                wait_for(time_slot_list.locator("li").first, name="time slots")
 
                             except Exception as e:
                                 logging.debug(f"Could not click date card: {e}")
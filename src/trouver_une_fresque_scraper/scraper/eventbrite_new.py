@@ -1,18 +1,37 @@
+import asyncio
 import json
 import logging
 import re
+import requests
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from urllib.parse import urlparse
 
+from playwright.async_api import Page as AsyncPage
 from playwright.sync_api import Page, TimeoutError as PlaywrightTimeoutError
 
 from trouver_une_fresque_scraper.db.records import get_record_dict
-from trouver_une_fresque_scraper.utils.browser import managed_browser, DEFAULT_TIMEOUT
+from trouver_une_fresque_scraper.utils.browser import (
+    run_browser,
+    process_links,
+    run_steps,
+    run_steps_async,
+    wait_for,
+    wait_for_more,
+    wait_for_steps,
+    wait_until_ready,
+    wait_until_ready_steps,
+    DEFAULT_TIMEOUT,
+)
 from trouver_une_fresque_scraper.utils.date_and_time import get_dates, DEFAULT_DURATION
 from trouver_une_fresque_scraper.utils.errors import (
     FreskError,
     FreskDateBadFormat,
 )
+from trouver_une_fresque_scraper.utils import http_cache
+from trouver_une_fresque_scraper.utils.fingerprints import reuse_unchanged, store_results
+from trouver_une_fresque_scraper.utils.html import html_to_text
 from trouver_une_fresque_scraper.utils.keywords import (
     is_plenary,
     is_online,
@@ -23,17 +42,27 @@ from trouver_une_fresque_scraper.utils.language import detect_language_code
 from trouver_une_fresque_scraper.utils.location import get_address
 
 
+# Event cards of the desktop grid (the mobile grid has the same cards)
+CARD_LINKS_SELECTOR = (
+    'div[class*="EventsBucket_gridDesktopContent"] a[class*="EventCardLink_event-card-link"]'
+)
+
+
 def extract_event_uuid(url: str) -> str | None:
     """Extract the event UUID from an Eventbrite URL (numeric ID at the end)."""
     match = re.search(r"-(\d+)(?:\?|$)", url)
     return match.group(1) if match else None
 
 
-def delete_cookies_overlay(page: Page):
-    """Remove Transcend cookie consent overlay if present (shadow DOM)."""
+def delete_cookies_overlay_steps(page):
+    """
+    Page steps removing the Transcend cookie consent overlay if present
+    (shadow DOM), see run_steps.
+
+    Called once the page is ready, so that the consent manager has been loaded.
+    """
     try:
-        page.wait_for_timeout(1000)
-        clicked = page.evaluate(
+        clicked = yield page.evaluate(
             """
             () => {
                 const manager = document.querySelector('#transcend-consent-manager');
@@ -53,21 +82,72 @@ def delete_cookies_overlay(page: Page):
         )
         if clicked:
             logging.debug("Cookie consent rejected")
-            page.wait_for_timeout(500)
         else:
             logging.debug("Cookie consent overlay not found or already dismissed")
     except Exception as e:
         logging.debug(f"Cookie consent overlay couldn't be handled: {e}")
 
 
-def collect_event_links(page: Page, source: dict) -> list[str]:
+def delete_cookies_overlay(page: Page):
+    """Remove Transcend cookie consent overlay if present, see delete_cookies_overlay_steps."""
+    run_steps(delete_cookies_overlay_steps(page))
+
+
+# Number of events per page requested from the organizer listing
+SHOWMORE_PAGE_SIZE = 50
+SHOWMORE_MAX_PAGES = 50
+
+
+def get_organizer_id(page_props: dict, source: dict) -> str | None:
+    organizer_id = (page_props.get("organizer") or {}).get("id")
+    if organizer_id:
+        return str(organizer_id)
+    match = re.search(r"-(\d+)/?(?:\?.*)?$", source["url"])
+    return match.group(1) if match else None
+
+
+def fetch_showmore_events(page: Page, organizer_id: str) -> list[dict]:
+    """
+    Fetch the upcoming events of an organizer from the paginated JSON
+    listing that the "See more" button loads.
+
+    Requests go through the page's context, so that they share its cookies.
+
+    Raises:
+        ValueError: If the listing can't be fetched or has an unexpected format
+    """
+    origin = "{0.scheme}://{0.netloc}".format(urlparse(page.url))
+    events = []
+    for page_number in range(1, SHOWMORE_MAX_PAGES + 1):
+        response = page.request.get(
+            f"{origin}/org/{organizer_id}/showmore/"
+            f"?page_size={SHOWMORE_PAGE_SIZE}&type=future&page={page_number}",
+            timeout=DEFAULT_TIMEOUT,
+        )
+        if not response.ok:
+            raise ValueError(f"Organizer listing returned status {response.status}")
+        data = response.json()["data"]
+        events += data["events"]
+        if not data.get("has_next_page"):
+            break
+    return events
+
+
+def collect_event_links(page: Page, source: dict) -> tuple[list[str], dict]:
     """
     Collect all event links from the organizer profile page.
 
-    Parses __NEXT_DATA__ for the first batch of events, then clicks the
-    "Voir plus" / "See more" button to load additional events from the DOM.
+    Parses __NEXT_DATA__ for the first batch of events, then requests the
+    organizer's paginated event listing for the others. Falls back to
+    clicking the "Voir plus" / "See more" button to load additional events
+    from the DOM.
+
+    Returns:
+        The event links, and their listing content by link (__NEXT_DATA__
+        event payload, or card text for events loaded from the DOM)
     """
     all_links = []
+    contents = {}
 
     # Phase 1: Extract links from __NEXT_DATA__ JSON
     try:
@@ -85,6 +165,7 @@ def collect_event_links(page: Page, source: dict) -> list[str]:
             url = event.get("url")
             if url:
                 all_links.append(url)
+                contents[url] = event
 
         logging.info(
             f"Extracted {len(all_links)} links from __NEXT_DATA__ "
@@ -94,7 +175,25 @@ def collect_event_links(page: Page, source: dict) -> list[str]:
         logging.warning(f"Could not parse __NEXT_DATA__: {e}")
         has_more = False
 
-    # Phase 2: Click "Voir plus" / "See more" to load remaining events
+    # Phase 2: Request the remaining events from the organizer listing
+    organizer_id = get_organizer_id(page_props, source) if has_more else None
+    if organizer_id:
+        try:
+            events = fetch_showmore_events(page, organizer_id)
+            existing_ids = {extract_event_uuid(link) for link in all_links}
+            for event in events:
+                url = event.get("url")
+                eid = extract_event_uuid(url) if url else None
+                if eid and eid not in existing_ids:
+                    all_links.append(url)
+                    contents[url] = event
+                    existing_ids.add(eid)
+            logging.info(f"Total links collected from the organizer listing: {len(all_links)}")
+            has_more = False
+        except Exception as e:
+            logging.warning(f"Could not fetch the organizer listing, clicking 'See more': {e}")
+
+    # Phase 3 (fallback): Click "Voir plus" / "See more" to load remaining events
     if has_more:
         consecutive_failures = 0
         max_failures = 3
@@ -102,7 +201,6 @@ def collect_event_links(page: Page, source: dict) -> list[str]:
         while consecutive_failures < max_failures:
             try:
                 page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-                page.wait_for_timeout(1000)
 
                 # The new template uses a ShowMoreButton wrapper
                 show_more_button = page.locator(
@@ -111,12 +209,15 @@ def collect_event_links(page: Page, source: dict) -> list[str]:
                     'button:has-text("See more")'
                 ).first
 
-                if show_more_button.is_visible(timeout=3000):
+                if wait_for(show_more_button, name="show more button"):
+                    card_count = page.locator(CARD_LINKS_SELECTOR).count()
                     show_more_button.scroll_into_view_if_needed()
-                    page.wait_for_timeout(500)
                     show_more_button.click()
-                    consecutive_failures = 0
-                    page.wait_for_timeout(2000)
+                    # Proceed as soon as the next batch of cards is rendered
+                    if wait_for_more(page, CARD_LINKS_SELECTOR, card_count):
+                        consecutive_failures = 0
+                    else:
+                        consecutive_failures += 1
                 else:
                     logging.debug("No more 'Show More' button visible")
                     break
@@ -134,12 +235,9 @@ def collect_event_links(page: Page, source: dict) -> list[str]:
 
         # Collect newly loaded event links from the DOM
         # Use desktop grid cards to avoid duplicates (mobile grid has same cards)
-        card_links = page.locator(
-            'div[class*="EventsBucket_gridDesktopContent"] '
-            'a[class*="EventCardLink_event-card-link"]'
-        ).all()
+        card_links = page.locator(CARD_LINKS_SELECTOR).all()
 
-        dom_links = set()
+        dom_links = {}
         for link_el in card_links:
             href = link_el.get_attribute("href")
             if href:
@@ -148,7 +246,7 @@ def collect_event_links(page: Page, source: dict) -> list[str]:
                     # Construct absolute URL from the current page's origin
                     origin = page.evaluate("window.location.origin")
                     href = f"{origin}{href}"
-                dom_links.add(href)
+                dom_links[href] = link_el.inner_text()
 
         # Merge with __NEXT_DATA__ links (deduplicate by event ID)
         existing_ids = set()
@@ -157,41 +255,43 @@ def collect_event_links(page: Page, source: dict) -> list[str]:
             if eid:
                 existing_ids.add(eid)
 
-        for link in dom_links:
+        for link, card_text in dom_links.items():
             eid = extract_event_uuid(link)
             if eid and eid not in existing_ids:
                 # Strip tracking query params
                 clean_link = link.split("?")[0]
                 all_links.append(clean_link)
+                contents[clean_link] = card_text
                 existing_ids.add(eid)
 
     logging.info(f"Total links collected: {len(all_links)}")
-    return all_links
+    return all_links, contents
 
 
 # ==================== Main Entry Point ====================
 
 
-def get_eventbrite_new_data(sources, service=None, options=None):
+def get_eventbrite_new_data(
+    sources, service=None, options=None, page_workers=1, page_backend="threads", browser=None
+):
     """
     Scrape Eventbrite events using Playwright (new template).
 
     Args:
         sources: List of source page configurations (dicts with 'id' and 'url')
         service: Unused (kept for compatibility)
-        options: Unused (kept for compatibility)
+        options: Selenium options, only read for headless mode without a browser
+        page_workers: Number of pages processing event links concurrently
+        page_backend: "threads" (one thread per page) or "async" (one asyncio loop)
+        browser: BrowserManager shared by the scrapers of the run, or None to
+            start a browser for this scraper alone
 
     Returns:
         List of event records
     """
     logging.info("Scraping data from eventbrite (new template)")
 
-    headless = False
-    if options and hasattr(options, "arguments") and len(options.arguments) > 0:
-        headless = "-headless" in options.arguments
-
-    with managed_browser(headless=headless) as browser:
-        context = browser.new_context()
+    with run_browser(browser, options) as browser, browser.context("eventbrite") as context:
         page = context.new_page()
         records = []
 
@@ -199,16 +299,41 @@ def get_eventbrite_new_data(sources, service=None, options=None):
             try:
                 logging.info(f"==================\nProcessing page {source}")
                 page.goto(source["url"], wait_until="domcontentloaded")
-                page.wait_for_timeout(3000)
+                wait_until_ready(page, "script#__NEXT_DATA__", state="attached")
 
                 delete_cookies_overlay(page)
 
                 # Phase 1: Collect all event links
-                links = collect_event_links(page, source)
-
-                # Phase 2: Process each event page
-                for link in links:
-                    event_records = process_event_page(page, link, source)
+                links, contents = collect_event_links(page, source)
+                links_to_visit, reused_records = reuse_unchanged(
+                    source, links, contents, extract_event_uuid
+                )
+                records += reused_records
+
+                # Phase 2: Build records from the event HTML when possible,
+                # and process the remaining event pages in the browser
+                fast_results = fetch_events_fast(links_to_visit, source)
+                browser_links = [
+                    link for link, result in zip(links_to_visit, fast_results) if result is None
+                ]
+                browser_results = process_links(
+                    page,
+                    browser_links,
+                    source,
+                    process_event_page,
+                    process_event_page_async,
+                    browser=browser,
+                    page_workers=page_workers,
+                    page_backend=page_backend,
+                    platform="eventbrite",
+                )
+                browser_results = iter(browser_results)
+                results = [
+                    result if result is not None else next(browser_results)
+                    for result in fast_results
+                ]
+                store_results(source, links_to_visit, contents, extract_event_uuid, results)
+                for event_records in results:
                     records.extend(event_records)
 
             except Exception as e:
@@ -218,8 +343,6 @@ def get_eventbrite_new_data(sources, service=None, options=None):
                 )
                 raise
 
-        context.close()
-
     return records
 
 
@@ -228,362 +351,586 @@ def parse_iso_datetime(iso_str: str) -> datetime:
     return datetime.fromisoformat(iso_str)
 
 
-def process_event_page(page: Page, link: str, source: dict) -> list[dict]:
+def normalize_location(full_location: str) -> str:
+    full_location = full_location.replace("\n", ", ")
+    full_location = " ".join(full_location.split())
+    full_location = re.sub(r",\s*,", ",", full_location)
+    return full_location.strip(", ")
+
+
+# ==================== HTTP Fast Path ====================
+
+# Number of event pages fetched concurrently over HTTP
+FAST_PATH_WORKERS = 4
+
+FAST_PATH_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
+        "(KHTML, like Gecko) Chrome/124.0 Safari/537.36"
+    ),
+    "Accept-Language": "en-US,en;q=0.9",
+}
+
+NEXT_DATA_RE = re.compile(
+    r'<script id="__NEXT_DATA__" type="application/json"[^>]*>(.*?)</script>', re.DOTALL
+)
+
+
+def get_venue_location(next_data_ctx: dict) -> str:
+    """Builds the full location string from the venue of __NEXT_DATA__."""
+    basic_info = next_data_ctx.get("basicInfo", {})
+    venue = basic_info.get("venue") or next_data_ctx.get("venue") or {}
+    address = venue.get("address") or {}
+    lines = address.get("localizedAddressDisplayLines") or [
+        address.get("address1"),
+        address.get("address2"),
+        " ".join(filter(None, [address.get("postalCode"), address.get("city")])),
+    ]
+    return normalize_location(", ".join(filter(None, [venue.get("name")] + list(lines))))
+
+
+# ==================== Event Data ====================
+
+SERIES_DATE_TEXT_RE = re.compile(
+    r"(?i)^\s*(multiple dates|plusieurs dates|dates multiples|mehrere termine)\s*$"
+)
+
+
+def parse_next_data_context(raw_json: str) -> dict:
+    """Returns the event context of the __NEXT_DATA__ JSON of an event page."""
+    next_data = json.loads(raw_json)
+    return next_data.get("props", {}).get("pageProps", {}).get("context", {})
+
+
+def get_rejection_reason(next_data_ctx: dict | None) -> str | None:
+    """Returns why an event is rejected from its __NEXT_DATA__ status, or None."""
+    if not next_data_ctx:
+        return None
+    basic_info = next_data_ctx.get("basicInfo", {})
+    status = basic_info.get("status", "")
+    if status == "cancelled" or basic_info.get("isCancelled", False):
+        return "event cancelled"
+    if status == "completed":
+        return "event completed"
+    sales_status = next_data_ctx.get("salesStatus", {}).get("salesStatus", "")
+    if sales_status in ("sold_out", "sales_ended"):
+        # Eventbrite hides relevant info for sold out events
+        return "sold out"
+    return None
+
+
+def get_next_data_description(next_data_ctx: dict | None) -> str:
     """
-    Process a single Eventbrite event page (new template).
+    Returns the description of an event from its __NEXT_DATA__, or "".
 
-    Uses DOM selectors with data-testid attributes for stability.
-    Falls back to __NEXT_DATA__ JSON for structured data when needed.
+    The full description is the text of the structured content modules, the
+    same as the overview section of the page (see read_event_page). The
+    summary is only a short teaser, used when there is no structured content.
+    """
+    if not next_data_ctx:
+        return ""
+    modules = next_data_ctx.get("structuredContent", {}).get("modules", [])
+    description = html_to_text("".join(module.get("text") or "" for module in modules))
+    return description or next_data_ctx.get("basicInfo", {}).get("summary", "")
+
+
+def get_next_data_dates(next_data_ctx: dict | None) -> tuple:
+    """Returns the start and end datetimes of __NEXT_DATA__, each None if missing."""
+    basic_info = (next_data_ctx or {}).get("basicInfo", {})
+    dates = []
+    for key in ("startDate", "endDate"):
+        local = (basic_info.get(key) or {}).get("local")
+        try:
+            dates.append(parse_iso_datetime(local) if local else None)
+        except ValueError:
+            dates.append(None)
+    return tuple(dates)
+
+
+def get_single_event_info(link: str, next_data_ctx: dict | None, date_text: str | None) -> list:
+    """
+    Returns the date of a single event, from __NEXT_DATA__ (most reliable) or
+    else from the date text displayed on the page.
+
+    Returns:
+        List with one [uuid, start_datetime, end_datetime, link] list, or an
+        empty list if the event is rejected
+    """
+    event_start_datetime, event_end_datetime = get_next_data_dates(next_data_ctx)
+    if not event_start_datetime:
+        if date_text is None:
+            logging.info("Rejecting record: date not found")
+            return []
+        try:
+            event_start_datetime, event_end_datetime = get_dates(date_text)
+        except FreskDateBadFormat as error:
+            logging.info(f"Rejecting record: {error}")
+            return []
+
+    if not event_end_datetime:
+        event_end_datetime = event_start_datetime + timedelta(hours=DEFAULT_DURATION)
+
+    uuid = extract_event_uuid(link)
+    if not uuid:
+        logging.info("Rejecting record: UUID not found")
+        return []
+    return [[uuid, event_start_datetime, event_end_datetime, link]]
+
+
+def get_series_session(base_uuid: str, date_text: str, link: str) -> list | None:
+    """
+    Returns the [uuid, start_datetime, end_datetime, link] list of a session
+    of a series, from its date text, or None if it can't be parsed.
+    """
+    try:
+        event_start_datetime, event_end_datetime = get_dates(date_text)
+    except FreskDateBadFormat as error:
+        logging.warning(f"Failed to parse date '{date_text}': {error}")
+        return None
+    unique_suffix = hash(date_text) % 10000
+    return [f"{base_uuid}-{unique_suffix}", event_start_datetime, event_end_datetime, link]
+
+
+def build_event_records(link: str, source: dict, fields: dict, event_info: list) -> list[dict]:
+    """
+    Builds the records of the dates of an Eventbrite event.
 
     Args:
-        page: Playwright Page instance
         link: URL of the event page
         source: Source page configuration dict
+        fields: Dict with the title, description, online and full_location
+            of the event
+        event_info: List of [uuid, start_datetime, end_datetime, link] lists
 
     Returns:
-        List of event records (can be multiple for series/collection events)
+        List of event records
+
+    Raises:
+        FreskError: the location of an in-person event can't be geocoded
     """
-    logging.info(f"\n-> Processing {link} ...")
+    title = fields["title"]
+    description = fields["description"]
+    online = fields["online"]
+
+    ################################################################
+    # Location data
+    ################################################################
+    full_location = ""
+    location_name = ""
+    address = ""
+    city = ""
+    department = ""
+    longitude = ""
+    latitude = ""
+    zip_code = ""
+    country_code = ""
+
+    if not online:
+        full_location = normalize_location(fields["full_location"])
+        (
+            location_name,
+            address,
+            city,
+            department,
+            zip_code,
+            country_code,
+            latitude,
+            longitude,
+        ) = get_address(full_location).values()
+
+    ################################################################
+    # Build records for all date sessions
+    ################################################################
     records = []
+    for uuid, event_start_datetime, event_end_datetime, event_link in event_info:
+        record = get_record_dict(
+            f"{source['id']}-{uuid}",
+            source["id"],
+            title,
+            event_start_datetime,
+            event_end_datetime,
+            full_location,
+            location_name,
+            address,
+            city,
+            department,
+            zip_code,
+            country_code,
+            latitude,
+            longitude,
+            source.get(
+                "language_code",
+                detect_language_code(title, description),
+            ),
+            online,
+            is_training(title),
+            False,
+            is_for_kids(title),
+            event_link,
+            event_link,
+            description,
+        )
+        records.append(record)
+        logging.info(f"Successfully scraped {event_link}\n{json.dumps(record, indent=4)}")
+    return records
 
+
+def read_event_html(link: str, html: str) -> tuple[dict, list] | None:
+    """
+    Reads the HTML of an Eventbrite event page, from its __NEXT_DATA__ JSON,
+    see build_event_records.
+
+    Returns:
+        The fields and the dates of the event (no dates if it is rejected),
+        or None if the event page has to be processed in the browser: series
+        events, missing fields or unexpected page contents.
+    """
     try:
-        page.goto(link, wait_until="domcontentloaded")
-        page.wait_for_timeout(3000)
-        delete_cookies_overlay(page)
+        match = NEXT_DATA_RE.search(html)
+        if not match:
+            return None
+        next_data_ctx = parse_next_data_context(match.group(1))
+        basic_info = next_data_ctx["basicInfo"]
+    except (ValueError, KeyError, TypeError, AttributeError) as e:
+        logging.debug(f"Fast path unavailable for {link}: {e}")
+        return None
+
+    logging.info(f"\n-> Processing {link} (fast path) ...")
+
+    reason = get_rejection_reason(next_data_ctx)
+    if reason:
+        logging.info(f"Rejecting record: {reason}")
+        return {}, []
+
+    # Series have their dates in the collection modal only
+    if basic_info.get("isSeries", False):
+        return None
+
+    title = basic_info.get("name", "")
+    if not title:
+        return None
+    if is_plenary(title):
+        logging.info("Rejecting record: plenary")
+        return {}, []
+
+    description = get_next_data_description(next_data_ctx)
+    if not description:
+        return None
+
+    if not get_next_data_dates(next_data_ctx)[0]:
+        return None
+    event_info = get_single_event_info(link, next_data_ctx, None)
+    if not event_info:
+        return {}, []
+
+    online = is_online(title) or basic_info.get("isOnline", False)
+    full_location = "" if online else get_venue_location(next_data_ctx)
+    if not online and not full_location:
+        return None
+
+    fields = {
+        "title": title,
+        "description": description,
+        "online": online,
+        "full_location": full_location,
+    }
+    return fields, event_info
+
+
+def fetch_event_fast(link: str, source: dict) -> list[dict] | None:
+    """
+    Build the records of an event from the __NEXT_DATA__ JSON of its HTML,
+    fetched without a browser.
 
-        ################################################################
-        # Extract __NEXT_DATA__ for structured fallback data
-        ################################################################
-        next_data_ctx = None
-        try:
-            next_data_el = page.locator("script#__NEXT_DATA__")
-            next_data_el.wait_for(state="attached", timeout=5000)
-            raw_json = next_data_el.text_content()
-            next_data = json.loads(raw_json)
-            next_data_ctx = next_data.get("props", {}).get("pageProps", {}).get("context", {})
-        except Exception as e:
-            logging.debug(f"Could not parse __NEXT_DATA__ on event page: {e}")
-
-        ################################################################
-        # Check event status (cancelled, completed)
-        ################################################################
-        if next_data_ctx:
-            basic_info = next_data_ctx.get("basicInfo", {})
-            status = basic_info.get("status", "")
-            is_cancelled = (
-                basic_info.get("isCancelled", False) if "isCancelled" in basic_info else False
-            )
-
-            if status == "cancelled" or is_cancelled:
-                logging.info("Rejecting record: event cancelled")
-                return records
-            if status == "completed":
-                logging.info("Rejecting record: event completed")
-                return records
-
-        ################################################################
-        # Is it sold out?
-        ################################################################
-        sold_out = False
-        if next_data_ctx:
-            sales_status = next_data_ctx.get("salesStatus", {})
-            sales_status_value = sales_status.get("salesStatus", "")
-            if sales_status_value in ("sold_out", "sales_ended"):
-                sold_out = True
-
-        if sold_out:
-            # Eventbrite hides relevant info for sold out events
-            logging.info("Rejecting record: sold out")
-            return records
-
-        ################################################################
-        # Parse event title
-        ################################################################
-        title_el = page.locator('[data-testid="event-title"]').first
-        try:
-            title_el.wait_for(state="visible", timeout=DEFAULT_TIMEOUT)
-            title = title_el.text_content()
-        except PlaywrightTimeoutError:
-            # Fallback to __NEXT_DATA__
-            if next_data_ctx:
-                title = next_data_ctx.get("basicInfo", {}).get("name", "")
-            else:
-                logging.info("Rejecting record: title not found")
-                return records
-
-        if is_plenary(title):
-            logging.info("Rejecting record: plenary")
-            return records
-
-        ################################################################
-        # Is it an online event?
-        ################################################################
-        online = is_online(title)
-        if not online:
-            # Check from __NEXT_DATA__
-            if next_data_ctx:
-                online = next_data_ctx.get("basicInfo", {}).get("isOnline", False)
-            # Also check the venue element on the page
-            if not online:
-                venue_el = page.locator('[data-testid="event-venue"]').first
-                try:
-                    if venue_el.is_visible(timeout=2000):
-                        venue_text = venue_el.text_content()
-                        online = is_online(venue_text)
-                except PlaywrightTimeoutError:
-                    pass
-
-        ################################################################
-        # Location data
-        ################################################################
-        full_location = ""
-        location_name = ""
-        address = ""
-        city = ""
-        department = ""
-        longitude = ""
-        latitude = ""
-        zip_code = ""
-        country_code = ""
-
-        if not online:
-            # Try to get location from the DOM (full address section)
-            location_section = page.locator('[data-testid="section-wrapper-location"]').first
-            try:
-                location_section.wait_for(state="visible", timeout=DEFAULT_TIMEOUT)
+    Event pages change on every request, so they are fetched on the shared
+    session rather than through the HTTP cache.
 
-                # Get venue name
-                venue_name_el = location_section.locator("address h3").first
-                try:
-                    if venue_name_el.is_visible(timeout=2000):
-                        location_name = venue_name_el.text_content().strip()
-                except PlaywrightTimeoutError:
-                    pass
-
-                # Get address lines
-                address_lines_els = location_section.locator(
-                    'address p[class*="Address_description"]'
-                ).all()
-                address_parts = []
-                for el in address_lines_els:
-                    text = el.text_content().strip()
-                    if text:
-                        address_parts.append(text)
-                full_location = ", ".join(filter(None, [location_name] + address_parts))
+    Returns:
+        List of event records (empty if the event is rejected), or None if
+        the event page has to be processed in the browser (see
+        read_event_html)
+    """
+    try:
+        response = http_cache.session.get(
+            link, headers=FAST_PATH_HEADERS, timeout=http_cache.DEFAULT_TIMEOUT
+        )
+    except requests.RequestException as e:
+        logging.debug(f"Fast path unavailable for {link}: {e}")
+        return None
+    if response.status_code != 200:
+        return None
+
+    event = read_event_html(link, response.text)
+    if event is None:
+        return None
+    fields, event_info = event
+    if not event_info:
+        return []
+    try:
+        return build_event_records(link, source, fields, event_info)
+    except FreskError as error:
+        # The address displayed on the page may be more complete
+        logging.info(f"Fast path failed for {link}: {error}")
+        return None
 
-            except PlaywrightTimeoutError:
-                # Fallback: use compact venue text from hero area
-                venue_el = page.locator('[data-testid="event-venue"]').first
-                try:
-                    if venue_el.is_visible(timeout=2000):
-                        full_location = venue_el.inner_text().strip()
-                except PlaywrightTimeoutError:
-                    pass
 
-            if not full_location:
-                logging.info("Rejecting record: location not found for in-person event")
-                return records
+def fetch_events_fast(links: list[str], source: dict) -> list:
+    """
+    Run the fast path on event links, concurrently.
+
+    Returns:
+        The results of fetch_event_fast, in the same order as links
+    """
+    with ThreadPoolExecutor(max_workers=FAST_PATH_WORKERS) as executor:
+        results = list(executor.map(lambda link: fetch_event_fast(link, source), links))
+    fallbacks = sum(result is None for result in results)
+    logging.info(
+        f"Fast path: {len(links) - fallbacks} events handled, " f"{fallbacks} left to the browser"
+    )
+    return results
 
-            # Normalize the location string
-            full_location = full_location.replace("\n", ", ")
-            full_location = " ".join(full_location.split())
-            full_location = re.sub(r",\s*,", ",", full_location)
-            full_location = full_location.strip(", ")
 
-            try:
-                address_dict = get_address(full_location)
-                (
-                    location_name,
-                    address,
-                    city,
-                    department,
-                    zip_code,
-                    country_code,
-                    latitude,
-                    longitude,
-                ) = address_dict.values()
-            except FreskError as error:
-                logging.info(f"Rejecting record: {error}.")
-                return records
-
-        ################################################################
-        # Description
-        ################################################################
-        description = ""
-        description_el = page.locator('[data-testid="section-wrapper-overview"]').first
+def read_event_page_steps(page, link: str):
+    """
+    Page steps reading an Eventbrite event page (new template), see
+    build_event_records and run_steps.
+
+    Uses DOM selectors with data-testid attributes for stability.
+    Falls back to __NEXT_DATA__ JSON for structured data when needed.
+
+    Args:
+        page: Playwright Page instance (sync or async), on the event page
+        link: URL of the event page
+
+    Returns:
+        The fields and the dates of the event, or None if it is rejected
+    """
+    yield from wait_until_ready_steps(page, "script#__NEXT_DATA__", state="attached")
+    yield from delete_cookies_overlay_steps(page)
+
+    next_data_ctx = None
+    try:
+        next_data_el = page.locator("script#__NEXT_DATA__")
+        yield next_data_el.wait_for(state="attached", timeout=5000)
+        next_data_ctx = parse_next_data_context((yield next_data_el.text_content()))
+    except Exception as e:
+        logging.debug(f"Could not parse __NEXT_DATA__ on event page: {e}")
+
+    reason = get_rejection_reason(next_data_ctx)
+    if reason:
+        logging.info(f"Rejecting record: {reason}")
+        return None
+
+    ################################################################
+    # Parse event title
+    ################################################################
+    title_el = page.locator('[data-testid="event-title"]').first
+    try:
+        yield title_el.wait_for(state="visible", timeout=DEFAULT_TIMEOUT)
+        title = yield title_el.text_content()
+    except PlaywrightTimeoutError:
+        if not next_data_ctx:
+            logging.info("Rejecting record: title not found")
+            return None
+        title = next_data_ctx.get("basicInfo", {}).get("name", "")
+
+    if is_plenary(title):
+        logging.info("Rejecting record: plenary")
+        return None
+
+    ################################################################
+    # Is it an online event?
+    ################################################################
+    online = is_online(title) or (next_data_ctx or {}).get("basicInfo", {}).get("isOnline", False)
+    venue_el = page.locator('[data-testid="event-venue"]').first
+    if not online:
+        try:
+            if (yield venue_el.is_visible(timeout=2000)):
+                online = is_online((yield venue_el.text_content()))
+        except PlaywrightTimeoutError:
+            pass
+
+    ################################################################
+    # Location data
+    ################################################################
+    full_location = ""
+    if not online:
+        # Try to get location from the DOM (full address section)
+        location_section = page.locator('[data-testid="section-wrapper-location"]').first
         try:
-            description_el.wait_for(state="visible", timeout=DEFAULT_TIMEOUT)
-            # Click "read more" if present to expand the full description
-            read_more_btn = description_el.locator('button[class*="Overview_readMore"]').first
+            yield location_section.wait_for(state="visible", timeout=DEFAULT_TIMEOUT)
+            location_name = ""
+            venue_name_el = location_section.locator("address h3").first
             try:
-                if read_more_btn.is_visible(timeout=1000):
-                    read_more_btn.click()
-                    page.wait_for_timeout(500)
+                if (yield venue_name_el.is_visible(timeout=2000)):
+                    location_name = (yield venue_name_el.text_content()).strip()
             except PlaywrightTimeoutError:
                 pass
-            summary_el = description_el.locator('div[class*="Overview_summary"]').first
-            description = summary_el.text_content()
+            address_parts = [
+                text.strip()
+                for text in (
+                    yield location_section.locator(
+                        'address p[class*="Address_description"]'
+                    ).all_text_contents()
+                )
+            ]
+            full_location = ", ".join(filter(None, [location_name] + address_parts))
         except PlaywrightTimeoutError:
-            # Fallback to __NEXT_DATA__
-            if next_data_ctx:
-                description = next_data_ctx.get("basicInfo", {}).get("summary", "")
-                if not description:
-                    modules = next_data_ctx.get("structuredContent", {}).get("modules", [])
-                    if modules:
-                        # Strip HTML tags from the structured content
-                        html_desc = modules[0].get("text", "")
-                        description = re.sub(r"<[^>]+>", "", html_desc)
-
-        if not description:
-            logging.info("Rejecting record: description not found")
-            return records
-
-        ################################################################
-        # Training?
-        ################################################################
-        training = is_training(title)
-
-        ################################################################
-        # Is it suited for kids?
-        ################################################################
-        kids = is_for_kids(title)
-
-        ################################################################
-        # Determine if this is a series (multiple dates) or single event
-        ################################################################
-        is_series = False
-        if next_data_ctx:
-            basic_info = next_data_ctx.get("basicInfo", {})
-            is_series = basic_info.get("isSeries", False)
-
-        if not is_series:
-            # Also check the date text on the page
-            date_el = page.locator('[data-testid="event-datetime"]').first
+            # Fallback: use compact venue text from hero area
             try:
-                date_el.wait_for(state="visible", timeout=DEFAULT_TIMEOUT)
-                date_text = date_el.text_content().strip()
-                is_series = bool(
-                    re.match(
-                        r"(?i)^\s*(multiple dates|plusieurs dates|dates multiples|mehrere termine)\s*$",
-                        date_text,
-                    )
-                )
+                if (yield venue_el.is_visible(timeout=2000)):
+                    full_location = (yield venue_el.inner_text()).strip()
             except PlaywrightTimeoutError:
                 pass
 
-        event_info = []
+        if not full_location:
+            logging.info("Rejecting record: location not found for in-person event")
+            return None
 
-        if is_series:
-            ################################################################
-            # Series event: extract dates from the collection modal
-            ################################################################
-            event_info = extract_series_dates(page, link, next_data_ctx)
-        else:
-            ################################################################
-            # Single event: parse the date from the page
-            ################################################################
-            event_start_datetime = None
-            event_end_datetime = None
-
-            # Try parsing from __NEXT_DATA__ first (most reliable)
-            if next_data_ctx:
-                basic_info = next_data_ctx.get("basicInfo", {})
-                start_date_info = basic_info.get("startDate", {})
-                end_date_info = basic_info.get("endDate", {})
-                start_local = start_date_info.get("local")
-                end_local = end_date_info.get("local")
-
-                if start_local:
-                    try:
-                        event_start_datetime = parse_iso_datetime(start_local)
-                    except ValueError:
-                        pass
-                if end_local:
-                    try:
-                        event_end_datetime = parse_iso_datetime(end_local)
-                    except ValueError:
-                        pass
+    ################################################################
+    # Description
+    ################################################################
+    description = ""
+    description_el = page.locator('[data-testid="section-wrapper-overview"]').first
+    try:
+        yield description_el.wait_for(state="visible", timeout=DEFAULT_TIMEOUT)
+        # Click "read more" if present to expand the full description
+        read_more_btn = description_el.locator('button[class*="Overview_readMore"]').first
+        try:
+            if (yield read_more_btn.is_visible()):
+                yield read_more_btn.click()
+                yield read_more_btn.wait_for(state="hidden", timeout=1000)
+        except PlaywrightTimeoutError:
+            pass
+        description = html_to_text(
+            (yield description_el.locator('div[class*="Overview_summary"]').first.inner_html())
+        )
+    except PlaywrightTimeoutError:
+        description = get_next_data_description(next_data_ctx)
+
+    if not description:
+        logging.info("Rejecting record: description not found")
+        return None
+
+    ################################################################
+    # Determine if this is a series (multiple dates) or single event
+    ################################################################
+    is_series = (next_data_ctx or {}).get("basicInfo", {}).get("isSeries", False)
+    date_text = None
+    if not is_series:
+        date_el = page.locator('[data-testid="event-datetime"]').first
+        try:
+            yield date_el.wait_for(state="visible", timeout=DEFAULT_TIMEOUT)
+            date_text = (yield date_el.text_content()).strip()
+            is_series = bool(SERIES_DATE_TEXT_RE.match(date_text))
+        except PlaywrightTimeoutError:
+            pass
 
-            # Fallback: parse date text from the DOM
-            if not event_start_datetime:
-                date_el = page.locator('[data-testid="event-datetime"]').first
-                try:
-                    date_el.wait_for(state="visible", timeout=DEFAULT_TIMEOUT)
-                    date_text = date_el.text_content().strip()
-                    event_start_datetime, event_end_datetime = get_dates(date_text)
-                except (PlaywrightTimeoutError, FreskDateBadFormat) as error:
-                    logging.info(f"Rejecting record: {error}")
-                    return records
+    if is_series:
+        event_info = yield from extract_series_dates_steps(page, link)
+    else:
+        event_info = get_single_event_info(link, next_data_ctx, date_text)
 
-            if not event_end_datetime:
-                event_end_datetime = event_start_datetime + timedelta(hours=DEFAULT_DURATION)
+    if not event_info:
+        logging.info(f"No valid dates extracted for {link}")
+        return None
 
-            uuid = extract_event_uuid(link)
-            if not uuid:
-                logging.info("Rejecting record: UUID not found")
-                return records
+    fields = {
+        "title": title,
+        "description": description,
+        "online": online,
+        "full_location": full_location,
+    }
+    return fields, event_info
 
-            event_info.append([uuid, event_start_datetime, event_end_datetime, link])
 
-        if not event_info:
-            logging.info(f"No valid dates extracted for {link}")
-            return records
-
-        ################################################################
-        # Build records for all date sessions
-        ################################################################
-        for uuid, event_start_datetime, event_end_datetime, event_link in event_info:
-            record = get_record_dict(
-                f"{source['id']}-{uuid}",
-                source["id"],
-                title,
-                event_start_datetime,
-                event_end_datetime,
-                full_location,
-                location_name,
-                address,
-                city,
-                department,
-                zip_code,
-                country_code,
-                latitude,
-                longitude,
-                source.get(
-                    "language_code",
-                    detect_language_code(title, description),
-                ),
-                online,
-                training,
-                sold_out,
-                kids,
-                event_link,
-                event_link,
-                description,
-            )
-            records.append(record)
-            logging.info(f"Successfully scraped {event_link}\n{json.dumps(record, indent=4)}")
+def read_event_page(page: Page, link: str) -> tuple[dict, list] | None:
+    """Reads an Eventbrite event page, see read_event_page_steps."""
+    return run_steps(read_event_page_steps(page, link))
+
+
+async def read_event_page_async(page: AsyncPage, link: str) -> tuple[dict, list] | None:
+    """Async version of read_event_page."""
+    return await run_steps_async(read_event_page_steps(page, link))
+
+
+def process_event_page(page: Page, link: str, source: dict) -> list[dict]:
+    """
+    Process a single Eventbrite event page (new template).
+
+    Args:
+        page: Playwright Page instance
+        link: URL of the event page
+        source: Source page configuration dict
+
+    Returns:
+        List of event records (can be multiple for series/collection events)
+    """
+    logging.info(f"\n-> Processing {link} ...")
+
+    try:
+        page.goto(link, wait_until="domcontentloaded")
+        event = read_event_page(page, link)
+        if event is None:
+            return []
+        return build_event_records(link, source, *event)
 
     except (FreskDateBadFormat, FreskError) as e:
         logging.info(f"Skipping event {link}: {e}")
-        return records
+        return []
     except Exception as e:
         logging.error(f"Unexpected error processing event page {link}: {e}", exc_info=True)
         raise
 
-    return records
 
+async def process_event_page_async(page: AsyncPage, link: str, source: dict) -> list[dict]:
+    """
+    Process a single Eventbrite event page with the async Playwright API, so
+    that many event pages can be loaded concurrently by a single browser.
+    """
+    logging.info(f"\n-> Processing {link} ...")
 
-def extract_series_dates(page: Page, link: str, next_data_ctx: dict | None) -> list:
+    try:
+        await page.goto(link, wait_until="domcontentloaded")
+        event = await read_event_page_async(page, link)
+        if event is None:
+            return []
+        # Geocoding is blocking, keep it off the event loop
+        return await asyncio.to_thread(build_event_records, link, source, *event)
+
+    except (FreskDateBadFormat, FreskError) as e:
+        logging.info(f"Skipping event {link}: {e}")
+        return []
+    except Exception as e:
+        logging.error(f"Unexpected error processing event page {link}: {e}", exc_info=True)
+        raise
+
+
+# Selectors of the series modal, which lists the dates of a series
+CHECKOUT_BUTTON_SELECTOR = (
+    '[data-testid="conversion-bar-checkout-button"], '
+    "button[id^='check-availability-btn-'], "
+    "button[id^='eventbrite-widget-modal-trigger-']"
+)
+MODAL_IFRAME_SELECTOR = (
+    'iframe[id*="eventbrite-widget"], iframe[class*="modal"], iframe[title*="availability"]'
+)
+DATE_WRAPPER_SELECTOR = 'p[class*="dateWrapper"]'
+CALENDAR_CARD_SELECTOR = 'div[class*="CompactCalendar"] div[class*="compactChoiceCardContainer"]'
+MODAL_TIMEOUT = 15000
+
+
+def extract_series_dates_steps(page, link: str):
     """
-    Extract individual session dates from a series/collection event.
+    Page steps extracting individual session dates from a series/collection
+    event, see run_steps.
 
     Opens the checkout/availability modal and parses dates from the
     calendar or list view.
 
     Args:
-        page: Playwright Page instance
+        page: Playwright Page instance (sync or async)
         link: URL of the event page
-        next_data_ctx: Parsed __NEXT_DATA__ context dict (or None)
 
     Returns:
         List of [uuid, start_datetime, end_datetime, link] lists
@@ -595,57 +942,38 @@ def extract_series_dates(page: Page, link: str, next_data_ctx: dict | None) -> l
         return event_info
 
     # Click the checkout/availability button to open the modal
-    checkout_button = page.locator(
-        '[data-testid="conversion-bar-checkout-button"], '
-        "button[id^='check-availability-btn-'], "
-        "button[id^='eventbrite-widget-modal-trigger-']"
-    ).first
-
+    checkout_button = page.locator(CHECKOUT_BUTTON_SELECTOR).first
     try:
-        checkout_button.wait_for(state="visible", timeout=DEFAULT_TIMEOUT)
+        yield checkout_button.wait_for(state="visible", timeout=DEFAULT_TIMEOUT)
     except PlaywrightTimeoutError:
         logging.warning(f"No checkout button found for series event {link}")
         return event_info
 
     try:
         logging.info("Series event detected, clicking checkout button...")
-        checkout_button.click()
+        yield checkout_button.click()
 
-        # Wait for modal content to load
         # Check for iframe first (Eventbrite sometimes puts the modal in an iframe)
         modal_page = page
         try:
-            iframe_locator = page.frame_locator(
-                'iframe[id*="eventbrite-widget"], '
-                'iframe[class*="modal"], '
-                'iframe[title*="availability"]'
-            ).first
-            test_el = iframe_locator.locator("body").first
-            test_el.wait_for(state="attached", timeout=2000)
+            iframe_locator = page.frame_locator(MODAL_IFRAME_SELECTOR).first
+            yield iframe_locator.locator("body").first.wait_for(state="attached", timeout=2000)
             modal_page = iframe_locator
             logging.debug("Switching to iframe for modal content")
         except Exception:
             pass
 
-        MODAL_TIMEOUT = 15000
-
         # Wait for date content to appear in the modal
-        date_wrapper_locator = modal_page.locator('p[class*="dateWrapper"]')
-        calendar_card_locator = modal_page.locator(
-            'div[class*="CompactCalendar"] div[class*="compactChoiceCardContainer"]'
-        )
-
         try:
-            modal_page.locator(
-                'p[class*="dateWrapper"], '
-                'div[class*="CompactCalendar"] div[class*="compactChoiceCardContainer"]'
+            yield modal_page.locator(
+                f"{DATE_WRAPPER_SELECTOR}, {CALENDAR_CARD_SELECTOR}"
             ).first.wait_for(state="visible", timeout=MODAL_TIMEOUT)
             logging.debug("Modal content is now visible")
         except PlaywrightTimeoutError:
             logging.warning(f"Modal content did not load within {MODAL_TIMEOUT}ms for {link}")
 
-        date_wrappers = date_wrapper_locator.all()
-        calendar_date_cards = calendar_card_locator.all()
+        date_wrappers = yield modal_page.locator(DATE_WRAPPER_SELECTOR).all()
+        calendar_date_cards = yield modal_page.locator(CALENDAR_CARD_SELECTOR).all()
 
         if calendar_date_cards:
             ################################################################
@@ -653,41 +981,25 @@ def extract_series_dates(page: Page, link: str, next_data_ctx: dict | None) -> l
             ################################################################
             logging.info(f"Found calendar-style modal with {len(calendar_date_cards)} date cards")
 
+            month = "Unknown"
+            try:
+                month = yield modal_page.locator('p[class*="monthName"]').first.text_content()
+            except Exception as e:
+                logging.debug(f"Could not find month header: {e}")
+
             for card_index, date_card in enumerate(calendar_date_cards):
                 try:
-                    weekday_el = date_card.locator('p[class*="weekday"]').first
-                    day_num_el = date_card.locator('p[class*="dateText"]').first
-                    time_slot_el = date_card.locator('p[class*="timeSlot"]').first
-
-                    weekday = weekday_el.text_content()
-                    day_num = day_num_el.text_content()
-                    time_slot = time_slot_el.text_content()
-
-                    month = "Unknown"
-                    try:
-                        month_header = modal_page.locator('p[class*="monthName"]').first
-                        month = month_header.text_content()
-                    except Exception as e:
-                        logging.debug(f"Could not find month header: {e}")
-
-                    date_str = f"{weekday}, {month} {day_num} {time_slot}"
-                    logging.debug(f"Processing calendar date: {date_str}")
-
-                    try:
-                        event_start_datetime, event_end_datetime = get_dates(date_str)
-                    except FreskDateBadFormat as error:
-                        logging.warning(f"Failed to parse calendar date '{date_str}': {error}")
-                        continue
-
-                    unique_suffix = hash(date_str) % 10000
-                    uuid = f"{base_uuid}-{unique_suffix}"
-
-                    event_info.append([uuid, event_start_datetime, event_end_datetime, link])
-                    logging.debug(f"Added calendar event: {uuid}")
-
+                    weekday = yield date_card.locator('p[class*="weekday"]').first.text_content()
+                    day_num = yield date_card.locator('p[class*="dateText"]').first.text_content()
+                    time_slot = yield date_card.locator('p[class*="timeSlot"]').first.text_content()
                 except Exception as e:
                     logging.warning(f"Failed to process calendar date card {card_index + 1}: {e}")
                     continue
+                session = get_series_session(
+                    base_uuid, f"{weekday}, {month} {day_num} {time_slot}", link
+                )
+                if session:
+                    event_info.append(session)
 
         elif date_wrappers:
             ################################################################
@@ -697,80 +1009,39 @@ def extract_series_dates(page: Page, link: str, next_data_ctx: dict | None) -> l
 
             for date_wrapper in date_wrappers:
                 try:
-                    date_text = date_wrapper.text_content()
-                    logging.debug(f"Processing date: {date_text}")
+                    date_text = yield date_wrapper.text_content()
 
                     # Click on the date card to reveal time slots
                     try:
-                        clickable_parent = date_wrapper.locator(
+                        yield date_wrapper.locator(
                             'xpath=ancestor::div[contains(@class, "EventInfoCard")]'
-                        ).first
-                        clickable_parent.click()
-                        logging.debug(f"Clicked on date card for: {date_text}")
-
+                        ).first.click()
                         time_slot_list = modal_page.locator('ul[class*="TimeSlotList"]').first
                         try:
-                            time_slot_list.wait_for(state="visible", timeout=DEFAULT_TIMEOUT)
+                            yield time_slot_list.wait_for(state="visible", timeout=DEFAULT_TIMEOUT)
                         except PlaywrightTimeoutError:
                             logging.warning(f"Time slot list did not load for date: {date_text}")
                             continue
-
-                        page.wait_for_timeout(500)
+                        yield from wait_for_steps(
+                            time_slot_list.locator("li").first, name="time slots"
+                        )
                     except Exception as e:
                         logging.debug(f"Could not click date card: {e}")
 
-                    # Find all time slots
-                    all_time_slot_lists = modal_page.locator('ul[class*="TimeSlotList"]').all()
-                    if not all_time_slot_lists:
-                        logging.warning(f"No time slot lists found for date: {date_text}")
-                        continue
-
-                    time_slots_data = []
-                    for time_slot_list in all_time_slot_lists:
-                        time_slot_lis = time_slot_list.locator("li").all()
-                        for time_slot_li in time_slot_lis:
-                            try:
-                                time_element = time_slot_li.locator('p[class*="sessionText"]').first
-                                time_text = time_element.text_content()
-                                if time_text:
-                                    time_slots_data.append(time_text)
-                            except Exception as e:
-                                logging.debug(f"Could not extract time slot text: {e}")
-                                continue
-
-                    if not time_slots_data:
-                        logging.warning(f"No time slots found for date: {date_text}")
-                        continue
-
-                    logging.debug(f"Found {len(time_slots_data)} time slots for date: {date_text}")
-
-                    for time_text in time_slots_data:
-                        try:
-                            combined_text = f"{date_text} {time_text}"
-                            logging.debug(f"Processing time slot: {combined_text}")
-
-                            try:
-                                event_start_datetime, event_end_datetime = get_dates(combined_text)
-                            except FreskDateBadFormat as error:
-                                logging.warning(f"Failed to parse date '{combined_text}': {error}")
-                                continue
-
-                            unique_suffix = hash(combined_text) % 10000
-                            uuid = f"{base_uuid}-{unique_suffix}"
-
-                            event_info.append(
-                                [uuid, event_start_datetime, event_end_datetime, link]
-                            )
-                            logging.debug(f"Added event: {uuid}")
-
-                        except Exception as e:
-                            logging.warning(f"Failed to process time slot '{time_text}': {e}")
-                            continue
-
+                    time_texts = yield modal_page.locator(
+                        'ul[class*="TimeSlotList"] li p[class*="sessionText"]'
+                    ).all_text_contents()
                 except Exception as e:
                     logging.warning(f"Failed to process date wrapper: {e}")
                     continue
 
+                if not any(time_texts):
+                    logging.warning(f"No time slots found for date: {date_text}")
+                for time_text in filter(None, time_texts):
+                    session = get_series_session(base_uuid, f"{date_text} {time_text}", link)
+                    if session:
+                        event_info.append(session)
+
         if not event_info:
             logging.warning(f"No valid events extracted from series modal for {link}")
 
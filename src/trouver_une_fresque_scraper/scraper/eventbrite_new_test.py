@@ -0,0 +1,147 @@
+import json
+import logging
+
+from datetime import datetime
+
+from trouver_une_fresque_scraper.scraper import eventbrite_new
+
+LINK = "https://www.eventbrite.fr/e/fresque-du-climat-tickets-1234567890"
+
+SUMMARY = "Un atelier ludique et collaboratif"
+
+OVERVIEW_HTML = (
+    "<p><strong>La Fresque du Climat</strong> est un atelier ludique et collaboratif.</p>"
+    "<p>En 3 heures, les participants découvrent les causes et conséquences du "
+    "changement climatique.</p><ul><li>Accessible à tous</li><li>Sans prérequis</li></ul>"
+)
+
+DESCRIPTION = (
+    "La Fresque du Climat est un atelier ludique et collaboratif.\n"
+    "En 3 heures, les participants découvrent les causes et conséquences du changement "
+    "climatique.\nAccessible à tous\nSans prérequis"
+)
+
+VENUE = {
+    "name": "Maison des associations",
+    "address": {"localizedAddressDisplayLines": ["12 rue de la Paix", "75002 Paris"]},
+}
+
+
+def get_event_page(modules, online=True, venue=None, is_series=False):
+    """Returns the HTML of an event page, with its __NEXT_DATA__."""
+    basic_info = {
+        "name": "Fresque du Climat",
+        "summary": SUMMARY,
+        "isOnline": online,
+        "isSeries": is_series,
+        "startDate": {"local": "2026-11-05T18:30:00"},
+        "endDate": {"local": "2026-11-05T21:30:00"},
+    }
+    if venue:
+        basic_info["venue"] = venue
+    next_data = {
+        "props": {
+            "pageProps": {
+                "context": {
+                    "basicInfo": basic_info,
+                    "structuredContent": {"modules": modules},
+                }
+            }
+        }
+    }
+    return (
+        "<html><body>"
+        '<div data-testid="section-wrapper-overview">'
+        f'<div class="Overview_summary__abc12"><p>{SUMMARY}</p></div>'
+        "</div>"
+        f'<script id="__NEXT_DATA__" type="application/json">{json.dumps(next_data)}</script>'
+        "</body></html>"
+    )
+
+
+def run_tests():
+    # tuple fields:
+    # 1. Test case name or ID
+    # 2. HTML of the event page
+    # 3. Expected fields and dates read by the fast path, or None if the
+    #    page has to be processed in the browser
+    expected_info = [
+        ["1234567890", datetime(2026, 11, 5, 18, 30), datetime(2026, 11, 5, 21, 30), LINK]
+    ]
+    test_cases = [
+        (
+            "Single text module",
+            get_event_page([{"type": "text", "text": OVERVIEW_HTML}]),
+            (
+                {
+                    "title": "Fresque du Climat",
+                    "description": DESCRIPTION,
+                    "online": True,
+                    "full_location": "",
+                },
+                expected_info,
+            ),
+        ),
+        (
+            "Text modules around an image",
+            get_event_page(
+                [
+                    {"type": "text", "text": OVERVIEW_HTML.split("<ul>")[0]},
+                    {"type": "image", "url": "https://img.evbuc.com/fresque.jpg"},
+                    {"type": "text", "text": "<ul>" + OVERVIEW_HTML.split("<ul>")[1]},
+                ]
+            ),
+            (
+                {
+                    "title": "Fresque du Climat",
+                    "description": DESCRIPTION,
+                    "online": True,
+                    "full_location": "",
+                },
+                expected_info,
+            ),
+        ),
+        (
+            "No structured content",
+            get_event_page([]),
+            (
+                {
+                    "title": "Fresque du Climat",
+                    "description": SUMMARY,
+                    "online": True,
+                    "full_location": "",
+                },
+                expected_info,
+            ),
+        ),
+        (
+            "In-person event",
+            get_event_page([{"type": "text", "text": OVERVIEW_HTML}], online=False, venue=VENUE),
+            (
+                {
+                    "title": "Fresque du Climat",
+                    "description": DESCRIPTION,
+                    "online": False,
+                    "full_location": "Maison des associations, 12 rue de la Paix, 75002 Paris",
+                },
+                expected_info,
+            ),
+        ),
+        (
+            "In-person event without a venue",
+            get_event_page([{"type": "text", "text": OVERVIEW_HTML}], online=False),
+            None,
+        ),
+        (
+            "Series",
+            get_event_page([{"type": "text", "text": OVERVIEW_HTML}], is_series=True),
+            None,
+        ),
+    ]
+    for test_case in test_cases:
+        logging.info(f"Running {test_case[0]}")
+        result = eventbrite_new.read_event_html(LINK, test_case[1])
+        if result == test_case[2]:
+            logging.info("Result matches")
+        else:
+            logging.error(f"{test_case[0]}: expected {test_case[2]}, got {result}")
@@ -1,17 +1,24 @@
+import asyncio
 import json
 import re
 import logging
 
+from playwright.async_api import Page as AsyncPage
 from playwright.sync_api import Page, TimeoutError as PlaywrightTimeoutError
 
 from trouver_une_fresque_scraper.db.records import get_record_dict
-from trouver_une_fresque_scraper.utils.browser import managed_browser, DEFAULT_TIMEOUT
+from trouver_une_fresque_scraper.utils.browser import (
+    run_browser,
+    process_links,
+    DEFAULT_TIMEOUT,
+)
 from trouver_une_fresque_scraper.utils.date_and_time import get_dates
 from trouver_une_fresque_scraper.utils.errors import (
     FreskError,
     FreskDateBadFormat,
     FreskLanguageNotRecognized,
 )
+from trouver_une_fresque_scraper.utils.fingerprints import reuse_unchanged, store_results
 from trouver_une_fresque_scraper.utils.keywords import (
     is_training,
     is_sold_out,
@@ -28,14 +35,18 @@ def extract_event_uuid(link: str) -> str | None:
     return uuids[0] if uuids else None
 
 
-def collect_links_from_iframe(page: Page, source: dict) -> list[str]:
+def collect_links_from_iframe(page: Page, source: dict) -> tuple[list[str], dict[str, str]]:
     """
     Collect all event links from the listing page, handling pagination.
 
     Navigates the iframe's pagination to gather links across all pages,
     without ever leaving the listing page.
+
+    Returns:
+        The event links, and the text of their listing card by link
     """
     all_links = []
+    cards = {}
 
     while True:
         iframe = page.frame_locator("iframe")
@@ -54,6 +65,9 @@ def collect_links_from_iframe(page: Page, source: dict) -> list[str]:
             href = el.evaluate("node => node.href")
             if href:
                 all_links.append(href)
+                cards[href] = el.evaluate(
+                    "node => (node.closest('.card, li, tr') || node.parentElement).innerText"
+                )
 
         logging.info(f"Collected {len(link_elements)} links from current page")
 
@@ -62,41 +76,46 @@ def collect_links_from_iframe(page: Page, source: dict) -> list[str]:
             next_button = iframe.locator("a.page-link:has-text('Suivant')")
             if next_button.is_visible(timeout=2000):
                 next_button.scroll_into_view_if_needed()
-                page.wait_for_timeout(500)
-                next_button.click()
-                page.wait_for_timeout(5000)
+                # The iframe loads the next page as a new document
+                with page.expect_event(
+                    "framenavigated",
+                    predicate=lambda frame: frame != page.main_frame,
+                    timeout=DEFAULT_TIMEOUT,
+                ):
+                    next_button.click()
             else:
                 break
         except PlaywrightTimeoutError:
             break
 
     logging.info(f"Total links collected: {len(all_links)}")
-    return all_links
+    return all_links, cards
 
 
 # ==================== Main Entry Point ====================
 
 
-def get_fdc_data(sources, service=None, options=None):
+def get_fdc_data(
+    sources, service=None, options=None, page_workers=1, page_backend="threads", browser=None
+):
     """
     Scrape FDC (Fresque du Climat) events using Playwright.
 
     Args:
         sources: List of source page configurations (dicts with 'id' and 'url')
         service: Unused (kept for compatibility)
-        options: Unused (kept for compatibility)
+        options: Selenium options, only read for headless mode without a browser
+        page_workers: Number of pages processing event links concurrently
+        page_backend: "threads" (one thread per page) or "async" (one asyncio loop)
+        browser: BrowserManager shared by the scrapers of the run, or None to
+            start a browser for this scraper alone
 
     Returns:
         List of event records
     """
     logging.info("Scraping data from fresqueduclimat.org")
 
-    headless = False
-    if options and hasattr(options, "arguments") and len(options.arguments) > 0:
-        headless = "-headless" in options.arguments
-
-    with managed_browser(headless=headless) as browser:
-        context = browser.new_context()
+    with run_browser(browser, options) as browser, browser.context("fdc") as context:
         page = context.new_page()
         records = []
 
@@ -106,11 +125,26 @@ def get_fdc_data(sources, service=None, options=None):
                 page.goto(source["url"], wait_until="domcontentloaded")
 
                 # Phase 1: Collect all event links across pagination pages
-                links = collect_links_from_iframe(page, source)
+                links, cards = collect_links_from_iframe(page, source)
+                links_to_visit, reused_records = reuse_unchanged(
+                    source, links, cards, extract_event_uuid
+                )
+                records += reused_records
 
                 # Phase 2: Process each event page
-                for link in links:
-                    event_record = process_event_page(page, link, source)
+                results = process_links(
+                    page,
+                    links_to_visit,
+                    source,
+                    process_event_page,
+                    process_event_page_async,
+                    browser=browser,
+                    page_workers=page_workers,
+                    page_backend=page_backend,
+                    platform="fdc",
+                )
+                store_results(source, links_to_visit, cards, extract_event_uuid, results)
+                for event_record in results:
                     if event_record:
                         records.append(event_record)
 
@@ -121,11 +155,214 @@ def get_fdc_data(sources, service=None, options=None):
                 )
                 raise
 
-        context.close()
-
     return records
 
 
+def read_event_page(page: Page) -> dict:
+    """
+    Reads the raw fields of a FDC event page, see build_event_record.
+
+    Args:
+        page: Playwright Page instance, on the event page
+    """
+    title_el = page.locator("h3").first
+    title_el.wait_for(state="visible", timeout=DEFAULT_TIMEOUT)
+    fields = {"title": title_el.inner_text()}
+
+    clock_icon = page.locator(".fa-clock").first
+    clock_icon.wait_for(state="visible", timeout=DEFAULT_TIMEOUT)
+    fields["event_time"] = clock_icon.locator("xpath=..").inner_text().strip()
+
+    fields["language"] = None
+    try:
+        globe_icon = page.locator("div.mb-3 > i.fa-globe").first
+        globe_icon.wait_for(state="visible", timeout=2000)
+        fields["language"] = globe_icon.locator("xpath=..").inner_text()
+    except Exception:
+        # The language is optional, see build_event_record
+        pass
+
+    fields["online"] = page.locator(".fa-video").count() > 0
+
+    fields["full_location"] = ""
+    if not fields["online"]:
+        pin_icon = page.locator(".fa-map-pin").first
+        pin_icon.wait_for(state="visible", timeout=DEFAULT_TIMEOUT)
+        fields["full_location"] = pin_icon.locator("xpath=..").inner_text()
+
+    description_title_el = page.locator("strong:has-text('Description')").first
+    description_title_el.wait_for(state="visible", timeout=DEFAULT_TIMEOUT)
+    fields["description"] = description_title_el.locator("xpath=..").inner_text()
+
+    user_icon = page.locator(".fa-user").first
+    user_icon.wait_for(state="visible", timeout=DEFAULT_TIMEOUT)
+    fields["tickets"] = user_icon.locator("xpath=../..").inner_text()
+    fields["tickets_link"] = user_icon.locator("xpath=..").evaluate("node => node.href")
+    return fields
+
+
+async def read_event_page_async(page: AsyncPage) -> dict:
+    """Async version of read_event_page."""
+    title_el = page.locator("h3").first
+    await title_el.wait_for(state="visible", timeout=DEFAULT_TIMEOUT)
+    fields = {"title": await title_el.inner_text()}
+
+    clock_icon = page.locator(".fa-clock").first
+    await clock_icon.wait_for(state="visible", timeout=DEFAULT_TIMEOUT)
+    fields["event_time"] = (await clock_icon.locator("xpath=..").inner_text()).strip()
+
+    fields["language"] = None
+    try:
+        globe_icon = page.locator("div.mb-3 > i.fa-globe").first
+        await globe_icon.wait_for(state="visible", timeout=2000)
+        fields["language"] = await globe_icon.locator("xpath=..").inner_text()
+    except Exception:
+        # The language is optional, see build_event_record
+        pass
+
+    fields["online"] = await page.locator(".fa-video").count() > 0
+
+    fields["full_location"] = ""
+    if not fields["online"]:
+        pin_icon = page.locator(".fa-map-pin").first
+        await pin_icon.wait_for(state="visible", timeout=DEFAULT_TIMEOUT)
+        fields["full_location"] = await pin_icon.locator("xpath=..").inner_text()
+
+    description_title_el = page.locator("strong:has-text('Description')").first
+    await description_title_el.wait_for(state="visible", timeout=DEFAULT_TIMEOUT)
+    fields["description"] = await description_title_el.locator("xpath=..").inner_text()
+
+    user_icon = page.locator(".fa-user").first
+    await user_icon.wait_for(state="visible", timeout=DEFAULT_TIMEOUT)
+    fields["tickets"] = await user_icon.locator("xpath=../..").inner_text()
+    fields["tickets_link"] = await user_icon.locator("xpath=..").evaluate("node => node.href")
+    return fields
+
+
+def build_event_record(link: str, source: dict, fields: dict) -> dict | None:
+    """
+    Builds the record of a FDC event from the fields read on its page.
+
+    Args:
+        link: URL of the event page
+        source: Source page configuration dict
+        fields: Dict returned by read_event_page or read_event_page_async
+
+    Returns:
+        Event record dict, or None if the event should be skipped
+    """
+    ################################################################
+    # Parse event id
+    ################################################################
+    uuid = extract_event_uuid(link)
+    if not uuid:
+        logging.info("Rejecting record: UUID not found")
+        return None
+
+    title = fields["title"]
+
+    ################################################################
+    # Parse start and end dates
+    ################################################################
+    try:
+        event_start_datetime, event_end_datetime = get_dates(fields["event_time"])
+    except FreskDateBadFormat as error:
+        logging.info(f"Reject record: {error}")
+        return None
+
+    ################################################################
+    # Workshop language
+    ################################################################
+    language_code = None
+    if fields["language"] is None:
+        logging.warning("Unable to find workshop language on the page.")
+    else:
+        try:
+            language_code = get_language_code(fields["language"])
+        except FreskLanguageNotRecognized as e:
+            logging.warning(f"Unable to parse workshop language: {e}")
+
+    ################################################################
+    # Location data
+    ################################################################
+    online = fields["online"]
+    full_location = fields["full_location"]
+    location_name = ""
+    address = ""
+    city = ""
+    department = ""
+    longitude = ""
+    latitude = ""
+    zip_code = ""
+    country_code = ""
+
+    if not online:
+        try:
+            logging.info(f"Full location: {full_location}")
+            address_dict = get_address(full_location)
+            (
+                location_name,
+                address,
+                city,
+                department,
+                zip_code,
+                country_code,
+                latitude,
+                longitude,
+            ) = address_dict.values()
+        except FreskError as error:
+            logging.info(f"Rejecting record: {error}.")
+            return None
+
+    description = fields["description"]
+
+    ################################################################
+    # Training?
+    ################################################################
+    training = is_training(title)
+
+    ################################################################
+    # Is it full?
+    ################################################################
+    sold_out = is_sold_out(fields["tickets"])
+
+    ################################################################
+    # Is it suited for kids?
+    ################################################################
+    kids = is_for_kids(description) and not training
+
+    ################################################################
+    # Building final object
+    ################################################################
+    record = get_record_dict(
+        f"{source['id']}-{uuid}",
+        source["id"],
+        title,
+        event_start_datetime,
+        event_end_datetime,
+        full_location,
+        location_name,
+        address,
+        city,
+        department,
+        zip_code,
+        country_code,
+        latitude,
+        longitude,
+        language_code,
+        online,
+        training,
+        sold_out,
+        kids,
+        link,
+        fields["tickets_link"],
+        description,
+    )
+
+    logging.info(f"Successfully scraped {link}\n{json.dumps(record, indent=4)}")
+    return record
+
+
 def process_event_page(page: Page, link: str, source: dict) -> dict | None:
     """
     Process a single FDC event page.
@@ -142,156 +379,28 @@ def process_event_page(page: Page, link: str, source: dict) -> dict | None:
 
     try:
         page.goto(link, wait_until="domcontentloaded")
+        return build_event_record(link, source, read_event_page(page))
 
-        ################################################################
-        # Parse event id
-        ################################################################
-        uuid = extract_event_uuid(link)
-        if not uuid:
-            logging.info("Rejecting record: UUID not found")
-            return None
-
-        ################################################################
-        # Parse event title
-        ################################################################
-        title_el = page.locator("h3").first
-        title_el.wait_for(state="visible", timeout=DEFAULT_TIMEOUT)
-        title = title_el.inner_text()
-
-        ################################################################
-        # Parse start and end dates
-        ################################################################
-        clock_icon = page.locator(".fa-clock").first
-        clock_icon.wait_for(state="visible", timeout=DEFAULT_TIMEOUT)
-        parent_div = clock_icon.locator("xpath=..")
-        event_time = parent_div.inner_text().strip()
+    except (FreskDateBadFormat, FreskError) as e:
+        logging.info(f"Skipping event {link}: {e}")
+        return None
+    except Exception as e:
+        logging.error(f"Unexpected error processing event page {link}: {e}", exc_info=True)
+        raise
 
-        try:
-            event_start_datetime, event_end_datetime = get_dates(event_time)
-        except FreskDateBadFormat as error:
-            logging.info(f"Reject record: {error}")
-            return None
 
-        ################################################################
-        # Workshop language
-        ################################################################
-        language_code = None
-        try:
-            globe_icon = page.locator("div.mb-3 > i.fa-globe").first
-            globe_icon.wait_for(state="visible", timeout=2000)
-            parent = globe_icon.locator("xpath=..")
-            language_code = get_language_code(parent.inner_text())
-        except FreskLanguageNotRecognized as e:
-            logging.warning(f"Unable to parse workshop language: {e}")
-            language_code = None
-        except (PlaywrightTimeoutError, Exception):
-            logging.warning("Unable to find workshop language on the page.")
-            language_code = None
-
-        ################################################################
-        # Is it an online event?
-        ################################################################
-        online = page.locator(".fa-video").count() > 0
-
-        ################################################################
-        # Location data
-        ################################################################
-        full_location = ""
-        location_name = ""
-        address = ""
-        city = ""
-        department = ""
-        longitude = ""
-        latitude = ""
-        zip_code = ""
-        country_code = ""
-
-        if not online:
-            pin_icon = page.locator(".fa-map-pin").first
-            pin_icon.wait_for(state="visible", timeout=DEFAULT_TIMEOUT)
-            parent_div = pin_icon.locator("xpath=..")
-            full_location = parent_div.inner_text()
+async def process_event_page_async(page: AsyncPage, link: str, source: dict) -> dict | None:
+    """
+    Process a single FDC event page with the async Playwright API, so that
+    many event pages can be loaded concurrently by a single browser.
+    """
+    logging.info(f"\n-> Processing {link} ...")
 
-            try:
-                logging.info(f"Full location: {full_location}")
-                address_dict = get_address(full_location)
-                (
-                    location_name,
-                    address,
-                    city,
-                    department,
-                    zip_code,
-                    country_code,
-                    latitude,
-                    longitude,
-                ) = address_dict.values()
-            except FreskError as error:
-                logging.info(f"Rejecting record: {error}.")
-                return None
-
-        ################################################################
-        # Description
-        ################################################################
-        description_title_el = page.locator("strong:has-text('Description')").first
-        description_title_el.wait_for(state="visible", timeout=DEFAULT_TIMEOUT)
-        parent_description_el = description_title_el.locator("xpath=..")
-        description = parent_description_el.inner_text()
-
-        ################################################################
-        # Training?
-        ################################################################
-        training = is_training(title)
-
-        ################################################################
-        # Is it full?
-        ################################################################
-        user_icon = page.locator(".fa-user").first
-        user_icon.wait_for(state="visible", timeout=DEFAULT_TIMEOUT)
-        parent_container = user_icon.locator("xpath=../..")
-        sold_out = is_sold_out(parent_container.inner_text())
-
-        ################################################################
-        # Is it suited for kids?
-        ################################################################
-        kids = is_for_kids(description) and not training
-
-        ################################################################
-        # Parse tickets link
-        ################################################################
-        user_icon_link = page.locator(".fa-user").first
-        parent_link = user_icon_link.locator("xpath=..")
-        tickets_link = parent_link.evaluate("node => node.href")
-
-        ################################################################
-        # Building final object
-        ################################################################
-        record = get_record_dict(
-            f"{source['id']}-{uuid}",
-            source["id"],
-            title,
-            event_start_datetime,
-            event_end_datetime,
-            full_location,
-            location_name,
-            address,
-            city,
-            department,
-            zip_code,
-            country_code,
-            latitude,
-            longitude,
-            language_code,
-            online,
-            training,
-            sold_out,
-            kids,
-            link,
-            tickets_link,
-            description,
-        )
-
-        logging.info(f"Successfully scraped {link}\n{json.dumps(record, indent=4)}")
-        return record
+    try:
+        await page.goto(link, wait_until="domcontentloaded")
+        fields = await read_event_page_async(page)
+        # Geocoding is blocking, keep it off the event loop
+        return await asyncio.to_thread(build_event_record, link, source, fields)
 
     except (FreskDateBadFormat, FreskError) as e:
         logging.info(f"Skipping event {link}: {e}")
@@ -1,5 +1,4 @@
 import json
-import time
 import logging
 
 from selenium import webdriver
@@ -13,19 +12,20 @@ from trouver_une_fresque_scraper.utils.date_and_time import get_dates
 from trouver_une_fresque_scraper.utils.errors import (
     FreskError,
     FreskDateBadFormat,
-    FreskDateNotFound,
     FreskDateDifferentTimezone,
 )
 from trouver_une_fresque_scraper.utils.keywords import *
 from trouver_une_fresque_scraper.utils.language import detect_language_code
 from trouver_une_fresque_scraper.utils.location import get_address
+from trouver_une_fresque_scraper.utils.scraping import wait_until_ready, DEFAULT_TIMEOUT
+
+EVENT_CARDS_SELECTOR = 'li[data-hook="events-card"]'
 
 
 def scroll_to_bottom(driver):
     while True:
         logging.info("Scrolling to the bottom...")
         try:
-            time.sleep(2)
             next_button = WebDriverWait(driver, 10).until(
                 EC.element_to_be_clickable(
                     (
@@ -40,12 +40,113 @@ def scroll_to_bottom(driver):
             current_y = (window_h / 2) + window_y
             scroll_y_by = desired_y - current_y
             driver.execute_script("window.scrollBy(0, arguments[0]);", scroll_y_by)
-            time.sleep(2)
+            card_count = len(driver.find_elements(By.CSS_SELECTOR, EVENT_CARDS_SELECTOR))
             next_button.click()
+            # Wait for the next batch of events to be rendered
+            WebDriverWait(driver, DEFAULT_TIMEOUT).until(
+                lambda d: len(d.find_elements(By.CSS_SELECTOR, EVENT_CARDS_SELECTOR)) > card_count
+            )
         except TimeoutException:
             break
 
 
+def build_record(
+    page,
+    link,
+    uuid,
+    title,
+    event_start_datetime,
+    event_end_datetime,
+    online,
+    full_location,
+    description,
+    sold_out,
+):
+    """
+    Builds the record of an event from the data read on its page.
+
+    Returns:
+        The event record, or None if its location can't be found
+    """
+    ################################################################
+    # Location data
+    ################################################################
+    location_name = ""
+    address = ""
+    city = ""
+    department = ""
+    longitude = ""
+    latitude = ""
+    zip_code = ""
+    country_code = ""
+
+    if not online:
+        try:
+            address_dict = get_address(full_location)
+            (
+                location_name,
+                address,
+                city,
+                department,
+                zip_code,
+                country_code,
+                latitude,
+                longitude,
+            ) = address_dict.values()
+        except FreskError as error:
+            logging.info(f"Rejecting record: {error}.")
+            return None
+
+    ################################################################
+    # Training?
+    ################################################################
+    training = is_training(title)
+
+    ################################################################
+    # Is it suited for kids?
+    ################################################################
+    kids = is_for_kids(title)
+
+    ################################################################
+    # Parse tickets link
+    ################################################################
+    tickets_link = link
+
+    ################################################################
+    # Building final object
+    ################################################################
+    record = get_record_dict(
+        f"{page['id']}-{uuid}",
+        page["id"],
+        title,
+        event_start_datetime,
+        event_end_datetime,
+        full_location,
+        location_name,
+        address,
+        city,
+        department,
+        zip_code,
+        country_code,
+        latitude,
+        longitude,
+        page.get(
+            "language_code",
+            detect_language_code(title, description),
+        ),
+        online,
+        training,
+        sold_out,
+        kids,
+        link,
+        tickets_link,
+        description,
+    )
+
+    logging.info(f"Successfully scraped {link}\n{json.dumps(record, indent=4)}")
+    return record
+
+
 def get_fec_data(sources, service, options):
     logging.info("Scraping data from lafresquedeleconomiecirculaire.com")
 
@@ -62,9 +163,7 @@ def get_fec_data(sources, service, options):
         scroll_to_bottom(driver)
         driver.execute_script("window.scrollTo(0, 0);")
 
-        ele = driver.find_elements(
-            By.CSS_SELECTOR, 'li[data-hook="events-card"] a[data-hook="title"]'
-        )
+        ele = driver.find_elements(By.CSS_SELECTOR, f'{EVENT_CARDS_SELECTOR} a[data-hook="title"]')
         links = [e.get_attribute("href") for e in ele]
 
         # Only events published on lafresquedeleconomiecirculaire.com can be extracted
@@ -74,7 +173,7 @@ def get_fec_data(sources, service, options):
             logging.info(f"\n-> Processing {link} ...")
             driver.get(link)
             driver.implicitly_wait(3)
-            time.sleep(5)
+            wait_until_ready(driver, (By.CSS_SELECTOR, 'p[data-hook="event-full-date"]'))
 
             ################################################################
             # Parse event id
@@ -104,11 +203,12 @@ def get_fec_data(sources, service, options):
                 )
                 event_time = date_info_el.text
             except NoSuchElementException:
-                raise FreskDateNotFound
+                logging.info("Rejecting record: no date")
+                continue
 
             try:
                 event_start_datetime, event_end_datetime = get_dates(event_time)
-            except FreskDateBadFormat as error:
+            except (FreskDateBadFormat, FreskDateDifferentTimezone) as error:
                 logging.info(f"Reject record: {error}")
                 continue
 
@@ -125,41 +225,13 @@ def get_fec_data(sources, service, options):
             except NoSuchElementException:
                 pass
 
-            ################################################################
-            # Location data
-            ################################################################
             full_location = ""
-            location_name = ""
-            address = ""
-            city = ""
-            department = ""
-            longitude = ""
-            latitude = ""
-            zip_code = ""
-            country_code = ""
-
             if not online:
                 location_el = driver.find_element(
                     By.CSS_SELECTOR, 'p[data-hook="event-full-location"]'
                 )
                 full_location = location_el.text
 
-                try:
-                    address_dict = get_address(full_location)
-                    (
-                        location_name,
-                        address,
-                        city,
-                        department,
-                        zip_code,
-                        country_code,
-                        latitude,
-                        longitude,
-                    ) = address_dict.values()
-                except FreskError as error:
-                    logging.info(f"Rejecting record: {error}.")
-                    continue
-
             ################################################################
             # Description
             ################################################################
@@ -189,11 +261,6 @@ def get_fec_data(sources, service, options):
 
             description = description_el.text
 
-            ################################################################
-            # Training?
-            ################################################################
-            training = is_training(title)
-
             ################################################################
             # Is it full?
             ################################################################
@@ -206,49 +273,20 @@ def get_fec_data(sources, service, options):
             except NoSuchElementException:
                 sold_out = False
 
-            ################################################################
-            # Is it suited for kids?
-            ################################################################
-            kids = is_for_kids(title)
-
-            ################################################################
-            # Parse tickets link
-            ################################################################
-            tickets_link = link
-
-            ################################################################
-            # Building final object
-            ################################################################
-            record = get_record_dict(
-                f"{page['id']}-{uuid}",
-                page["id"],
+            record = build_record(
+                page,
+                link,
+                uuid,
                 title,
                 event_start_datetime,
                 event_end_datetime,
-                full_location,
-                location_name,
-                address,
-                city,
-                department,
-                zip_code,
-                country_code,
-                latitude,
-                longitude,
-                page.get(
-                    "language_code",
-                    detect_language_code(title, description),
-                ),
                 online,
-                training,
-                sold_out,
-                kids,
-                link,
-                tickets_link,
+                full_location,
                 description,
+                sold_out,
             )
-
-            records.append(record)
-            logging.info(f"Successfully scraped {link}\n{json.dumps(record, indent=4)}")
+            if record:
+                records.append(record)
 
     driver.quit()
 
@@ -0,0 +1,290 @@
+import json
+import logging
+
+from datetime import datetime
+from urllib.parse import urljoin, urlparse
+from zoneinfo import ZoneInfo
+
+import requests
+
+from trouver_une_fresque_scraper.scraper.fec import build_record, get_fec_data
+from trouver_une_fresque_scraper.utils.date_and_time import get_dates
+from trouver_une_fresque_scraper.utils.errors import FreskDateBadFormat
+from trouver_une_fresque_scraper.utils.html import fetch, first, get_text, html_to_text
+from trouver_une_fresque_scraper.utils.keywords import is_online
+from trouver_une_fresque_scraper.utils.utils import get_config
+
+
+def load_json_scripts(tree, xpath):
+    """Returns the JSON payloads of the <script> elements matching an XPath expression."""
+    payloads = []
+    for script in tree.xpath(xpath):
+        try:
+            payloads.append(json.loads(script.text or ""))
+        except json.JSONDecodeError as e:
+            logging.debug(f"Could not parse JSON script: {e}")
+    return payloads
+
+
+def find_wix_events(data):
+    """Returns the Wix events (dicts with a slug and scheduling) of a JSON payload."""
+    if isinstance(data, dict):
+        if "slug" in data and "scheduling" in data:
+            return [data]
+        children = data.values()
+    elif isinstance(data, list):
+        children = data
+    else:
+        return []
+    return [event for child in children for event in find_wix_events(child)]
+
+
+def has_more_events(data):
+    """Whether a JSON payload flags that the event list goes on beyond it."""
+    if isinstance(data, dict):
+        if data.get("hasMore") is True:
+            return True
+        return any(has_more_events(child) for child in data.values())
+    if isinstance(data, list):
+        return any(has_more_events(child) for child in data)
+    return False
+
+
+def find_json_ld_event(tree):
+    """Returns the schema.org Event of the JSON-LD data of a page, or None."""
+    for payload in load_json_scripts(tree, '//script[@type="application/ld+json"]'):
+        items = payload if isinstance(payload, list) else payload.get("@graph", [payload])
+        for item in items:
+            if isinstance(item, dict) and item.get("@type") == "Event":
+                return item
+    return None
+
+
+def to_local_datetime(value, timezone=None):
+    """
+    Converts an ISO 8601 datetime to a naive datetime in the event timezone,
+    or else the timezone of the configuration, as returned by get_dates.
+    """
+    dt = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if dt.tzinfo is not None:
+        dt = dt.astimezone(ZoneInfo(timezone or get_config("timezone"))).replace(tzinfo=None)
+    return dt
+
+
+def details_from_wix_event(event):
+    """Returns the details of an event from its Wix warmup data."""
+    config = event["scheduling"].get("config", {})
+    if config.get("scheduleTbd") or not config.get("startDate"):
+        raise FreskDateBadFormat(event["scheduling"].get("formatted", ""))
+    timezone = config.get("timeZoneId")
+
+    location = event.get("location") or {}
+    address = (location.get("fullAddress") or {}).get("formattedAddress") or location.get("address")
+    full_location = ", ".join(filter(None, [location.get("name"), address]))
+
+    registration = event.get("registration") or {}
+    return {
+        "title": event.get("title", ""),
+        "start": to_local_datetime(config["startDate"], timezone),
+        "end": to_local_datetime(config.get("endDate") or config["startDate"], timezone),
+        "online": location.get("type") == "ONLINE" or is_online(full_location),
+        "full_location": full_location,
+        "description": html_to_text(event.get("about")) or event.get("description", ""),
+        "sold_out": bool((registration.get("ticketing") or {}).get("soldOut")),
+    }
+
+
+def details_from_json_ld(event):
+    """Returns the details of an event from its schema.org Event."""
+    location = event.get("location") or {}
+    if isinstance(location, list):
+        location = location[0] if location else {}
+    address = location.get("address") or ""
+    if isinstance(address, dict):
+        address = ", ".join(
+            filter(
+                None,
+                [
+                    address.get("streetAddress"),
+                    " ".join(
+                        filter(None, [address.get("postalCode"), address.get("addressLocality")])
+                    ),
+                ],
+            )
+        )
+    full_location = ", ".join(filter(None, [location.get("name"), address]))
+
+    offers = event.get("offers") or {}
+    if isinstance(offers, list):
+        offers = offers[0] if offers else {}
+    return {
+        "title": event.get("name", ""),
+        "start": to_local_datetime(event["startDate"]),
+        "end": to_local_datetime(event.get("endDate") or event["startDate"]),
+        "online": "Online" in event.get("eventAttendanceMode", "")
+        or location.get("@type") == "VirtualLocation"
+        or is_online(full_location),
+        "full_location": full_location,
+        "description": html_to_text(event.get("description")),
+        "sold_out": offers.get("availability", "").endswith("SoldOut"),
+    }
+
+
+def details_from_html(tree):
+    """Returns the details of an event from the server-side rendered page."""
+    title_el = first(tree, "//h1")
+    date_el = first(tree, '//p[@data-hook="event-full-date"]')
+    if title_el is None or date_el is None:
+        return None
+    start, end = get_dates(get_text(date_el))
+
+    location_el = first(tree, '//p[@data-hook="event-full-location"]')
+    full_location = get_text(location_el) if location_el is not None else ""
+    description_el = first(
+        tree, '//div[@data-hook="about-section-text"]', '//div[@data-hook="about-section"]'
+    )
+    return {
+        "title": get_text(title_el),
+        "start": start,
+        "end": end,
+        "online": is_online(full_location),
+        "full_location": full_location,
+        "description": (
+            get_text(description_el, include_hidden=True) if description_el is not None else ""
+        ),
+        "sold_out": first(tree, '//div[@data-hook="event-sold-out"]') is not None,
+    }
+
+
+def get_event_details(tree, uuid):
+    """
+    Returns the details of an event page, from the Wix warmup data, the
+    JSON-LD data or else the HTML, whose dates are parsed with get_dates.
+
+    Returns:
+        Dict with title, start, end, online, full_location, description and
+        sold_out, or None if the page has none of them
+    """
+    for payload in load_json_scripts(tree, '//script[@id="wix-warmup-data"]'):
+        for event in find_wix_events(payload):
+            if event.get("slug") == uuid:
+                try:
+                    return details_from_wix_event(event)
+                except (KeyError, ValueError) as e:
+                    logging.debug(f"Unexpected Wix event data: {e}")
+
+    json_ld_event = find_json_ld_event(tree)
+    if json_ld_event is not None:
+        try:
+            return details_from_json_ld(json_ld_event)
+        except (KeyError, ValueError) as e:
+            logging.debug(f"Unexpected JSON-LD event data: {e}")
+
+    return details_from_html(tree)
+
+
+def collect_event_links(tree, url):
+    """
+    Collects the event links of a Wix events listing page.
+
+    Returns:
+        The event links, or None if the page only lists the first events
+        and the others must be loaded by clicking "load more"
+    """
+    origin = "{0.scheme}://{0.netloc}".format(urlparse(url))
+    links = [
+        a.get("href")
+        for a in tree.xpath('//li[@data-hook="events-card"]//a[@data-hook="title"]')
+        if a.get("href")
+    ]
+
+    warmup = load_json_scripts(tree, '//script[@id="wix-warmup-data"]')
+    for payload in warmup:
+        for event in find_wix_events(payload):
+            link = urljoin(origin, f"/event-details/{event['slug']}")
+            if link not in links:
+                links.append(link)
+
+    has_load_more = first(tree, '//button[@data-hook="load-more-button"]') is not None
+    if has_load_more and (not warmup or any(has_more_events(p) for p in warmup)):
+        return None
+    return links
+
+
+def get_fec_http_data(sources, service=None, options=None):
+    """
+    Scrape Wix events of lafresquedeleconomiecirculaire.com over plain HTTP.
+
+    Events are read from the warmup data and JSON-LD embedded by Wix in its
+    pages, and from the server-side rendered HTML otherwise.
+
+    Args:
+        sources: List of source page configurations (dicts with 'id' and 'url')
+        service: Selenium service, used as a fallback when the listing page
+            doesn't include all the events
+        options: Selenium options, used along with service
+
+    Returns:
+        List of event records
+    """
+    logging.info("Scraping data from lafresquedeleconomiecirculaire.com (HTTP)")
+
+    records = []
+
+    for page in sources:
+        logging.info("========================")
+        links = collect_event_links(fetch(page["url"]), page["url"])
+        if links is None:
+            if service is not None and options is not None:
+                logging.info("Listing is paginated, falling back to the browser")
+                records += get_fec_data([page], service, options)
+            else:
+                logging.info("Listing is paginated, only its first events are scraped")
+            continue
+
+        # Only events published on lafresquedeleconomiecirculaire.com can be extracted
+        links = [l for l in links if "lafresquedeleconomiecirculaire.com" in l]
+
+        for link in links:
+            logging.info(f"\n-> Processing {link} ...")
+
+            ################################################################
+            # Parse event id
+            ################################################################
+            uuid = link.split("/event-details/")[-1]
+            if not uuid:
+                logging.info("Rejecting record: UUID not found")
+                continue
+
+            try:
+                details = get_event_details(fetch(link), uuid)
+            except requests.RequestException as e:
+                logging.info(f"Rejecting record: {e}")
+                continue
+            except FreskDateBadFormat as error:
+                logging.info(f"Reject record: {error}")
+                continue
+
+            if details is None:
+                logging.info("Rejecting record: no event data")
+                continue
+            if not details["description"]:
+                logging.info("Rejecting record: no description")
+                continue
+
+            record = build_record(
+                page,
+                link,
+                uuid,
+                details["title"],
+                details["start"],
+                details["end"],
+                details["online"],
+                details["full_location"] if not details["online"] else "",
+                details["description"],
+                details["sold_out"],
+            )
+            if record:
+                records.append(record)
+
+    return records
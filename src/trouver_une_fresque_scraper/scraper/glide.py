@@ -1,10 +1,18 @@
+import asyncio
 import json
 import logging
 
+from playwright.async_api import Page as AsyncPage
 from playwright.sync_api import Page, TimeoutError as PlaywrightTimeoutError
 
 from trouver_une_fresque_scraper.db.records import get_record_dict
-from trouver_une_fresque_scraper.utils.browser import managed_browser, DEFAULT_TIMEOUT
+from trouver_une_fresque_scraper.utils.browser import (
+    run_browser,
+    process_links,
+    wait_until_ready,
+    wait_until_ready_async,
+    DEFAULT_TIMEOUT,
+)
 from trouver_une_fresque_scraper.utils.date_and_time import get_dates
 from trouver_une_fresque_scraper.utils.errors import (
     FreskError,
@@ -18,25 +26,196 @@ from trouver_une_fresque_scraper.utils.keywords import (
 from trouver_une_fresque_scraper.utils.language import detect_language_code
 from trouver_une_fresque_scraper.utils.location import get_address
 
+# Glide apps download and render their whole data set on the first load
+INITIAL_LOAD_TIMEOUT = 60000  # milliseconds
+
+ITEMS_SELECTOR = "div.collection-item[role='button']"
+
 
-def collect_event_links(page: Page, source: dict) -> list[str]:
+class DataResponses:
     """
-    Collect all event links from a Glide listing page.
+    JSON responses received by a page, where a Glide app gets its table rows.
 
-    Clicks the filter tab, then iterates through all collection items
-    across pagination pages, collecting event URLs.
+    Bodies are only read when looked for, since most responses aren't needed.
     """
-    all_links = []
+
+    def __init__(self, page: Page):
+        self.responses = []
+        page.on("response", self.on_response)
+
+    def on_response(self, response):
+        if response.request.resource_type in ("xhr", "fetch") and "json" in response.headers.get(
+            "content-type", ""
+        ):
+            self.responses.append(response)
+
+    def clear(self):
+        self.responses = []
+
+    def payloads(self):
+        for response in self.responses:
+            try:
+                yield response.json()
+            except Exception as e:
+                logging.debug(f"Could not read response of {response.url}: {e}")
+
+
+def find_rows(data, row_id):
+    """
+    Find the table rows of a JSON payload, from the id of one of them.
+
+    Returns:
+        The list of rows containing a row whose value is row_id, and the key
+        of that value, or (None, None)
+    """
+    if isinstance(data, list):
+        for item in data:
+            if isinstance(item, dict):
+                for key, value in item.items():
+                    if value == row_id:
+                        return data, key
+        children = data
+    elif isinstance(data, dict):
+        children = data.values()
+    else:
+        return None, None
+
+    for child in children:
+        rows, key = find_rows(child, row_id)
+        if rows is not None:
+            return rows, key
+    return None, None
+
+
+def matches_filter(row: dict, text: str) -> bool:
+    """Whether a row has a column equal to the label of a filter tab."""
+    text = text.strip().casefold()
+    return any(isinstance(v, str) and v.strip().casefold() == text for v in row.values())
+
+
+def open_listing(page: Page, source: dict):
+    """Load a Glide listing page and click its filter tab."""
+    page.goto(source["url"], wait_until="domcontentloaded")
+    tab_selector = f"div.button-text:has-text('{source['filter']}')"
+    wait_until_ready(page, tab_selector, timeout=INITIAL_LOAD_TIMEOUT)
 
     # Click the filter tab button
-    tab_button = page.locator(f"div.button-text:has-text('{source['filter']}')")
+    tab_button = page.locator(tab_selector)
     tab_button.wait_for(state="visible", timeout=DEFAULT_TIMEOUT)
     tab_button.click()
-    page.wait_for_timeout(5000)
+    wait_until_ready(page, ITEMS_SELECTOR)
+
+
+def open_item(page: Page, items, index: int) -> str:
+    """Click a collection item, and return the URL of its page once back on the listing."""
+    listing_url = page.url
+    items.nth(index).click()
+    # Glide opens the event in the same document, changing the URL
+    page.wait_for_url(lambda url: url != listing_url, timeout=DEFAULT_TIMEOUT)
+    link = page.url
+
+    page.go_back()
+    wait_until_ready(page, ITEMS_SELECTOR)
+    return link
+
+
+def next_listing_page(page: Page) -> bool:
+    """
+    Click the "Next" pagination button if there is one.
+
+    Returns:
+        True once the next page is rendered, False on the last page
+    """
+    try:
+        page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
+        wait_until_ready(page)
+        next_button = page.locator("button[aria-label='Next']")
+        if not next_button.is_visible():
+            return False
+        first_item = page.locator(ITEMS_SELECTOR).first.text_content()
+        next_button.scroll_into_view_if_needed()
+        next_button.click()
+        # The next page is rendered once the first item has changed
+        page.wait_for_function(
+            "([selector, text]) => {"
+            "  const item = document.querySelector(selector);"
+            "  return item && item.textContent !== text;"
+            "}",
+            arg=[ITEMS_SELECTOR, first_item],
+            timeout=DEFAULT_TIMEOUT,
+        )
+        return True
+    except PlaywrightTimeoutError:
+        return False
+
+
+def collect_links_from_data(page: Page, source: dict, responses: DataResponses) -> list[str] | None:
+    """
+    Collect event links from the rows the Glide app downloaded, without
+    opening every collection item.
+
+    The first item is opened once, to learn the URL of event pages (which
+    ends with the row id) and find the table holding that row in the data
+    responses. Rows are then filtered like the filter tab does, and their
+    number is checked against the number of items of all listing pages.
+
+    Returns:
+        The event links, or None if the data responses can't be used
+    """
+    items = page.locator(ITEMS_SELECTOR)
+    try:
+        items.first.wait_for(state="visible", timeout=DEFAULT_TIMEOUT)
+    except PlaywrightTimeoutError:
+        return None
+
+    try:
+        first_link = open_item(page, items, 0)
+    except PlaywrightTimeoutError:
+        logging.info("The first collection item didn't open an event page")
+        return None
+    base_url, _, row_id = first_link.rpartition("/")
+    if not base_url or not row_id:
+        logging.info(f"No row id at the end of the event link {first_link}")
+        return None
+
+    for payload in responses.payloads():
+        rows, key = find_rows(payload, row_id)
+        if rows is not None:
+            break
+    else:
+        logging.info(f"Row {row_id} not found in the {len(responses.responses)} data responses")
+        return None
+
+    rows = [row for row in rows if isinstance(row, dict) and key in row]
+    filtered_rows = [row for row in rows if matches_filter(row, source["filter"])]
+    if any(row[key] == row_id for row in filtered_rows):
+        rows = filtered_rows
+    elif len(rows) != len(filtered_rows):
+        logging.info(f"Cannot tell which rows the '{source['filter']}' tab shows")
+        return None
+
+    item_count = page.locator(ITEMS_SELECTOR).count()
+    while next_listing_page(page):
+        item_count += page.locator(ITEMS_SELECTOR).count()
+    if item_count != len(rows):
+        logging.info(f"Found {len(rows)} rows in the data responses for {item_count} items")
+        return None
+
+    links = [f"{base_url}/{row[key]}" for row in rows]
+    logging.info(f"Total links collected from the data responses: {len(links)}")
+    return links
+
+
+def collect_links_by_clicking(page: Page, source: dict) -> list[str]:
+    """
+    Collect event links by opening every collection item of the listing,
+    across pagination pages.
+    """
+    all_links = []
 
     while True:
         # Wait for collection items to appear
-        items = page.locator("div.collection-item[role='button']")
+        items = page.locator(ITEMS_SELECTOR)
         try:
             items.first.wait_for(state="visible", timeout=DEFAULT_TIMEOUT)
         except PlaywrightTimeoutError:
@@ -48,7 +227,7 @@ def collect_event_links(page: Page, source: dict) -> list[str]:
 
         for i in range(item_count):
             # Re-query items each iteration (DOM may have changed after back navigation)
-            items = page.locator("div.collection-item[role='button']")
+            items = page.locator(ITEMS_SELECTOR)
 
             # Wait until the expected number of items is loaded again
             max_tries = 10
@@ -56,80 +235,92 @@ def collect_event_links(page: Page, source: dict) -> list[str]:
                 if items.count() == item_count:
                     break
                 page.reload()
-                page.wait_for_timeout(5000)
-                items = page.locator("div.collection-item[role='button']")
+                wait_until_ready(page, ITEMS_SELECTOR)
+                items = page.locator(ITEMS_SELECTOR)
             else:
                 raise RuntimeError(
                     f"Cannot load the {item_count} JS elements after {max_tries} tries."
                 )
 
-            items.nth(i).click()
-            page.wait_for_timeout(5000)
-
-            link = page.url
+            link = open_item(page, items, i)
             all_links.append(link)
             logging.info(f"Collected link: {link}")
 
-            page.go_back()
-            page.wait_for_timeout(5000)
-
-        # Try clicking the "Next" pagination button
-        try:
-            page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-            page.wait_for_timeout(2000)
-            next_button = page.locator("button[aria-label='Next']")
-            if next_button.is_visible(timeout=DEFAULT_TIMEOUT):
-                next_button.scroll_into_view_if_needed()
-                page.wait_for_timeout(2000)
-                next_button.click()
-                page.wait_for_timeout(2000)
-            else:
-                break
-        except PlaywrightTimeoutError:
+        if not next_listing_page(page):
             break
 
     logging.info(f"Total links collected: {len(all_links)}")
     return all_links
 
 
+def collect_event_links(page: Page, source: dict, responses: DataResponses = None) -> list[str]:
+    """
+    Collect all event links from a Glide listing page.
+
+    Builds the links from the rows of the app's data responses when
+    possible, and otherwise falls back to opening every collection item.
+    """
+    open_listing(page, source)
+
+    if responses is not None:
+        links = collect_links_from_data(page, source, responses)
+        if links is not None:
+            return links
+        logging.info("Falling back to opening every collection item")
+        open_listing(page, source)
+
+    return collect_links_by_clicking(page, source)
+
+
 # ==================== Main Entry Point ====================
 
 
-def get_glide_data(sources, service=None, options=None):
+def get_glide_data(
+    sources, service=None, options=None, page_workers=1, page_backend="threads", browser=None
+):
     """
     Scrape Glide events using Playwright.
 
     Args:
         sources: List of source page configurations (dicts with 'id', 'url', 'filter')
         service: Unused (kept for compatibility)
-        options: Unused (kept for compatibility)
+        options: Selenium options, only read for headless mode without a browser
+        page_workers: Number of pages processing event links concurrently
+        page_backend: "threads" (one thread per page) or "async" (one asyncio loop)
+        browser: BrowserManager shared by the scrapers of the run, or None to
+            start a browser for this scraper alone
 
     Returns:
         List of event records
     """
     logging.info("Scraping data from glide.page")
 
-    headless = False
-    if options and hasattr(options, "arguments") and len(options.arguments) > 0:
-        headless = "-headless" in options.arguments
-
-    with managed_browser(headless=headless) as browser:
-        context = browser.new_context()
+    with run_browser(browser, options) as browser, browser.context("glide") as context:
         page = context.new_page()
+        responses = DataResponses(page)
         records = []
 
         for source in sources:
             try:
                 logging.info(f"==================\nProcessing page {source}")
-                page.goto(source["url"], wait_until="domcontentloaded")
-                page.wait_for_timeout(20000)
+                responses.clear()
 
                 # Phase 1: Collect all event links across pagination pages
-                links = collect_event_links(page, source)
+                links = collect_event_links(page, source, responses)
 
                 # Phase 2: Process each event page
-                for link in links:
-                    event_record = process_event_page(page, link, source)
+                results = process_links(
+                    page,
+                    links,
+                    source,
+                    process_event_page,
+                    process_event_page_async,
+                    browser=browser,
+                    page_workers=page_workers,
+                    page_backend=page_backend,
+                    platform="glide",
+                )
+                for event_record in results:
                     if event_record:
                         records.append(event_record)
 
@@ -140,11 +331,227 @@ def get_glide_data(sources, service=None, options=None):
                 )
                 raise
 
-        context.close()
-
     return records
 
 
+def get_field_text(page: Page, label: str) -> str:
+    """Return the text of the value displayed next to a Glide field label."""
+    label_el = page.locator(f"li div:has-text('{label}')").first
+    label_el.wait_for(state="visible", timeout=DEFAULT_TIMEOUT)
+    parent_el = label_el.locator("xpath=..")
+    return parent_el.locator("> *:nth-child(2)").text_content()
+
+
+async def get_field_text_async(page: AsyncPage, label: str) -> str:
+    """Async version of get_field_text."""
+    label_el = page.locator(f"li div:has-text('{label}')").first
+    await label_el.wait_for(state="visible", timeout=DEFAULT_TIMEOUT)
+    parent_el = label_el.locator("xpath=..")
+    return await parent_el.locator("> *:nth-child(2)").text_content()
+
+
+def read_event_page(page: Page) -> dict:
+    """
+    Reads the raw fields of a Glide event page, see build_event_record.
+
+    The other fields aren't read when the event is canceled, and the
+    address is None when it is missing.
+
+    Args:
+        page: Playwright Page instance, on the event page
+    """
+    wait_until_ready(page, "h2.headlineSmall")
+
+    large_title_el = page.locator("h2.headlineMedium").first
+    try:
+        if large_title_el.is_visible(timeout=3000) and is_canceled(large_title_el.text_content()):
+            return {"canceled": True}
+    except PlaywrightTimeoutError:
+        pass
+
+    title_el = page.locator("h2.headlineSmall").first
+    title_el.wait_for(state="visible", timeout=DEFAULT_TIMEOUT)
+    fields = {
+        "canceled": False,
+        "title": title_el.text_content(),
+        "event_time": get_field_text(page, "Date").lower(),
+        "online": is_online(get_field_text(page, "Format")),
+        "full_location": "",
+    }
+
+    if not fields["online"]:
+        try:
+            fields["full_location"] = get_field_text(page, "Adresse")
+        except PlaywrightTimeoutError:
+            fields["full_location"] = None
+            return fields
+
+    fields["description"] = get_field_text(page, "Description")
+    fields["attendees"] = get_field_text(page, "participant")
+    return fields
+
+
+async def read_event_page_async(page: AsyncPage) -> dict:
+    """Async version of read_event_page."""
+    await wait_until_ready_async(page, "h2.headlineSmall")
+
+    large_title_el = page.locator("h2.headlineMedium").first
+    try:
+        if await large_title_el.is_visible(timeout=3000) and is_canceled(
+            await large_title_el.text_content()
+        ):
+            return {"canceled": True}
+    except PlaywrightTimeoutError:
+        pass
+
+    title_el = page.locator("h2.headlineSmall").first
+    await title_el.wait_for(state="visible", timeout=DEFAULT_TIMEOUT)
+    fields = {
+        "canceled": False,
+        "title": await title_el.text_content(),
+        "event_time": (await get_field_text_async(page, "Date")).lower(),
+        "online": is_online(await get_field_text_async(page, "Format")),
+        "full_location": "",
+    }
+
+    if not fields["online"]:
+        try:
+            fields["full_location"] = await get_field_text_async(page, "Adresse")
+        except PlaywrightTimeoutError:
+            fields["full_location"] = None
+            return fields
+
+    fields["description"] = await get_field_text_async(page, "Description")
+    fields["attendees"] = await get_field_text_async(page, "participant")
+    return fields
+
+
+def build_event_record(link: str, source: dict, fields: dict) -> dict | None:
+    """
+    Builds the record of a Glide event from the fields read on its page.
+
+    Args:
+        link: URL of the event page
+        source: Source page configuration dict
+        fields: Dict returned by read_event_page or read_event_page_async
+
+    Returns:
+        Event record dict, or None if the event should be skipped
+    """
+    ################################################################
+    # Is it canceled?
+    ################################################################
+    if fields["canceled"]:
+        logging.info("Rejecting record: canceled")
+        return None
+
+    ################################################################
+    # Parse event id
+    ################################################################
+    uuid = link.split("/")[-1]
+    if not uuid:
+        logging.info("Rejecting record: UUID not found")
+        return None
+
+    title = fields["title"]
+
+    ################################################################
+    # Parse start and end dates
+    ################################################################
+    try:
+        event_start_datetime, event_end_datetime = get_dates(fields["event_time"])
+    except FreskDateBadFormat as error:
+        logging.info(f"Rejecting record: {error}")
+        return None
+
+    ################################################################
+    # Location data
+    ################################################################
+    online = fields["online"]
+    full_location = fields["full_location"]
+    location_name = ""
+    address = ""
+    city = ""
+    department = ""
+    longitude = ""
+    latitude = ""
+    zip_code = ""
+    country_code = ""
+
+    if not online:
+        if full_location is None:
+            logging.info("Rejecting record: empty address")
+            return None
+
+        try:
+            address_dict = get_address(full_location)
+            (
+                location_name,
+                address,
+                city,
+                department,
+                zip_code,
+                country_code,
+                latitude,
+                longitude,
+            ) = address_dict.values()
+        except FreskError as error:
+            logging.info(f"Rejecting record: {error}.")
+            return None
+
+    description = fields["description"]
+
+    ################################################################
+    # Training?
+    ################################################################
+    training = is_training(title)
+
+    ################################################################
+    # Is it full?
+    ################################################################
+    parts = fields["attendees"].split("/")
+    sold_out = len(parts) == 2 and parts[0].strip() == parts[1].strip()
+
+    ################################################################
+    # Is it suited for kids?
+    ################################################################
+    kids = False
+
+    ################################################################
+    # Building final object
+    ################################################################
+    record = get_record_dict(
+        f"{source['id']}-{uuid}",
+        source["id"],
+        title,
+        event_start_datetime,
+        event_end_datetime,
+        full_location,
+        location_name,
+        address,
+        city,
+        department,
+        zip_code,
+        country_code,
+        latitude,
+        longitude,
+        source.get(
+            "language_code",
+            detect_language_code(title, description),
+        ),
+        online,
+        training,
+        sold_out,
+        kids,
+        link,
+        link,
+        description,
+    )
+
+    logging.info(f"Successfully scraped {link}\n{json.dumps(record, indent=4)}")
+    return record
+
+
 def process_event_page(page: Page, link: str, source: dict) -> dict | None:
     """
     Process a single Glide event page.
@@ -161,164 +568,28 @@ def process_event_page(page: Page, link: str, source: dict) -> dict | None:
 
     try:
         page.goto(link, wait_until="domcontentloaded")
-        page.wait_for_timeout(5000)
-
-        ################################################################
-        # Is it canceled?
-        ################################################################
-        large_title_el = page.locator("h2.headlineMedium").first
-        try:
-            if large_title_el.is_visible(timeout=3000):
-                large_title = large_title_el.text_content()
-                if is_canceled(large_title):
-                    logging.info("Rejecting record: canceled")
-                    return None
-        except PlaywrightTimeoutError:
-            pass
-
-        ################################################################
-        # Parse event id
-        ################################################################
-        uuid = link.split("/")[-1]
-        if not uuid:
-            logging.info("Rejecting record: UUID not found")
-            return None
-
-        ################################################################
-        # Parse event title
-        ################################################################
-        title_el = page.locator("h2.headlineSmall").first
-        title_el.wait_for(state="visible", timeout=DEFAULT_TIMEOUT)
-        title = title_el.text_content()
-
-        ################################################################
-        # Parse start and end dates
-        ################################################################
-        date_label_el = page.locator("li div:has-text('Date')").first
-        date_label_el.wait_for(state="visible", timeout=DEFAULT_TIMEOUT)
-        parent_el = date_label_el.locator("xpath=..")
-        event_time_el = parent_el.locator("> *:nth-child(2)")
-        event_time = event_time_el.text_content().lower()
+        return build_event_record(link, source, read_event_page(page))
 
-        try:
-            event_start_datetime, event_end_datetime = get_dates(event_time)
-        except FreskDateBadFormat as error:
-            logging.info(f"Rejecting record: {error}")
-            return None
+    except (FreskDateBadFormat, FreskError) as e:
+        logging.info(f"Skipping event {link}: {e}")
+        return None
+    except Exception as e:
+        logging.error(f"Unexpected error processing event page {link}: {e}", exc_info=True)
+        raise
 
-        ################################################################
-        # Is it an online event?
-        ################################################################
-        format_label_el = page.locator("li div:has-text('Format')").first
-        format_label_el.wait_for(state="visible", timeout=DEFAULT_TIMEOUT)
-        parent_el = format_label_el.locator("xpath=..")
-        online_el = parent_el.locator("> *:nth-child(2)")
-        online = is_online(online_el.text_content())
-
-        ################################################################
-        # Location data
-        ################################################################
-        full_location = ""
-        location_name = ""
-        address = ""
-        city = ""
-        department = ""
-        longitude = ""
-        latitude = ""
-        zip_code = ""
-        country_code = ""
-
-        if not online:
-            try:
-                address_label_el = page.locator("li div:has-text('Adresse')").first
-                address_label_el.wait_for(state="visible", timeout=DEFAULT_TIMEOUT)
-                parent_el = address_label_el.locator("xpath=..")
-                address_el = parent_el.locator("> *:nth-child(2)")
-                full_location = address_el.text_content()
-            except PlaywrightTimeoutError:
-                logging.info("Rejecting record: empty address")
-                return None
 
-            try:
-                address_dict = get_address(full_location)
-                (
-                    location_name,
-                    address,
-                    city,
-                    department,
-                    zip_code,
-                    country_code,
-                    latitude,
-                    longitude,
-                ) = address_dict.values()
-            except FreskError as error:
-                logging.info(f"Rejecting record: {error}.")
-                return None
-
-        ################################################################
-        # Description
-        ################################################################
-        description_label_el = page.locator("li div:has-text('Description')").first
-        description_label_el.wait_for(state="visible", timeout=DEFAULT_TIMEOUT)
-        parent_el = description_label_el.locator("xpath=..")
-        description_el = parent_el.locator("> *:nth-child(2)")
-        description = description_el.text_content()
-
-        ################################################################
-        # Training?
-        ################################################################
-        training = is_training(title)
-
-        ################################################################
-        # Is it full?
-        ################################################################
-        attendees_label_el = page.locator("li div:has-text('participant')").first
-        attendees_label_el.wait_for(state="visible", timeout=DEFAULT_TIMEOUT)
-        parent_el = attendees_label_el.locator("xpath=..")
-        attendees_el = parent_el.locator("> *:nth-child(2)")
-        attendees = attendees_el.text_content()
-
-        parts = attendees.split("/")
-        sold_out = len(parts) == 2 and parts[0].strip() == parts[1].strip()
-
-        ################################################################
-        # Is it suited for kids?
-        ################################################################
-        kids = False
-
-        ################################################################
-        # Building final object
-        ################################################################
-        record = get_record_dict(
-            f"{source['id']}-{uuid}",
-            source["id"],
-            title,
-            event_start_datetime,
-            event_end_datetime,
-            full_location,
-            location_name,
-            address,
-            city,
-            department,
-            zip_code,
-            country_code,
-            latitude,
-            longitude,
-            source.get(
-                "language_code",
-                detect_language_code(title, description),
-            ),
-            online,
-            training,
-            sold_out,
-            kids,
-            link,
-            link,
-            description,
-        )
+async def process_event_page_async(page: AsyncPage, link: str, source: dict) -> dict | None:
+    """
+    Process a single Glide event page with the async Playwright API, so that
+    many event pages can be loaded concurrently by a single browser.
+    """
+    logging.info(f"\n-> Processing {link} ...")
 
-        logging.info(f"Successfully scraped {link}\n{json.dumps(record, indent=4)}")
-        return record
+    try:
+        await page.goto(link, wait_until="domcontentloaded")
+        fields = await read_event_page_async(page)
+        # Geocoding is blocking, keep it off the event loop
+        return await asyncio.to_thread(build_event_record, link, source, fields)
 
     except (FreskDateBadFormat, FreskError) as e:
         logging.info(f"Skipping event {link}: {e}")
@@ -1,10 +1,18 @@
+import asyncio
 import json
 import logging
 
+from playwright.async_api import Page as AsyncPage
 from playwright.sync_api import Page, TimeoutError as PlaywrightTimeoutError
 
 from trouver_une_fresque_scraper.db.records import get_record_dict
-from trouver_une_fresque_scraper.utils.browser import managed_browser, DEFAULT_TIMEOUT
+from trouver_une_fresque_scraper.utils.browser import (
+    run_browser,
+    process_links,
+    wait_until_ready,
+    wait_until_ready_async,
+    DEFAULT_TIMEOUT,
+)
 from trouver_une_fresque_scraper.utils.date_and_time import get_dates
 from trouver_une_fresque_scraper.utils.errors import (
     FreskError,
@@ -46,8 +54,31 @@ def wait_for_turnstile(page: Page):
     try:
         turnstile_iframe.wait_for(state="hidden", timeout=TURNSTILE_WAIT_TIMEOUT)
         logging.info("Turnstile challenge resolved successfully")
-        # Give the page a moment to load after the challenge
-        page.wait_for_timeout(2000)
+        # Let the page load after the challenge
+        wait_until_ready(page)
+    except PlaywrightTimeoutError:
+        logging.warning(
+            f"Turnstile challenge did not resolve within {TURNSTILE_WAIT_TIMEOUT}ms. "
+            "The page may be blocked. If running in non-headless mode, "
+            "try checking the Turnstile checkbox manually."
+        )
+
+
+async def wait_for_turnstile_async(page: AsyncPage):
+    """Async counterpart of wait_for_turnstile."""
+    turnstile_iframe = page.locator('iframe[src*="challenges.cloudflare.com"]')
+    try:
+        await turnstile_iframe.wait_for(state="visible", timeout=3000)
+    except PlaywrightTimeoutError:
+        # No Turnstile challenge detected, continue normally
+        return
+
+    logging.info("Cloudflare Turnstile challenge detected, waiting for it to resolve...")
+    try:
+        await turnstile_iframe.wait_for(state="hidden", timeout=TURNSTILE_WAIT_TIMEOUT)
+        logging.info("Turnstile challenge resolved successfully")
+        # Let the page load after the challenge
+        await wait_until_ready_async(page)
     except PlaywrightTimeoutError:
         logging.warning(
             f"Turnstile challenge did not resolve within {TURNSTILE_WAIT_TIMEOUT}ms. "
@@ -63,7 +94,7 @@ def dismiss_cookie_modal(page: Page):
         reject_button.wait_for(state="visible", timeout=5000)
         reject_button.click()
         logging.info("Cookie consent modal dismissed")
-        page.wait_for_timeout(1000)
+        reject_button.wait_for(state="hidden", timeout=DEFAULT_TIMEOUT)
     except PlaywrightTimeoutError:
         logging.debug("Cookie consent modal not found or already dismissed")
     except Exception as e:
@@ -82,8 +113,9 @@ def collect_event_links(page: Page) -> list[str]:
         'button[data-ux="Explore_OrganizationPublicPage_Actions_ActionEvent_ShowAllActions"]'
     )
     try:
-        if show_all_button.is_visible(timeout=2000):
+        if show_all_button.is_visible():
             show_all_button.click()
+            wait_until_ready(page)
     except Exception:
         pass
 
@@ -101,26 +133,27 @@ def collect_event_links(page: Page) -> list[str]:
 # ==================== Main Entry Point ====================
 
 
-def get_helloasso_data(sources, service=None, options=None):
+def get_helloasso_data(
+    sources, service=None, options=None, page_workers=1, page_backend="threads", browser=None
+):
     """
     Scrape HelloAsso events using Playwright.
 
     Args:
         sources: List of source page configurations (dicts with 'id' and 'url')
         service: Unused (kept for compatibility)
-        options: Unused (kept for compatibility)
+        options: Selenium options, only read for headless mode without a browser
+        page_workers: Number of pages processing event links concurrently
+        page_backend: "threads" (one thread per page) or "async" (one asyncio loop)
+        browser: BrowserManager shared by the scrapers of the run, or None to
+            start a browser for this scraper alone
 
     Returns:
         List of event records
     """
     logging.info("Scraping data from helloasso.com")
 
-    headless = False
-    if options and hasattr(options, "arguments") and len(options.arguments) > 0:
-        headless = "-headless" in options.arguments
-
-    with managed_browser(headless=headless) as browser:
-        context = browser.new_context()
+    with run_browser(browser, options) as browser, browser.context("helloasso") as context:
         page = context.new_page()
         records = []
 
@@ -128,7 +161,7 @@ def get_helloasso_data(sources, service=None, options=None):
             try:
                 logging.info(f"==================\nProcessing page {source}")
                 page.goto(source["url"], wait_until="domcontentloaded")
-                page.wait_for_timeout(3000)
+                wait_until_ready(page)
 
                 # Handle Cloudflare Turnstile challenge if present
                 wait_for_turnstile(page)
@@ -140,8 +173,18 @@ def get_helloasso_data(sources, service=None, options=None):
                 links = collect_event_links(page)
 
                 # Process each event page
-                for link in links:
-                    event_record = process_event_page(page, link, source)
+                results = process_links(
+                    page,
+                    links,
+                    source,
+                    process_event_page,
+                    process_event_page_async,
+                    browser=browser,
+                    page_workers=page_workers,
+                    page_backend=page_backend,
+                    platform="helloasso",
+                )
+                for event_record in results:
                     if event_record:
                         records.append(event_record)
 
@@ -152,168 +195,267 @@ def get_helloasso_data(sources, service=None, options=None):
                 )
                 raise
 
-        context.close()
-
     return records
 
 
-def process_event_page(page: Page, link: str, source: dict) -> dict | None:
+def read_event_page(page: Page) -> dict:
     """
-    Process a single HelloAsso event page.
+    Reads the raw fields of a HelloAsso event page, see build_event_record.
+
+    A field missing from the page is None, and the fields after it aren't
+    read, as the event is rejected anyway.
+
+    Args:
+        page: Playwright Page instance, on the event page
+    """
+    # Handle Cloudflare Turnstile challenge if present
+    wait_for_turnstile(page)
+
+    title_el = page.locator("h1").first
+    title_el.wait_for(state="visible", timeout=DEFAULT_TIMEOUT)
+    fields = {
+        "title": title_el.text_content(),
+        "event_time": None,
+        "full_location": None,
+        "description": None,
+    }
+
+    date_info_el = page.locator("span.CampaignHeader--Date").first
+    try:
+        date_info_el.wait_for(state="visible", timeout=DEFAULT_TIMEOUT)
+    except PlaywrightTimeoutError:
+        return fields
+    fields["event_time"] = date_info_el.text_content().strip()
+
+    if is_online(fields["title"]):
+        fields["full_location"] = ""
+    else:
+        location_el = page.locator("section.CardAddress--Location").first
+        try:
+            location_el.wait_for(state="visible", timeout=DEFAULT_TIMEOUT)
+        except PlaywrightTimeoutError:
+            return fields
+        fields["full_location"] = location_el.text_content()
+
+    description_el = page.locator("div.CampaignHeader--Description").first
+    try:
+        description_el.wait_for(state="visible", timeout=DEFAULT_TIMEOUT)
+    except PlaywrightTimeoutError:
+        return fields
+    fields["description"] = description_el.text_content()
+    return fields
+
+
+async def read_event_page_async(page: AsyncPage) -> dict:
+    """Async version of read_event_page."""
+    # Handle Cloudflare Turnstile challenge if present
+    await wait_for_turnstile_async(page)
+
+    title_el = page.locator("h1").first
+    await title_el.wait_for(state="visible", timeout=DEFAULT_TIMEOUT)
+    fields = {
+        "title": await title_el.text_content(),
+        "event_time": None,
+        "full_location": None,
+        "description": None,
+    }
+
+    date_info_el = page.locator("span.CampaignHeader--Date").first
+    try:
+        await date_info_el.wait_for(state="visible", timeout=DEFAULT_TIMEOUT)
+    except PlaywrightTimeoutError:
+        return fields
+    fields["event_time"] = (await date_info_el.text_content()).strip()
+
+    if is_online(fields["title"]):
+        fields["full_location"] = ""
+    else:
+        location_el = page.locator("section.CardAddress--Location").first
+        try:
+            await location_el.wait_for(state="visible", timeout=DEFAULT_TIMEOUT)
+        except PlaywrightTimeoutError:
+            return fields
+        fields["full_location"] = await location_el.text_content()
+
+    description_el = page.locator("div.CampaignHeader--Description").first
+    try:
+        await description_el.wait_for(state="visible", timeout=DEFAULT_TIMEOUT)
+    except PlaywrightTimeoutError:
+        return fields
+    fields["description"] = await description_el.text_content()
+    return fields
+
+
+def build_event_record(link: str, source: dict, fields: dict) -> dict | None:
+    """
+    Builds the record of a HelloAsso event from the fields read on its page.
 
     Args:
-        page: Playwright Page instance
         link: URL of the event page
         source: Source page configuration dict
+        fields: Dict returned by read_event_page or read_event_page_async
 
     Returns:
         Event record dict, or None if the event should be skipped
     """
-    logging.info(f"\n-> Processing {link} ...")
+    ################################################################
+    # Parse event id
+    ################################################################
+    uuid = link.split("/")[-1]
+    if not uuid:
+        logging.info("Rejecting record: UUID not found")
+        return None
 
-    try:
-        page.goto(link, wait_until="domcontentloaded")
+    title = fields["title"]
+
+    ################################################################
+    # Parse start and end dates
+    ################################################################
+    if fields["event_time"] is None:
+        logging.info("Rejecting record: date not found")
+        return None
 
-        # Handle Cloudflare Turnstile challenge if present
-        wait_for_turnstile(page)
+    try:
+        event_start_datetime, event_end_datetime = get_dates(fields["event_time"])
+    except FreskDateBadFormat as error:
+        logging.info(f"Rejecting record: {error}")
+        return None
 
-        ################################################################
-        # Parse event id
-        ################################################################
-        uuid = link.split("/")[-1]
-        if not uuid:
-            logging.info("Rejecting record: UUID not found")
+    ################################################################
+    # Is it an online event?
+    ################################################################
+    online = is_online(title)
+
+    ################################################################
+    # Location data
+    ################################################################
+    full_location = fields["full_location"]
+    location_name = ""
+    address = ""
+    city = ""
+    department = ""
+    longitude = ""
+    latitude = ""
+    zip_code = ""
+    country_code = ""
+
+    if not online:
+        if full_location is None:
+            logging.info("Rejecting record: no location")
             return None
 
-        ################################################################
-        # Parse event title
-        ################################################################
-        title_el = page.locator("h1").first
-        title_el.wait_for(state="visible", timeout=DEFAULT_TIMEOUT)
-        title = title_el.text_content()
-
-        ################################################################
-        # Parse start and end dates
-        ################################################################
-        date_info_el = page.locator("span.CampaignHeader--Date").first
         try:
-            date_info_el.wait_for(state="visible", timeout=DEFAULT_TIMEOUT)
-        except PlaywrightTimeoutError:
-            logging.info("Rejecting record: date not found")
+            address_dict = get_address(full_location)
+            (
+                location_name,
+                address,
+                city,
+                department,
+                zip_code,
+                country_code,
+                latitude,
+                longitude,
+            ) = address_dict.values()
+        except FreskError as error:
+            logging.info(f"Rejecting record: {error}.")
             return None
 
-        event_time = date_info_el.text_content().strip()
+    ################################################################
+    # Description
+    ################################################################
+    description = fields["description"]
+    if description is None:
+        logging.info("Rejecting record: no description")
+        return None
 
-        try:
-            event_start_datetime, event_end_datetime = get_dates(event_time)
-        except FreskDateBadFormat as error:
-            logging.info(f"Rejecting record: {error}")
-            return None
+    ################################################################
+    # Training?
+    ################################################################
+    training = is_training(title)
+
+    ################################################################
+    # Is it full?
+    ################################################################
+    sold_out = False
+
+    ################################################################
+    # Is it suited for kids?
+    ################################################################
+    kids = is_for_kids(title)
+
+    ################################################################
+    # Building final object
+    ################################################################
+    record = get_record_dict(
+        f"{source['id']}-{uuid}",
+        source["id"],
+        title,
+        event_start_datetime,
+        event_end_datetime,
+        full_location,
+        location_name,
+        address,
+        city,
+        department,
+        zip_code,
+        country_code,
+        latitude,
+        longitude,
+        source.get(
+            "language_code",
+            detect_language_code(title, description),
+        ),
+        online,
+        training,
+        sold_out,
+        kids,
+        link,
+        link,
+        description,
+    )
 
-        ################################################################
-        # Is it an online event?
-        ################################################################
-        online = is_online(title)
-
-        ################################################################
-        # Location data
-        ################################################################
-        full_location = ""
-        location_name = ""
-        address = ""
-        city = ""
-        department = ""
-        longitude = ""
-        latitude = ""
-        zip_code = ""
-        country_code = ""
-
-        if not online:
-            location_el = page.locator("section.CardAddress--Location").first
-            try:
-                location_el.wait_for(state="visible", timeout=DEFAULT_TIMEOUT)
-            except PlaywrightTimeoutError:
-                logging.info("Rejecting record: no location")
-                return None
+    logging.info(f"Successfully scraped {link}\n{json.dumps(record, indent=4)}")
+    return record
 
-            full_location = location_el.text_content()
 
-            try:
-                address_dict = get_address(full_location)
-                (
-                    location_name,
-                    address,
-                    city,
-                    department,
-                    zip_code,
-                    country_code,
-                    latitude,
-                    longitude,
-                ) = address_dict.values()
-            except FreskError as error:
-                logging.info(f"Rejecting record: {error}.")
-                return None
-
-        ################################################################
-        # Description
-        ################################################################
-        description_el = page.locator("div.CampaignHeader--Description").first
-        try:
-            description_el.wait_for(state="visible", timeout=DEFAULT_TIMEOUT)
-        except PlaywrightTimeoutError:
-            logging.info("Rejecting record: no description")
-            return None
+def process_event_page(page: Page, link: str, source: dict) -> dict | None:
+    """
+    Process a single HelloAsso event page.
 
-        description = description_el.text_content()
-
-        ################################################################
-        # Training?
-        ################################################################
-        training = is_training(title)
-
-        ################################################################
-        # Is it full?
-        ################################################################
-        sold_out = False
-
-        ################################################################
-        # Is it suited for kids?
-        ################################################################
-        kids = is_for_kids(title)
-
-        ################################################################
-        # Building final object
-        ################################################################
-        record = get_record_dict(
-            f"{source['id']}-{uuid}",
-            source["id"],
-            title,
-            event_start_datetime,
-            event_end_datetime,
-            full_location,
-            location_name,
-            address,
-            city,
-            department,
-            zip_code,
-            country_code,
-            latitude,
-            longitude,
-            source.get(
-                "language_code",
-                detect_language_code(title, description),
-            ),
-            online,
-            training,
-            sold_out,
-            kids,
-            link,
-            link,
-            description,
-        )
+    Args:
+        page: Playwright Page instance
+        link: URL of the event page
+        source: Source page configuration dict
+
+    Returns:
+        Event record dict, or None if the event should be skipped
+    """
+    logging.info(f"\n-> Processing {link} ...")
+
+    try:
+        page.goto(link, wait_until="domcontentloaded")
+        return build_event_record(link, source, read_event_page(page))
 
-        logging.info(f"Successfully scraped {link}\n{json.dumps(record, indent=4)}")
-        return record
+    except (FreskDateBadFormat, FreskError) as e:
+        logging.info(f"Skipping event {link}: {e}")
+        return None
+    except Exception as e:
+        logging.error(f"Unexpected error processing event page {link}: {e}", exc_info=True)
+        raise
+
+
+async def process_event_page_async(page: AsyncPage, link: str, source: dict) -> dict | None:
+    """
+    Process a single HelloAsso event page with the async Playwright API, so
+    that many event pages can be loaded concurrently by a single browser.
+    """
+    logging.info(f"\n-> Processing {link} ...")
+
+    try:
+        await page.goto(link, wait_until="domcontentloaded")
+        fields = await read_event_page_async(page)
+        # Geocoding is blocking, keep it off the event loop
+        return await asyncio.to_thread(build_event_record, link, source, fields)
 
     except (FreskDateBadFormat, FreskError) as e:
         logging.info(f"Skipping event {link}: {e}")
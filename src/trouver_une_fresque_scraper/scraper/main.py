@@ -1,27 +1,43 @@
+import logging
+import logging.handlers
+import multiprocessing
 import os
 import pandas as pd
 
+from concurrent.futures import ProcessPoolExecutor
+
 from trouver_une_fresque_scraper.scraper.fdc import get_fdc_data
-from trouver_une_fresque_scraper.scraper.fec import get_fec_data
-from trouver_une_fresque_scraper.scraper.billetweb import get_billetweb_data
+from trouver_une_fresque_scraper.scraper.fec_http import get_fec_http_data
+from trouver_une_fresque_scraper.scraper.billetweb_http import get_billetweb_http_data
 from trouver_une_fresque_scraper.scraper.eventbrite_new import get_eventbrite_new_data
 from trouver_une_fresque_scraper.scraper.glide import get_glide_data
 from trouver_une_fresque_scraper.scraper.helloasso import get_helloasso_data
 from selenium.webdriver.firefox.options import Options as FirefoxOptions
 from selenium.webdriver.firefox.service import Service
+from trouver_une_fresque_scraper.utils.browser import BrowserManager
+from trouver_une_fresque_scraper.utils.location import log_geocode_cache_stats
 from trouver_une_fresque_scraper.utils.utils import get_config
 
 SCRAPER_FNS = {
-    "billetweb.fr": get_billetweb_data,
+    "billetweb.fr": get_billetweb_http_data,
     "climatefresk.org": get_fdc_data,
     "eventbrite.com": get_eventbrite_new_data,
     "eventbrite.fr": get_eventbrite_new_data,
     "fresqueduclimat.org": get_fdc_data,
-    "lafresquedeleconomiecirculaire.com": get_fec_data,
+    "lafresquedeleconomiecirculaire.com": get_fec_http_data,
     "1erdegre.glide.page": get_glide_data,
     "helloasso.com": get_helloasso_data,
 }
 
+# Scrapers running on Playwright, which accept extra keyword arguments, and
+# the platform of their browser contexts
+PLAYWRIGHT_FNS = {
+    get_eventbrite_new_data: "eventbrite",
+    get_fdc_data: "fdc",
+    get_glide_data: "glide",
+    get_helloasso_data: "helloasso",
+}
+
 
 def get_webdriver_executable():
     webdriver_path = get_config("webdriver")
@@ -30,9 +46,7 @@ def get_webdriver_executable():
     return webdriver_path
 
 
-def main(scrapers, headless=False):
-    records = []
-
+def get_webdriver_service_and_options(headless=False):
     # geckodriver
     service = Service(executable_path=get_webdriver_executable())
 
@@ -45,6 +59,10 @@ def main(scrapers, headless=False):
     if headless:
         options.add_argument("-headless")
 
+    return service, options
+
+
+def sort_workshops(scrapers):
     sorted_workshops = {}
 
     # Make sure that we have a scraper available for each fresk entry
@@ -56,8 +74,166 @@ def main(scrapers, headless=False):
                     sorted_workshops[fn_value] = []
                 sorted_workshops[fn_value].append(workshop)
 
-    for fn_key, sourcev in sorted_workshops.items():
-        records += fn_key(sourcev, service=service, options=options)
+    return sorted_workshops
+
+
+def get_scraper_kwargs(fn, page_workers=1, page_backend="threads", browser=None):
+    if fn in PLAYWRIGHT_FNS:
+        return {"page_workers": page_workers, "page_backend": page_backend, "browser": browser}
+    return {}
+
+
+def get_browser_manager(sorted_workshops, headless=False, checkpoint=None):
+    """
+    Returns the BrowserManager shared by the Playwright scrapers among the keys
+    of sorted_workshops, with a warm context for each time they will need one:
+    once per scraper, or once per source left to scrape with a checkpoint.
+    """
+    platforms = []
+    for fn, sources in sorted_workshops.items():
+        if fn in PLAYWRIGHT_FNS:
+            uses = 1 if checkpoint is None else len(checkpoint.pending_sources(sources))
+            platforms += [PLAYWRIGHT_FNS[fn]] * uses
+    return BrowserManager(headless=headless, platforms=platforms)
+
+
+def scrape_sources(fn, sources, checkpoint=None, **kwargs):
+    """
+    Runs a platform scraper on its sources.
+
+    With a checkpoint, sources are scraped one at a time so that each of them
+    is saved as soon as it is completed, and a failing source doesn't stop
+    the others.
+    """
+    if checkpoint is None:
+        return fn(sources, **kwargs)
+
+    records = []
+    for source in sources:
+        records += checkpoint.run(source, lambda: fn([source], **kwargs))
+    return records
+
+
+def init_worker(log_queue):
+    """
+    Initializes a worker process of a parallel run.
+
+    Workers are spawned, so they start without the logging configuration of
+    the main process: their records are sent to it through log_queue. The
+    geocoder, its cache and the shared Nominatim rate limit are set up when
+    the worker imports utils.location.
+    """
+    logger = logging.getLogger()
+    logger.handlers.clear()
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    logger.setLevel(logging.INFO)
+
+
+def run_scraper(
+    fn, sources, headless=False, page_workers=1, page_backend="threads", checkpoint=None
+):
+    """
+    Runs a single platform scraper with its own Selenium service and options.
+
+    This is the unit of work executed by each worker process in parallel mode.
+    Selenium services and options, and the Playwright browser, are built
+    inside the worker, so that every process owns its browser.
+    """
+    service, options = get_webdriver_service_and_options(headless=headless)
+    try:
+        with get_browser_manager({fn: sources}, headless, checkpoint) as browser:
+            return scrape_sources(
+                fn,
+                sources,
+                checkpoint,
+                service=service,
+                options=options,
+                **get_scraper_kwargs(fn, page_workers, page_backend, browser),
+            )
+    finally:
+        log_geocode_cache_stats()
+
+
+def main(
+    scrapers,
+    headless=False,
+    parallel=False,
+    max_workers=None,
+    page_workers=1,
+    page_backend="threads",
+    checkpoint=None,
+):
+    """
+    Runs all the scrapers needed for the given sources.
+
+    Args:
+        scrapers: List of source configurations of type "scraper"
+        headless: Run the browsers in headless mode
+        parallel: Run each platform scraper in its own worker process
+        max_workers: Maximum number of concurrent worker processes in parallel
+            mode (defaults to one process per platform)
+        page_workers: Number of pages processing event links concurrently in
+            each Playwright scraper
+        page_backend: "threads" or "async", see utils.browser.process_links
+        checkpoint: utils.checkpoint.Checkpoint saving the records of each
+            source, and recording failures instead of raising them
+
+    Returns:
+        DataFrame of event records
+    """
+    records = []
+
+    sorted_workshops = sort_workshops(scrapers)
+
+    if not parallel:
+        service, options = get_webdriver_service_and_options(headless=headless)
+        # A single browser for all the Playwright scrapers
+        with get_browser_manager(sorted_workshops, headless, checkpoint) as browser:
+            for fn_key, sourcev in sorted_workshops.items():
+                records += scrape_sources(
+                    fn_key,
+                    sourcev,
+                    checkpoint,
+                    service=service,
+                    options=options,
+                    **get_scraper_kwargs(fn_key, page_workers, page_backend, browser),
+                )
+        return pd.DataFrame(records)
+
+    if max_workers is None:
+        max_workers = len(sorted_workshops)
+    max_workers = max(1, min(max_workers, len(sorted_workshops)))
+    logging.info(
+        f"Running {len(sorted_workshops)} platform scrapers in parallel "
+        f"({max_workers} worker processes)"
+    )
+
+    # Spawned rather than forked, so that workers don't inherit the threads
+    # (geocoding, cache) and locks of this process in an unknown state
+    mp_context = multiprocessing.get_context("spawn")
+    log_queue = mp_context.Queue()
+    log_listener = logging.handlers.QueueListener(
+        log_queue, *logging.getLogger().handlers, respect_handler_level=True
+    )
+    log_listener.start()
+    try:
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=mp_context,
+            initializer=init_worker,
+            initargs=(log_queue,),
+        ) as executor:
+            futures = [
+                executor.submit(
+                    run_scraper, fn_key, sourcev, headless, page_workers, page_backend, checkpoint
+                )
+                for fn_key, sourcev in sorted_workshops.items()
+            ]
+            # Merge in submission order so that the output stays deterministic
+            for future in futures:
+                records += future.result()
+    finally:
+        log_listener.stop()
 
     return pd.DataFrame(records)
 
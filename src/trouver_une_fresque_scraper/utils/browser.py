@@ -1,35 +1,655 @@
+import asyncio
+import inspect
 import logging
-from contextlib import contextmanager
+import os
+import queue
+import socket
+import threading
+import time
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack, asynccontextmanager, contextmanager
+from urllib.parse import urlparse
 
-from playwright.sync_api import sync_playwright
+from playwright.async_api import async_playwright
+from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeoutError
 from playwright_stealth import Stealth
 
 
 DEFAULT_TIMEOUT = 10000  # milliseconds
 
+# Lower bound of the adaptive timeouts of readiness waits, which start at
+# DEFAULT_TIMEOUT (see AdaptiveTimeout)
+MIN_READY_TIMEOUT = 2000  # milliseconds
+
+# Longest wait for the network to go quiet after a page became ready. Pages
+# polling a server never do, so reaching it is not an error.
+NETWORK_IDLE_TIMEOUT = 3000  # milliseconds
+
 # Stealth instance configured for French locale (most HelloAsso users are French).
 # Automatically patches navigator.webdriver, user-agent, plugins, WebGL, etc.
 _stealth = Stealth(
     navigator_languages_override=("fr-FR", "fr"),
 )
 
+# Resource types that are never needed to read text, __NEXT_DATA__ and attributes
+BLOCKED_RESOURCE_TYPES = {"image", "font", "media"}
+
+# Analytics, ads and video embeds, blocked on every platform
+BLOCKED_DOMAINS = [
+    "google-analytics.com",
+    "googletagmanager.com",
+    "googleadservices.com",
+    "doubleclick.net",
+    "facebook.net",
+    "connect.facebook.net",
+    "hotjar.com",
+    "clarity.ms",
+    "bat.bing.com",
+    "segment.io",
+    "segment.com",
+    "mixpanel.com",
+    "amplitude.com",
+    "tiktok.com",
+    "snap.licdn.com",
+    "youtube.com",
+    "ytimg.com",
+    "vimeo.com",
+]
+
+# Per-platform overrides: "allow_domains" always go through, "block_domains" and
+# "block_types" are added to the defaults above.
+RESOURCE_FILTERS = {
+    "fdc": {},
+    "glide": {},
+    "eventbrite": {},
+    "helloasso": {
+        # Cloudflare Turnstile must load for the challenge to resolve
+        "allow_domains": ["challenges.cloudflare.com"],
+    },
+}
+
+# Set PLAYWRIGHT_RESOURCE_FILTER=0 to let every request through (for debugging)
+_resource_filter_enabled = os.environ.get("PLAYWRIGHT_RESOURCE_FILTER", "1") != "0"
+
+# Set PLAYWRIGHT_RESOURCE_FILTER_MEASURE=1 to send a HEAD request for each
+# blocked resource, so that the number of bytes saved can be reported.
+_resource_filter_measure = os.environ.get("PLAYWRIGHT_RESOURCE_FILTER_MEASURE", "0") == "1"
+
+
+def _domain_matches(url, domains):
+    parsed = urlparse(url)
+    host = parsed.hostname or ""
+    location = host + parsed.path
+    for domain in domains:
+        if host == domain or host.endswith("." + domain) or location.startswith(domain):
+            return True
+    return False
+
+
+class ResourceFilter:
+    """Blocks the requests of a Playwright context that scrapers don't need.
+
+    Images, fonts, media and third-party trackers are aborted, according to the
+    rules of the platform in RESOURCE_FILTERS. Blocked requests are counted by
+    resource type, along with the bytes actually downloaded (from the
+    Content-Length of the responses), and the bytes saved when
+    PLAYWRIGHT_RESOURCE_FILTER_MEASURE is set.
+    """
+
+    def __init__(self, platform):
+        rules = RESOURCE_FILTERS.get(platform, {})
+        self.platform = platform
+        self.blocked_types = BLOCKED_RESOURCE_TYPES | set(rules.get("block_types", []))
+        self.blocked_domains = BLOCKED_DOMAINS + rules.get("block_domains", [])
+        self.allowed_domains = rules.get("allow_domains", [])
+        self.blocked = Counter()
+        self.downloaded_bytes = 0
+        self.saved_bytes = 0
+        self._lock = threading.Lock()
+
+    def should_block(self, url, resource_type):
+        if _domain_matches(url, self.allowed_domains):
+            return False
+        if resource_type in self.blocked_types:
+            return True
+        return _domain_matches(url, self.blocked_domains)
+
+    def _count_blocked(self, resource_type, content_length=None):
+        with self._lock:
+            self.blocked[resource_type] += 1
+            if content_length:
+                self.saved_bytes += int(content_length)
+
+    def on_response(self, response):
+        content_length = response.headers.get("content-length")
+        if content_length and content_length.isdigit():
+            with self._lock:
+                self.downloaded_bytes += int(content_length)
+
+    def handle_route(self, route):
+        request = route.request
+        if not self.should_block(request.url, request.resource_type):
+            route.continue_()
+            return
+
+        content_length = None
+        if _resource_filter_measure:
+            try:
+                content_length = route.fetch(method="HEAD").headers.get("content-length")
+            except Exception:
+                pass
+        self._count_blocked(request.resource_type, content_length)
+        route.abort()
+
+    async def handle_route_async(self, route):
+        request = route.request
+        if not self.should_block(request.url, request.resource_type):
+            await route.continue_()
+            return
+
+        content_length = None
+        if _resource_filter_measure:
+            try:
+                content_length = (await route.fetch(method="HEAD")).headers.get("content-length")
+            except Exception:
+                pass
+        self._count_blocked(request.resource_type, content_length)
+        await route.abort()
+
+    def log_stats(self):
+        if not self.blocked and not self.downloaded_bytes:
+            # Context closed unused, e.g. from the warm pool
+            return
+        blocked = ", ".join(f"{k}: {v}" for k, v in self.blocked.most_common())
+        message = (
+            f"Resource filter ({self.platform}): blocked {sum(self.blocked.values())} "
+            f"requests ({blocked or 'none'}), downloaded {self.downloaded_bytes / 1e6:.1f} MB"
+        )
+        if _resource_filter_measure:
+            message += f", saved {self.saved_bytes / 1e6:.1f} MB"
+        logging.info(message)
+
+
+def new_context(browser, platform=None, **kwargs):
+    """Create a browser context, filtering resources according to the platform rules.
+
+    Without a platform (or with PLAYWRIGHT_RESOURCE_FILTER=0), this is a plain
+    browser.new_context(). Filtering statistics are logged when the context
+    is closed.
+    """
+    context = browser.new_context(**kwargs)
+    if platform and _resource_filter_enabled:
+        resource_filter = ResourceFilter(platform)
+        context.route("**/*", resource_filter.handle_route)
+        context.on("response", resource_filter.on_response)
+        context.on("close", lambda _: resource_filter.log_stats())
+    return context
+
+
+async def new_context_async(browser, platform=None, **kwargs):
+    """Async counterpart of new_context."""
+    context = await browser.new_context(**kwargs)
+    if platform and _resource_filter_enabled:
+        resource_filter = ResourceFilter(platform)
+        await context.route("**/*", resource_filter.handle_route_async)
+        context.on("response", resource_filter.on_response)
+        context.on("close", lambda _: resource_filter.log_stats())
+    return context
+
+
+class AdaptiveTimeout:
+    """Timeout of a recurring readiness wait, adapted to how long it takes.
+
+    Starts at `maximum`, then follows `factor` times the slowest of the last
+    `window` successful waits, never below `minimum`. A wait that times out
+    resets it to `maximum`, so that a slow page doesn't make every following
+    wait fail.
+    """
+
+    def __init__(self, minimum=MIN_READY_TIMEOUT, maximum=DEFAULT_TIMEOUT, factor=3, window=20):
+        self.minimum = minimum
+        self.maximum = maximum
+        self.factor = factor
+        self._durations = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    @property
+    def value(self):
+        with self._lock:
+            if not self._durations:
+                return self.maximum
+            slowest = self.factor * max(self._durations)
+            return int(min(self.maximum, max(self.minimum, slowest)))
+
+    def record(self, duration):
+        with self._lock:
+            self._durations.append(duration)
+
+    def record_timeout(self):
+        with self._lock:
+            self._durations.clear()
+
+
+_adaptive_timeouts = {}
+_adaptive_timeouts_lock = threading.Lock()
+
+
+def adaptive_timeout(name):
+    """Returns the AdaptiveTimeout shared by all the waits called `name`."""
+    with _adaptive_timeouts_lock:
+        return _adaptive_timeouts.setdefault(name, AdaptiveTimeout())
+
+
+def run_steps(steps):
+    """Runs page steps with the sync Playwright API, and returns their result.
+
+    Page steps are generators written once for both Playwright APIs: they
+    yield each Playwright call, and get its result back from the yield. With
+    the sync API, calls have already run when they are yielded; with the
+    async API, run_steps_async awaits them, and raises their exceptions at
+    the yield. Steps run other steps with `yield from`.
+    """
+    result = None
+    while True:
+        try:
+            result = steps.send(result)
+        except StopIteration as stop:
+            return stop.value
+
+
+async def run_steps_async(steps):
+    """Runs page steps with the async Playwright API, see run_steps."""
+    result, error = None, None
+    while True:
+        try:
+            step = steps.throw(error) if error is not None else steps.send(result)
+        except StopIteration as stop:
+            return stop.value
+        try:
+            result, error = (await step if inspect.isawaitable(step) else step), None
+        except Exception as e:
+            result, error = None, e
+
+
+def wait_for_steps(locator, state="visible", name=None, timeout=None):
+    """Page steps of wait_for."""
+    timer = adaptive_timeout(name) if name and timeout is None else None
+    if timeout is None:
+        timeout = timer.value if timer else DEFAULT_TIMEOUT
+    start = time.monotonic()
+    try:
+        yield locator.wait_for(state=state, timeout=timeout)
+    except PlaywrightTimeoutError:
+        logging.debug(f"Timed out after {timeout}ms waiting for {name or locator} ({state})")
+        if timer:
+            timer.record_timeout()
+        return False
+    if timer:
+        timer.record((time.monotonic() - start) * 1000)
+    return True
+
+
+def wait_for(locator, state="visible", name=None, timeout=None):
+    """Wait for a locator to reach a state, instead of sleeping a fixed delay.
+
+    Waits sharing a `name` get an adaptive timeout, learned from how long they
+    took so far, unless an explicit timeout is given.
+
+    Returns:
+        True if the state was reached, False on timeout
+    """
+    return run_steps(wait_for_steps(locator, state, name, timeout))
+
+
+async def wait_for_async(locator, state="visible", name=None, timeout=None):
+    """Async counterpart of wait_for."""
+    return await run_steps_async(wait_for_steps(locator, state, name, timeout))
+
+
+def wait_until_ready_steps(page, selector=None, state="visible", timeout=None, network_idle=True):
+    """Page steps of wait_until_ready."""
+    ready = True
+    if selector is not None:
+        ready = yield from wait_for_steps(
+            page.locator(selector).first, state=state, name=selector, timeout=timeout
+        )
+    if network_idle:
+        try:
+            yield page.wait_for_load_state("networkidle", timeout=NETWORK_IDLE_TIMEOUT)
+        except PlaywrightTimeoutError:
+            logging.debug(f"Network still busy after {NETWORK_IDLE_TIMEOUT}ms on {page.url}")
+    return ready
+
+
+def wait_until_ready(page, selector=None, state="visible", timeout=None, network_idle=True):
+    """Wait for a page to be ready to scrape.
+
+    Waits for the first element matching `selector` (if any) with an adaptive
+    timeout, then for the network to be idle for at most NETWORK_IDLE_TIMEOUT,
+    so that data loaded by scripts has arrived.
+
+    Returns:
+        True if the selector was found (or none was given), False on timeout
+    """
+    return run_steps(wait_until_ready_steps(page, selector, state, timeout, network_idle))
+
+
+async def wait_until_ready_async(
+    page, selector=None, state="visible", timeout=None, network_idle=True
+):
+    """Async counterpart of wait_until_ready."""
+    return await run_steps_async(
+        wait_until_ready_steps(page, selector, state, timeout, network_idle)
+    )
+
+
+def wait_for_more(page, selector, count, timeout=DEFAULT_TIMEOUT):
+    """Wait until more than `count` elements match `selector`.
+
+    Used after clicking a "show more" button, to proceed as soon as the next
+    batch has been rendered.
+
+    Returns:
+        True if new elements appeared, False on timeout
+    """
+    try:
+        page.wait_for_function(
+            "([selector, count]) => document.querySelectorAll(selector).length > count",
+            arg=[selector, count],
+            timeout=timeout,
+        )
+        return True
+    except PlaywrightTimeoutError:
+        return False
+
+
+def free_port():
+    """Returns a local TCP port that is free at the time of the call."""
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
 
 @contextmanager
-def managed_browser(headless=False):
+def managed_browser(headless=False, debugging_port=None):
     """Context manager for a stealth Playwright browser.
 
     Uses playwright-stealth to hide automation signals (navigator.webdriver,
     headless indicators, etc.) so that Cloudflare Turnstile and similar
     challenges are less likely to trigger.
 
+    With a debugging_port, the browser also accepts local CDP connections,
+    so that other threads can drive it (see connected_browser).
+
     Yields a Chromium browser instance managed by Playwright.
     Ensures proper cleanup of both browser and Playwright on exit.
     """
+    args = [f"--remote-debugging-port={debugging_port}"] if debugging_port else []
     with _stealth.use_sync(sync_playwright()) as playwright:
-        browser = playwright.chromium.launch(headless=headless)
+        browser = playwright.chromium.launch(headless=headless, args=args)
         logging.info("Playwright stealth browser initialized successfully")
         try:
             yield browser
         finally:
             browser.close()
             logging.info("Browser closed successfully")
+
+
+@contextmanager
+def connected_browser(cdp_endpoint):
+    """Yields a browser already running at cdp_endpoint, for the calling thread.
+
+    The sync Playwright API is bound to the thread that started it: each
+    thread connects with its own Playwright instance, with the same stealth
+    settings, and disconnects on exit, leaving the browser running.
+    """
+    with _stealth.use_sync(sync_playwright()) as playwright:
+        yield playwright.chromium.connect_over_cdp(cdp_endpoint)
+
+
+@asynccontextmanager
+async def connected_async_browser(cdp_endpoint):
+    """Async counterpart of connected_browser, with the same stealth settings.
+
+    Yields the browser at cdp_endpoint driven by the asyncio Playwright API,
+    so that many pages can be loading at the same time in a single thread.
+    """
+    async with _stealth.use_async(async_playwright()) as playwright:
+        yield await playwright.chromium.connect_over_cdp(cdp_endpoint)
+
+
+class BrowserManager:
+    """Stealth Chromium browser shared by all the Playwright scrapers of a run.
+
+    The browser is started on first use, so that runs without Playwright
+    scrapers don't pay for it. Each scraper gets its own context, isolating
+    cookies and storage, with the resource filter of its platform.
+
+    Contexts of the platforms announced at creation are kept ready in a warm
+    pool: one of each is created when the browser starts, and replaced as soon
+    as it has been used, so that scrapers (and each source of a checkpointed
+    run) start on a fresh context without waiting for it. Platforms are
+    announced once per expected use, and a context isn't replaced after the
+    last one.
+
+    The sync Playwright API is bound to the thread that started it: the
+    manager must be used from that thread only, and each worker process of
+    a parallel run has its own. Other threads reach the same browser through
+    cdp_endpoint and connected_browser.
+    """
+
+    def __init__(self, headless=False, platforms=()):
+        self.headless = headless
+        self.platforms = Counter(platforms)
+        self.cdp_endpoint = None
+        self._stack = None
+        self._browser = None
+        self._pool = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    @property
+    def browser(self):
+        if self._browser is None:
+            port = free_port()
+            self._stack = ExitStack()
+            self._browser = self._stack.enter_context(
+                managed_browser(headless=self.headless, debugging_port=port)
+            )
+            self.cdp_endpoint = f"http://127.0.0.1:{port}"
+            for platform in self.platforms:
+                self._pool[platform] = new_context(self._browser, platform)
+        return self._browser
+
+    @contextmanager
+    def context(self, platform=None):
+        """Yields a fresh context for a platform, closed on exit."""
+        browser = self.browser
+        context = self._pool.pop(platform, None) or new_context(browser, platform)
+        if self.platforms[platform] > 0:
+            self.platforms[platform] -= 1
+        try:
+            yield context
+        finally:
+            context.close()
+            if self.platforms[platform] > 0 and self._browser is not None:
+                self._pool[platform] = new_context(browser, platform)
+
+    def close(self):
+        if self._browser is None:
+            return
+        for context in self._pool.values():
+            context.close()
+        self._pool = {}
+        self._browser = None
+        self.cdp_endpoint = None
+        self._stack.close()
+
+
+def headless_from_options(options):
+    """Whether Selenium Firefox options ask for headless mode."""
+    if options and hasattr(options, "arguments") and len(options.arguments) > 0:
+        return "-headless" in options.arguments
+    return False
+
+
+@contextmanager
+def run_browser(browser=None, options=None):
+    """Yields the BrowserManager of the run, or else one for a single scraper.
+
+    Without a shared browser, scrapers called on their own start one, headless
+    if the Selenium options are.
+    """
+    if browser is not None:
+        yield browser
+        return
+    with BrowserManager(headless=headless_from_options(options)) as browser:
+        yield browser
+
+
+async def gather_event_pages(
+    browser, links, source, process_event_page_async, concurrency, platform=None
+):
+    """Process event links concurrently on an async browser.
+
+    Each link gets its own page in a shared context, and at most `concurrency`
+    pages are open at the same time. Results are returned in link order.
+    """
+    context = await new_context_async(browser, platform)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def process(link):
+        async with semaphore:
+            page = await context.new_page()
+            try:
+                return await process_event_page_async(page, link, source)
+            finally:
+                await page.close()
+
+    try:
+        return await asyncio.gather(*(process(link) for link in links))
+    finally:
+        await context.close()
+
+
+def process_links_async(
+    links, source, process_event_page_async, cdp_endpoint, concurrency=1, platform=None
+):
+    """Process event links with the async backend, from synchronous code.
+
+    The event loop connects to the browser at cdp_endpoint, that of the run.
+    It runs in a dedicated thread: the calling thread may already be driving
+    a sync Playwright instance, which doesn't allow starting an asyncio loop
+    alongside it.
+    """
+    logging.info(f"Processing {len(links)} event pages with {concurrency} async pages")
+
+    async def run():
+        async with connected_async_browser(cdp_endpoint) as browser:
+            return await gather_event_pages(
+                browser, links, source, process_event_page_async, concurrency, platform
+            )
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, run()).result()
+
+
+def process_links(
+    page,
+    links,
+    source,
+    process_event_page,
+    process_event_page_async=None,
+    browser=None,
+    page_workers=1,
+    page_backend="threads",
+    platform=None,
+):
+    """Process event links, optionally with a pool of pages working in parallel.
+
+    With page_workers <= 1, links are processed one at a time on the given page.
+    Otherwise, with the "threads" backend, page_workers threads connect to the
+    browser of the run, each with its own context and page (the sync Playwright
+    API can't be shared across threads), and take links off a shared queue.
+    With the "async" backend, an asyncio loop connected to the same browser
+    keeps up to page_workers pages in flight.
+
+    Results are returned in the original link order so that the output stays
+    deterministic. If a worker raises, the remaining links are abandoned and
+    the first exception is re-raised.
+
+    Args:
+        page: Playwright Page used in sequential mode
+        links: List of event page URLs
+        source: Source page configuration dict
+        process_event_page: Function (page, link, source) -> result
+        process_event_page_async: Coroutine function (page, link, source) ->
+            result, used by the "async" backend
+        browser: BrowserManager of the run, whose browser the workers share
+        page_workers: Number of pages processing links concurrently
+        page_backend: Either "threads" or "async"
+        platform: Platform name in RESOURCE_FILTERS, for the worker contexts
+
+    Returns:
+        List of process_event_page results, one per link
+    """
+    if page_workers <= 1 or len(links) <= 1:
+        return [process_event_page(page, link, source) for link in links]
+
+    # Start the browser from this thread if needed, before workers connect to it
+    browser.browser
+    cdp_endpoint = browser.cdp_endpoint
+
+    if page_backend == "async":
+        if process_event_page_async is None:
+            raise ValueError("The async page backend requires process_event_page_async")
+        return process_links_async(
+            links,
+            source,
+            process_event_page_async,
+            cdp_endpoint,
+            concurrency=page_workers,
+            platform=platform,
+        )
+
+    page_workers = min(page_workers, len(links))
+    logging.info(f"Processing {len(links)} event pages with {page_workers} pages")
+
+    results = [None] * len(links)
+    errors = []
+    pending = queue.Queue()
+    for index, link in enumerate(links):
+        pending.put((index, link))
+
+    def worker():
+        try:
+            with connected_browser(cdp_endpoint) as shared_browser:
+                context = new_context(shared_browser, platform)
+                try:
+                    worker_page = context.new_page()
+                    while not errors:
+                        try:
+                            index, link = pending.get_nowait()
+                        except queue.Empty:
+                            break
+                        results[index] = process_event_page(worker_page, link, source)
+                finally:
+                    context.close()
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker) for _ in range(page_workers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    if errors:
+        raise errors[0]
+
+    return results
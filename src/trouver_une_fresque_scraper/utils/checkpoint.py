@@ -0,0 +1,123 @@
+import fcntl
+import hashlib
+import json
+import logging
+import os
+import threading
+
+from contextlib import contextmanager
+from pathlib import Path
+
+MANIFEST_FILE = "manifest.json"
+
+
+def source_key(source):
+    """Returns a file-name-safe key identifying a source configuration."""
+    digest = hashlib.sha1(json.dumps(source, sort_keys=True).encode("utf-8")).hexdigest()
+    return f"{source['id']}_{digest[:10]}"
+
+
+def latest_run_path(country):
+    """Returns the results directory of the last unfinished run, or None."""
+    runs = sorted(
+        path
+        for path in Path(f"results/{country}").glob("*")
+        if (path / "checkpoints" / MANIFEST_FILE).exists()
+    )
+    if runs and not Checkpoint(runs[-1]).manifest().get("finished"):
+        return runs[-1]
+    return None
+
+
+class Checkpoint:
+    """
+    Per-source checkpoints of a scraping run, under <results_path>/checkpoints.
+
+    The records of each completed source are written to their own JSON file,
+    and the manifest lists the completed and failed sources. A run resumed
+    from the same results directory reuses the records of completed sources
+    and only scrapes the others again.
+
+    Workers of a parallel run share the manifest, whose updates are
+    serialized with a file lock.
+    """
+
+    def __init__(self, results_path):
+        self.path = Path(results_path) / "checkpoints"
+        self.path.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        if not (self.path / MANIFEST_FILE).exists():
+            with self._manifest():
+                pass
+
+    def __getstate__(self):
+        # Sent to the worker processes of a parallel run
+        return {"path": self.path}
+
+    def __setstate__(self, state):
+        self.path = state["path"]
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def _manifest(self):
+        """Yields the manifest, and writes it back on exit."""
+        with self._lock, open(self.path / f"{MANIFEST_FILE}.lock", "w") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            manifest = self.manifest()
+            yield manifest
+            tmp_path = self.path / f"{MANIFEST_FILE}.{os.getpid()}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(manifest, f, ensure_ascii=False, indent=2)
+            os.replace(tmp_path, self.path / MANIFEST_FILE)
+
+    def manifest(self):
+        try:
+            with open(self.path / MANIFEST_FILE, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {"completed": {}, "failed": {}}
+
+    def failed_sources(self):
+        return self.manifest()["failed"]
+
+    def pending_sources(self, sources):
+        """Returns the sources that haven't been completed yet."""
+        completed = self.manifest()["completed"]
+        return [source for source in sources if source_key(source) not in completed]
+
+    def finish(self):
+        """Marks the run as finished, so that it can't be resumed anymore."""
+        with self._manifest() as manifest:
+            manifest["finished"] = True
+
+    def run(self, source, scrape):
+        """
+        Returns the records of a source, from its checkpoint when it has
+        already been completed, or else from scrape() and saves them.
+
+        Failures are logged and recorded in the manifest instead of being
+        raised, so that the other sources still get scraped.
+        """
+        key = source_key(source)
+        records_path = self.path / f"{key}.json"
+
+        if key in self.manifest()["completed"]:
+            with open(records_path, "r", encoding="utf-8") as f:
+                records = json.load(f)
+            logging.info(f"Source {source['url']} already completed ({len(records)} records)")
+            return records
+
+        try:
+            records = scrape()
+        except Exception as e:
+            logging.error(f"Source {source['url']} failed: {e}", exc_info=True)
+            with self._manifest() as manifest:
+                manifest["failed"][key] = {"url": source["url"], "error": str(e)}
+            return []
+
+        with open(records_path, "w", encoding="utf-8") as f:
+            json.dump(records, f, ensure_ascii=False, indent=2, default=str)
+        with self._manifest() as manifest:
+            manifest["failed"].pop(key, None)
+            manifest["completed"][key] = {"url": source["url"], "records": len(records)}
+        return records
@@ -0,0 +1,149 @@
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import time
+
+from trouver_une_fresque_scraper.db.records import refresh_records
+from trouver_une_fresque_scraper.utils.sqlite_store import SQLiteStore
+
+# Records of an unchanged event are reused for at most this long (in seconds),
+# so that details missing from the listing (sold out...) are eventually checked.
+FINGERPRINT_TTL = int(os.environ.get("FINGERPRINT_TTL", 7 * 24 * 3600))
+
+
+def content_hash(content):
+    """Returns the fingerprint of a listing card text or JSON payload."""
+    if not isinstance(content, str):
+        content = json.dumps(content, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+class FingerprintStore(SQLiteStore):
+    """
+    Fingerprints of the event pages scraped in previous runs.
+
+    For each event, keyed by source id and event uuid, stores the hash of its
+    listing content (card text or JSON payload) along with the records
+    produced from its page. As long as the listing content doesn't change and
+    the records are younger than FINGERPRINT_TTL, the page doesn't need to be
+    visited again.
+
+    Disabled (nothing is reused) unless FINGERPRINT_STORE_FILE is set.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS fingerprints (
+            source_id TEXT NOT NULL,
+            uuid TEXT NOT NULL,
+            content_hash TEXT NOT NULL,
+            records TEXT NOT NULL,
+            scraped_at REAL NOT NULL,
+            PRIMARY KEY (source_id, uuid)
+        )
+    """
+
+    def __init__(self, path=None, ttl=FINGERPRINT_TTL):
+        super().__init__(path)
+        self.enabled = bool(path)
+        self.ttl = ttl
+
+    def lookup(self, source_id, uuid, fingerprint):
+        """Returns the stored records of an unchanged event, or None."""
+        if not self.enabled:
+            return None
+        rows = self.execute(
+            "SELECT content_hash, records, scraped_at FROM fingerprints "
+            "WHERE source_id = ? AND uuid = ?",
+            (str(source_id), uuid),
+        )
+        if not rows:
+            return None
+        stored_hash, records, scraped_at = rows[0]
+        if stored_hash != fingerprint or time.time() - scraped_at > self.ttl:
+            return None
+        return json.loads(records)
+
+    def store(self, source_id, uuid, fingerprint, records):
+        if not self.enabled:
+            return
+        try:
+            self.execute(
+                "INSERT OR REPLACE INTO fingerprints "
+                "(source_id, uuid, content_hash, records, scraped_at) VALUES (?, ?, ?, ?, ?)",
+                (
+                    str(source_id),
+                    uuid,
+                    fingerprint,
+                    json.dumps(records, ensure_ascii=False),
+                    time.time(),
+                ),
+            )
+        except sqlite3.Error as e:
+            logging.warning(f"Could not write fingerprint of {uuid}: {e}")
+
+
+fingerprint_store = FingerprintStore(os.environ.get("FINGERPRINT_STORE_FILE"))
+
+
+def _as_list(result):
+    if result is None:
+        return []
+    return result if isinstance(result, list) else [result]
+
+
+def reuse_unchanged(source, links, contents, extract_uuid):
+    """
+    Splits event links between those whose page must be visited and those
+    whose records can be reused from a previous run.
+
+    Args:
+        source: Source page configuration dict
+        links: Event links collected from the listing
+        contents: Mapping of links to their listing content (card text or
+            JSON payload), links without content are always visited
+        extract_uuid: Function returning the event uuid of a link
+
+    Returns:
+        (links_to_visit, reused_records)
+    """
+    if not fingerprint_store.enabled:
+        return links, []
+
+    links_to_visit, reused_records = [], []
+    for link in links:
+        uuid = extract_uuid(link)
+        records = None
+        if uuid and contents.get(link):
+            records = fingerprint_store.lookup(source["id"], uuid, content_hash(contents[link]))
+        if records is None:
+            links_to_visit.append(link)
+        else:
+            reused_records += refresh_records(records)
+
+    if len(links_to_visit) < len(links):
+        logging.info(
+            f"Reusing records of {len(links) - len(links_to_visit)} unchanged events, "
+            f"visiting {len(links_to_visit)} event pages"
+        )
+    return links_to_visit, reused_records
+
+
+def store_results(source, links, contents, extract_uuid, results):
+    """
+    Stores the fingerprints of visited event links along with their records.
+
+    Args:
+        results: Results of the event pages, in the same order as links: a
+            record, a list of records or None. Events without records are
+            not stored, so that their page is visited again on the next run.
+    """
+    if not fingerprint_store.enabled:
+        return
+
+    for link, result in zip(links, results):
+        records = _as_list(result)
+        uuid = extract_uuid(link)
+        if records and uuid and contents.get(link):
+            fingerprint_store.store(source["id"], uuid, content_hash(contents[link]), records)
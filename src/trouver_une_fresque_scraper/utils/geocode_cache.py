@@ -0,0 +1,85 @@
+import json
+import logging
+import os
+import sqlite3
+import time
+
+from trouver_une_fresque_scraper.utils.sqlite_store import SQLiteStore
+
+# Time-to-live of cached geocoding results, in seconds. Places rarely move, but
+# OSM data gets fixed (see TUTORIAL_OSM.md), so unknown addresses are retried
+# much sooner than known ones.
+POSITIVE_TTL = int(os.environ.get("GEOCODE_CACHE_TTL", 90 * 24 * 3600))
+NEGATIVE_TTL = int(os.environ.get("GEOCODE_CACHE_NEGATIVE_TTL", 3 * 24 * 3600))
+
+
+class GeocodeCache(SQLiteStore):
+    """
+    SQLite-backed cache of geocoding results, indexed by canonical key (see
+    utils.location.canonical_location_string).
+
+    Each entry is written as soon as it is resolved. Negative results (no
+    match) are cached too, with a shorter time-to-live.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS geocode (
+            key TEXT PRIMARY KEY,
+            query TEXT NOT NULL,
+            raw TEXT,
+            updated_at REAL NOT NULL
+        )
+    """
+
+    def __init__(self, path=None):
+        super().__init__(path)
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        """
+        Looks up a cache key.
+
+        Returns:
+            (found, raw): found is False on a miss or an expired entry, raw is
+            the Nominatim raw result, or None for a cached negative result.
+        """
+        with self._lock:
+            rows = self.execute("SELECT raw, updated_at FROM geocode WHERE key = ?", (key,))
+            found = bool(rows)
+            if found:
+                ttl = POSITIVE_TTL if rows[0][0] is not None else NEGATIVE_TTL
+                found = time.time() - rows[0][1] <= ttl
+            if found:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+        if not found:
+            return False, None
+        raw = rows[0][0]
+        return True, json.loads(raw) if raw is not None else None
+
+    def set(self, key, query, raw):
+        """Stores the Nominatim raw result (or None) of the query sent for a key."""
+        try:
+            self.execute(
+                "INSERT OR REPLACE INTO geocode (key, query, raw, updated_at) "
+                "VALUES (?, ?, ?, ?)",
+                (
+                    key,
+                    query,
+                    json.dumps(raw, ensure_ascii=False) if raw is not None else None,
+                    time.time(),
+                ),
+            )
+        except sqlite3.Error as e:
+            logging.warning(f"Could not write geocode cache entry: {e}")
+
+    def log_stats(self):
+        lookups = self.hits + self.misses
+        if lookups:
+            logging.info(
+                f"Geocode cache: {self.hits} hits, {self.misses} misses "
+                f"({100 * self.hits / lookups:.0f}% hit rate)"
+            )
@@ -0,0 +1,250 @@
+import csv
+import json
+import logging
+import os
+import re
+import sqlite3
+import threading
+import unicodedata
+
+from abc import ABC, abstractmethod
+
+from geopy.location import Location
+
+try:
+    import fcntl
+except ImportError:
+    # No file locks (Windows): concurrent workers may each build an index
+    fcntl = None
+
+from trouver_une_fresque_scraper.utils.sqlite_store import SQLiteStore
+
+COUNTRY_NAMES = {"fr": "France", "ch": "Schweiz/Suisse/Svizzera/Svizra", "gb": "United Kingdom"}
+
+# Words following a house number ("20 bis")
+HOUSE_NUMBER_SUFFIXES = {"bis", "ter", "quater", "a", "b", "c", "d"}
+
+
+def _tokens(s):
+    s = unicodedata.normalize("NFKD", s or "")
+    s = "".join(c for c in s if not unicodedata.combining(c)).casefold()
+    return re.findall(r"\w+", s)
+
+
+class GeocoderBackend(ABC):
+    """Interface of the geocoders queried by utils.location."""
+
+    @abstractmethod
+    def geocode(self, query):
+        """Returns the geopy Location of a query string, or None."""
+
+
+class NominatimBackend(GeocoderBackend):
+    """Public Nominatim API, limited to one request per second."""
+
+    def __init__(self, geolocator):
+        self.geolocator = geolocator
+
+    def geocode(self, query):
+        return self.geolocator.geocode(query, addressdetails=True)
+
+
+class AddressIndex(SQLiteStore):
+    """
+    On-disk index of the addresses of a CSV dump, built by OfflineBackend.
+
+    Addresses are keyed by normalized postcode, city and street name, so that
+    a lookup only reads the rows of a street, whatever the size of the dump.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS addresses (
+            postcode TEXT NOT NULL,
+            city TEXT NOT NULL,
+            road TEXT NOT NULL,
+            house_number TEXT NOT NULL,
+            raw TEXT NOT NULL
+        )
+    """
+
+    INDEXES = [
+        "CREATE INDEX IF NOT EXISTS addresses_postcode_road_idx ON addresses (postcode, road)",
+        "CREATE INDEX IF NOT EXISTS addresses_city_road_idx ON addresses (city, road)",
+    ]
+
+    def find(self, column, keys, roads):
+        """Returns the (road, house_number, raw) rows of some streets, by postcode or city."""
+        keys, roads = list(keys), list(roads)
+        if not keys or not roads:
+            return []
+        return self.execute(
+            f"SELECT road, house_number, raw FROM addresses "
+            f"WHERE {column} IN ({', '.join('?' * len(keys))}) "
+            f"AND road IN ({', '.join('?' * len(roads))})",
+            keys + roads,
+        )
+
+
+class OfflineBackend(GeocoderBackend):
+    """
+    Local address index, built from CSV dumps.
+
+    Two formats are supported, detected from the header:
+    - BAN (Base Adresse Nationale, https://adresse.data.gouv.fr) exports,
+      semicolon-separated, for France.
+    - Generic OSM extracts, with lat, lon, country_code, road, postcode and
+      city columns at least. The other columns (house_number, state,
+      ISO3166-2-lvl4...) are copied as is into the Nominatim address
+      details, so that get_address() can read them.
+
+    Each dump is indexed once in a SQLite file next to it (<path>.sqlite),
+    rebuilt when the dump is newer, and shared by all the processes of a run.
+    Addresses are looked up by the postcode, or else the city, found in the
+    query, then matched on the street name, which must start a part of the
+    query once its house number is removed, and on the house number. Results
+    have the same shape as Nominatim results.
+    """
+
+    def __init__(self, paths, departments):
+        """
+        Args:
+            paths: CSV files to index
+            departments: Mapping of French department numbers to names
+        """
+        self.paths = paths
+        self.departments = departments
+        self._indexes = None
+        self._lock = threading.Lock()
+
+    def _load_ban_row(self, row):
+        house_number = " ".join(filter(None, [row.get("numero"), row.get("rep")]))
+        code_insee = row.get("code_insee", "")
+        department = code_insee[:3] if code_insee.startswith("97") else code_insee[:2]
+        address = {
+            "house_number": house_number,
+            "road": row["nom_voie"],
+            "city": row["nom_commune"],
+            "county": self.departments.get(department, ""),
+            "postcode": row["code_postal"],
+            "country_code": "fr",
+        }
+        if not house_number:
+            del address["house_number"]
+        return address, row["nom_voie"]
+
+    def _load_osm_row(self, row):
+        address = {
+            k: v for k, v in row.items() if k not in ("lat", "lon", "name") and k is not None and v
+        }
+        address["country_code"] = address.get("country_code", "").lower()
+        road = address.get("road") or address.get("square") or address.get("park")
+        return address, road
+
+    def _rows(self, path):
+        """Yields the rows of the address index of a CSV dump."""
+        with open(path, newline="", encoding="utf-8") as f:
+            header = f.readline()
+            f.seek(0)
+            delimiter = ";" if header.count(";") > header.count(",") else ","
+            reader = csv.DictReader(f, delimiter=delimiter)
+            is_ban = "nom_voie" in (reader.fieldnames or [])
+            for row in reader:
+                if not row.get("lat") or not row.get("lon"):
+                    continue
+                address, road = self._load_ban_row(row) if is_ban else self._load_osm_row(row)
+                if not road:
+                    continue
+                city = address.get("city") or address.get("town") or address.get("village")
+                display_name = ", ".join(
+                    filter(
+                        None,
+                        [
+                            " ".join(filter(None, [address.get("house_number"), road])),
+                            " ".join(filter(None, [address.get("postcode"), city])),
+                            COUNTRY_NAMES.get(address["country_code"]),
+                        ],
+                    )
+                )
+                raw = {
+                    "name": row.get("name", ""),
+                    "lat": row["lat"],
+                    "lon": row["lon"],
+                    "display_name": display_name,
+                    "address": address,
+                }
+                yield (
+                    "".join(_tokens(address.get("postcode"))),
+                    " ".join(_tokens(city)),
+                    " ".join(_tokens(road)),
+                    " ".join(_tokens(address.get("house_number"))),
+                    json.dumps(raw, ensure_ascii=False),
+                )
+
+    def _build(self, path, index_path):
+        tmp_path = f"{index_path}.{os.getpid()}.tmp"
+        conn = sqlite3.connect(tmp_path)
+        try:
+            conn.execute(AddressIndex.SCHEMA)
+            conn.executemany("INSERT INTO addresses VALUES (?, ?, ?, ?, ?)", self._rows(path))
+            for statement in AddressIndex.INDEXES:
+                conn.execute(statement)
+            count = conn.execute("SELECT COUNT(*) FROM addresses").fetchone()[0]
+            conn.commit()
+        finally:
+            conn.close()
+        os.replace(tmp_path, index_path)
+        logging.info(f"Indexed {count} addresses from {path} in {index_path}")
+
+    def _open(self, path):
+        """Returns the address index of a CSV dump, building it if needed."""
+        index_path = f"{path}.sqlite"
+        # Workers starting together wait for the first one to build the index
+        with open(f"{index_path}.lock", "w") as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            if not os.path.exists(index_path) or os.path.getmtime(index_path) < os.path.getmtime(
+                path
+            ):
+                self._build(path, index_path)
+        return AddressIndex(index_path)
+
+    def geocode(self, query):
+        with self._lock:
+            if self._indexes is None:
+                self._indexes = [self._open(path) for path in self.paths]
+
+        # Postcodes, including British ones split over two tokens ("SW1A 1AA")
+        tokens = _tokens(query)
+        postcodes = set(tokens + [a + b for a, b in zip(tokens, tokens[1:])])
+        parts = [_tokens(part) for part in re.split(r"[,\n]", query)]
+        cities = {" ".join(part) for part in parts if part}
+
+        # Street names the query may contain: the beginnings of its parts, once
+        # their house number is removed, along with that house number
+        streets = {}
+        for part in parts:
+            i = 0
+            while i < len(part) and (
+                part[i][0].isdigit() or (i > 0 and part[i] in HOUSE_NUMBER_SUFFIXES)
+            ):
+                i += 1
+            for j in range(i + 1, len(part) + 1):
+                streets.setdefault(" ".join(part[i:j]), " ".join(part[:i]))
+
+        best, best_score = None, 0
+        for index in self._indexes:
+            rows = index.find("postcode", postcodes, streets) or index.find("city", cities, streets)
+            for road, house_number, raw in rows:
+                score = len(road)
+                if house_number and house_number == streets[road]:
+                    score += 1000
+                if score > best_score:
+                    best, best_score = (json.loads(raw), house_number), score
+        if best is None:
+            return None
+
+        raw, house_number = best
+        if house_number and best_score < 1000:
+            # Street-level match: don't report another house number
+            del raw["address"]["house_number"]
+        return Location(address=raw["display_name"], point=(raw["lat"], raw["lon"]), raw=raw)
@@ -0,0 +1,120 @@
+import logging
+import os
+import queue
+import threading
+import time
+
+from concurrent.futures import Future
+
+try:
+    import fcntl
+except ImportError:
+    # No file locks (Windows): the rate limit is only shared within a process
+    fcntl = None
+
+
+class RateLimiter:
+    """
+    Rate limiter shared by all the processes using the same file: acquire()
+    blocks until 1 / rate seconds have passed since the last call made by
+    any of them.
+
+    The time of the last call is stored in the file, which stays locked while
+    it is read and updated, so that the worker processes of a parallel run
+    share one budget instead of getting one each. Without fcntl, the time of
+    the last call is kept in memory, and each process gets its own budget.
+    """
+
+    def __init__(self, rate, path):
+        self.interval = 1 / rate
+        self.path = path
+        self._lock = threading.Lock()
+        self._last_call = 0
+
+    def acquire(self):
+        if fcntl is None:
+            with self._lock:
+                delay = self._last_call + self.interval - time.time()
+                if delay > 0:
+                    time.sleep(delay)
+                self._last_call = time.time()
+            return
+
+        with self._lock, open(self.path, "a+") as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            f.seek(0)
+            try:
+                last_call = float(f.read() or 0)
+            except ValueError:
+                last_call = 0
+            delay = last_call + self.interval - time.time()
+            if delay > 0:
+                time.sleep(delay)
+            f.seek(0)
+            f.truncate()
+            f.write(repr(time.time()))
+
+
+class GeocodingService:
+    """
+    Queue of pending geocoding requests, resolved one at a time by a
+    background thread within the rate limit of the geocoder.
+
+    Requests are deduplicated by key: submitting a key that is already pending
+    returns the future of the pending request, so that the same string is
+    never sent twice to the geocoder, even by concurrent scrapers.
+    """
+
+    def __init__(self, resolve, rate, lock_path):
+        """
+        Args:
+            resolve: Function called with the arguments passed to submit(),
+                whose return value resolves the future
+            rate: Maximum number of calls to `resolve` per second, across all
+                the processes sharing lock_path
+            lock_path: File storing the time of the last call
+        """
+        self._resolve = resolve
+        self._limiter = RateLimiter(rate, lock_path)
+        self._lock = threading.Lock()
+        self._pid = None
+        self._queue = None
+        self._pending = None
+
+    def _start(self):
+        # Threads don't survive fork(): every process runs its own worker,
+        # started once by the first request of the process.
+        with self._lock:
+            if self._pid == os.getpid():
+                return
+            self._queue = queue.Queue()
+            self._pending = {}
+            threading.Thread(target=self._run, name="geocoding", daemon=True).start()
+            self._pid = os.getpid()
+
+    def _run(self):
+        while True:
+            key, args, future = self._queue.get()
+            self._limiter.acquire()
+            try:
+                future.set_result(self._resolve(*args))
+            except Exception as e:
+                future.set_exception(e)
+            finally:
+                with self._lock:
+                    self._pending.pop(key, None)
+
+    def submit(self, key, *args):
+        """Queues a request and returns a Future of its result."""
+        if self._pid != os.getpid():
+            self._start()
+        with self._lock:
+            future = self._pending.get(key)
+            if future is None:
+                future = Future()
+                self._pending[key] = future
+                self._queue.put((key, args, future))
+                backlog = self._queue.qsize()
+                if backlog and backlog % 50 == 0:
+                    logging.info(f"{backlog} geocoding requests pending")
+            return future
@@ -0,0 +1,107 @@
+import lxml.html
+
+from trouver_une_fresque_scraper.utils import http_cache
+
+BLOCK_TAGS = {
+    "address",
+    "article",
+    "aside",
+    "blockquote",
+    "dd",
+    "div",
+    "dl",
+    "dt",
+    "fieldset",
+    "figcaption",
+    "figure",
+    "footer",
+    "form",
+    "h1",
+    "h2",
+    "h3",
+    "h4",
+    "h5",
+    "h6",
+    "header",
+    "hr",
+    "li",
+    "main",
+    "nav",
+    "ol",
+    "p",
+    "pre",
+    "section",
+    "table",
+    "tr",
+    "ul",
+}
+SKIPPED_TAGS = {"script", "style", "noscript", "template", "head"}
+
+
+def has_class(name):
+    """XPath predicate equivalent to the CSS selector .name"""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+def is_hidden(element):
+    style = (element.get("style") or "").replace(" ", "").lower()
+    return element.get("hidden") is not None or "display:none" in style
+
+
+def get_text(element, include_hidden=False):
+    """
+    Returns the text of an element laid out like Selenium's WebElement.text:
+    one line per block element or <br>, with whitespace collapsed, and
+    without the contents of hidden elements unless include_hidden is set.
+    """
+    parts = []
+
+    def walk(el):
+        if not isinstance(el.tag, str) or el.tag in SKIPPED_TAGS:
+            return
+        if is_hidden(el) and not include_hidden:
+            return
+        if el.tag == "br":
+            parts.append("\n")
+        is_block = el.tag in BLOCK_TAGS
+        if is_block:
+            parts.append("\n")
+        if el.text:
+            parts.append(el.text)
+        for child in el:
+            walk(child)
+            if child.tail:
+                parts.append(child.tail)
+            if child.tag in ("td", "th"):
+                parts.append(" ")
+        if is_block:
+            parts.append("\n")
+
+    walk(element)
+    lines = (" ".join(line.split()) for line in "".join(parts).split("\n"))
+    return "\n".join(line for line in lines if line)
+
+
+def html_to_text(html):
+    """Returns the text of an HTML fragment, laid out by get_text."""
+    if not html or not html.strip():
+        return ""
+    return get_text(lxml.html.fragment_fromstring(html, create_parent="div"))
+
+
+def first(tree, *xpaths):
+    """Returns the first element matching one of the XPath expressions, or None."""
+    for xpath in xpaths:
+        elements = tree.xpath(xpath)
+        if elements:
+            return elements[0]
+    return None
+
+
+def fetch(url):
+    """Fetches a page and returns its HTML tree, with absolute links."""
+    response = http_cache.get(url)
+    response.raise_for_status()
+    tree = lxml.html.fromstring(response.content)
+    tree.make_links_absolute(response.url)
+    return tree
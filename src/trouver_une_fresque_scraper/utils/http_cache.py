@@ -0,0 +1,160 @@
+import hashlib
+import json
+import logging
+import os
+import requests
+import threading
+
+from collections import defaultdict
+from contextlib import contextmanager
+from urllib.parse import urlparse
+
+from requests.adapters import HTTPAdapter
+
+# Disk-backed HTTP cache, enabled when HTTP_CACHE_DIR is set
+_http_cache_dir = os.environ.get("HTTP_CACHE_DIR")
+
+DEFAULT_TIMEOUT = 30  # seconds
+
+# Maximum number of requests in flight to the same host
+MAX_REQUESTS_PER_HOST = 4
+
+# Shared session, so that connections are reused across requests to the same host
+session = requests.Session()
+_adapter = HTTPAdapter(pool_connections=16, pool_maxsize=MAX_REQUESTS_PER_HOST)
+session.mount("http://", _adapter)
+session.mount("https://", _adapter)
+
+_host_semaphores = defaultdict(lambda: threading.BoundedSemaphore(MAX_REQUESTS_PER_HOST))
+_host_semaphores_lock = threading.Lock()
+
+
+@contextmanager
+def _host_slot(url):
+    """Limits the number of concurrent requests sent to the host of a URL."""
+    host = urlparse(url).hostname
+    with _host_semaphores_lock:
+        semaphore = _host_semaphores[host]
+    with semaphore:
+        yield
+
+
+def _session_get(url, **kwargs):
+    with _host_slot(url):
+        return session.get(url, **kwargs)
+
+
+def _entry_path(url, suffix):
+    digest = hashlib.sha256(url.encode("utf-8")).hexdigest()
+    return os.path.join(_http_cache_dir, f"{digest}.{suffix}")
+
+
+def _read_json(path):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
+
+
+def _write_atomic(path, data, mode="w"):
+    tmp_path = f"{path}.{os.getpid()}-{threading.get_ident()}.tmp"
+    kwargs = {"encoding": "utf-8"} if "b" not in mode else {}
+    with open(tmp_path, mode, **kwargs) as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+def _cached_response(url, meta, content):
+    response = requests.Response()
+    response.status_code = 200
+    response.url = url
+    response._content = content
+    response.encoding = meta.get("encoding")
+    response.headers["Content-Type"] = meta.get("content_type", "")
+    return response
+
+
+def get(url, timeout=DEFAULT_TIMEOUT, headers=None):
+    """
+    Sends a GET request, revalidating the cached copy of the response if any.
+
+    The ETag and Last-Modified validators of successful responses are stored
+    along with their body under HTTP_CACHE_DIR, and sent back with
+    If-None-Match/If-Modified-Since on the next request. On a 304 Not
+    Modified, the cached body is returned as a 200 response.
+
+    The returned response has a `from_cache` attribute, True when the server
+    confirmed that the cached copy is still valid.
+    """
+    headers = dict(headers or {})
+    if not _http_cache_dir:
+        response = _session_get(url, headers=headers, timeout=timeout)
+        response.from_cache = False
+        return response
+
+    os.makedirs(_http_cache_dir, exist_ok=True)
+    meta_path = _entry_path(url, "json")
+    body_path = _entry_path(url, "body")
+
+    meta = _read_json(meta_path) or {}
+    if meta.get("etag"):
+        headers["If-None-Match"] = meta["etag"]
+    if meta.get("last_modified"):
+        headers["If-Modified-Since"] = meta["last_modified"]
+
+    response = _session_get(url, headers=headers, timeout=timeout)
+
+    if response.status_code == 304 and os.path.exists(body_path):
+        logging.info(f"Not modified since last run: {url}")
+        with open(body_path, "rb") as f:
+            response = _cached_response(url, meta, f.read())
+        response.from_cache = True
+        return response
+
+    response.from_cache = False
+    if response.status_code == 200:
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if etag or last_modified:
+            try:
+                _write_atomic(body_path, response.content, mode="wb")
+                _write_atomic(
+                    meta_path,
+                    json.dumps(
+                        {
+                            "url": url,
+                            "etag": etag,
+                            "last_modified": last_modified,
+                            "encoding": response.encoding,
+                            "content_type": response.headers.get("Content-Type", ""),
+                        }
+                    ),
+                )
+            except OSError as e:
+                logging.warning(f"Could not write HTTP cache entry for {url}: {e}")
+
+    return response
+
+
+def load_records(key):
+    """
+    Returns the records stored for a cache key by store_records(), or None.
+
+    Used to skip parsing completely when get() reports that a source hasn't
+    changed since the records were produced.
+    """
+    if not _http_cache_dir:
+        return None
+    return _read_json(_entry_path(key, "records.json"))
+
+
+def store_records(key, records):
+    """Stores the records produced from the current version of a source."""
+    if not _http_cache_dir:
+        return
+    try:
+        os.makedirs(_http_cache_dir, exist_ok=True)
+        _write_atomic(_entry_path(key, "records.json"), json.dumps(records, ensure_ascii=False))
+    except OSError as e:
+        logging.warning(f"Could not write cached records for {key}: {e}")
@@ -1,52 +1,35 @@
-import atexit
-import json
 import logging
 import os
 import re
+import tempfile
+import unicodedata
+
+from concurrent.futures import Future
 
 from geopy.location import Location
 from trouver_une_fresque_scraper.utils.errors import *
+from trouver_une_fresque_scraper.utils.geocode_cache import GeocodeCache
+from trouver_une_fresque_scraper.utils.geocoder_backends import NominatimBackend, OfflineBackend
+from trouver_une_fresque_scraper.utils.geocoding import GeocodingService
 
 from geopy.geocoders import Nominatim
 
 geolocator = Nominatim(user_agent="trouver-une-fresque", timeout=10)
 
-# Disk-backed geocode cache
-_geocode_cache = {}
-_geocode_cache_file = os.environ.get("GEOCODE_CACHE_FILE")
-
-
-def _load_geocode_cache():
-    """Load the geocode cache from disk if GEOCODE_CACHE_FILE is set."""
-    global _geocode_cache
-    if _geocode_cache_file and os.path.exists(_geocode_cache_file):
-        try:
-            with open(_geocode_cache_file, "r", encoding="utf-8") as f:
-                _geocode_cache = json.load(f)
-            logging.info(
-                f"Loaded {len(_geocode_cache)} geocode cache entries from {_geocode_cache_file}"
-            )
-        except (json.JSONDecodeError, OSError) as e:
-            logging.warning(f"Could not load geocode cache: {e}")
-            _geocode_cache = {}
-
-
-def _save_geocode_cache():
-    """Save the geocode cache to disk if GEOCODE_CACHE_FILE is set."""
-    if _geocode_cache_file and _geocode_cache:
-        try:
-            with open(_geocode_cache_file, "w", encoding="utf-8") as f:
-                json.dump(_geocode_cache, f, ensure_ascii=False, indent=2)
-            logging.info(
-                f"Saved {len(_geocode_cache)} geocode cache entries to {_geocode_cache_file}"
-            )
-        except OSError as e:
-            logging.warning(f"Could not save geocode cache: {e}")
+# Nominatim allows at most one request per second, whatever the number of
+# threads and processes scraping concurrently.
+NOMINATIM_RATE = 1.0  # requests per second
 
+# Geocode cache, persisted in SQLite when GEOCODE_CACHE_FILE is set
+_geocode_cache = GeocodeCache(os.environ.get("GEOCODE_CACHE_FILE"))
 
-# Load cache on import and register save on exit
-_load_geocode_cache()
-atexit.register(_save_geocode_cache)
+# File shared by the processes of a run to enforce NOMINATIM_RATE, next to the
+# geocode cache when it is persisted
+NOMINATIM_RATE_FILE = (
+    f"{os.environ['GEOCODE_CACHE_FILE']}.ratelimit"
+    if os.environ.get("GEOCODE_CACHE_FILE")
+    else os.path.join(tempfile.gettempdir(), "trouver-une-fresque-nominatim.ratelimit")
+)
 
 departments = {
     "01": "Ain",
@@ -152,32 +135,120 @@ departments = {
     "976": "Mayotte",
 }
 
+# Geocoders tried in order. Local indexes (GEOCODER_OFFLINE_INDEX, a list of CSV
+# files separated by os.pathsep) answer first, Nominatim only on their misses.
+_nominatim_backend = NominatimBackend(geolocator)
+_local_backends = []
+if os.environ.get("GEOCODER_OFFLINE_INDEX"):
+    _local_backends.append(
+        OfflineBackend(os.environ["GEOCODER_OFFLINE_INDEX"].split(os.pathsep), departments)
+    )
+
 cache = {}
 
 
-def geocode_location_string(location_string):
+def remove_parentheses(location_string):
+    return re.sub(r"\(.*\)", "", location_string)
+
+
+def location_candidates(full_location):
     """
-    Requests Nominatim to geocode an input string. Results are cached in memory
-    and persisted to disk (when GEOCODE_CACHE_FILE is set) so they survive
-    across scraping attempts.
+    Yields the strings to geocode for a location, from the most to the least
+    specific: the full string, without the parenthetical notes, without the
+    first comma-separated part (usually the venue name), and without the
+    first line.
     """
-    location_string = location_string.strip()
-    if location_string in _geocode_cache:
-        raw = _geocode_cache[location_string]
-        if raw is None:
-            return None
-        return Location(
-            address=raw.get("display_name", ""),
-            point=(raw["lat"], raw["lon"]),
-            raw=raw,
-        )
+    yield full_location
+    full_location = remove_parentheses(full_location)
+    yield full_location
+    if "," in full_location:
+        yield full_location.split(",", 1)[1]
+    lines = full_location.splitlines(keepends=True)
+    if len(lines) > 1:
+        yield "".join(lines[1:])
 
+
+def canonical_location_string(location_string):
+    """
+    Returns the geocode cache key of a location string, so that strings that
+    differ only in case, accents, whitespace, punctuation or line breaks share
+    a cache entry.
+
+    Parenthetical notes are kept: they change the query sent to Nominatim, and
+    get_address() retries the string without them as a separate candidate.
+    """
+    s = unicodedata.normalize("NFKD", location_string)
+    s = "".join(c for c in s if not unicodedata.combining(c)).casefold()
+    s = re.sub(r"[\r\n]+", ",", s)
+    s = re.sub(r"[^\w,]+", " ", s)
+    s = re.sub(r"\s*,[\s,]*", ", ", s)
+    return s.strip(" ,")
+
+
+def log_geocode_cache_stats():
+    _geocode_cache.log_stats()
+
+
+def _geocode(key, location_string):
     logging.info(f"Calling geocoder: {location_string}")
-    result = geolocator.geocode(location_string, addressdetails=True)
-    _geocode_cache[location_string] = result.raw if result else None
+    result = _nominatim_backend.geocode(location_string)
+    _geocode_cache.set(key, location_string, result.raw if result else None)
     return result
 
 
+_geocoding_service = GeocodingService(_geocode, rate=NOMINATIM_RATE, lock_path=NOMINATIM_RATE_FILE)
+
+
+def geocode_async(location_string):
+    """
+    Returns a Future of the location of an input string, or None.
+
+    Local geocoder backends are tried first. Nominatim results, including the
+    absence of result, are cached (on disk when GEOCODE_CACHE_FILE is set) so
+    they survive across scraping attempts and runs. Cache misses are queued to
+    the geocoding service, which resolves them in the background within the
+    Nominatim usage policy.
+    """
+    location_string = location_string.strip()
+    future = Future()
+    for backend in _local_backends:
+        location = backend.geocode(location_string)
+        if location is not None:
+            future.set_result(location)
+            return future
+
+    key = canonical_location_string(location_string)
+    found, raw = _geocode_cache.get(key)
+    if not found:
+        return _geocoding_service.submit(key, key, location_string)
+
+    if raw is None:
+        future.set_result(None)
+    else:
+        future.set_result(
+            Location(
+                address=raw.get("display_name", ""),
+                point=(raw["lat"], raw["lon"]),
+                raw=raw,
+            )
+        )
+    return future
+
+
+def geocode_location_string(location_string):
+    """Requests Nominatim to geocode an input string, see geocode_async()."""
+    return geocode_async(location_string).result()
+
+
+def prefetch_address(full_location):
+    """
+    Queues the geocoding of a location ahead of get_address(), so that the
+    caller can keep working while the request waits for its turn.
+    """
+    if full_location and canonical_location_string(full_location):
+        geocode_async(full_location)
+
+
 def get_address(full_location):
     """
     Gets structured location data from an input string, tries substrings if
@@ -188,17 +259,16 @@ def get_address(full_location):
         if not full_location:
             raise FreskAddressNotFound("")
 
-        location = geocode_location_string(full_location)
-        if location is None:
-            full_location = re.sub(r"\(.*\)", "", full_location)
-            location = geocode_location_string(full_location)
-        if location is None:
-            if "," in full_location:
-                location = geocode_location_string(full_location.split(",", 1)[1])
-        if location is None:
-            lines = full_location.splitlines(keepends=True)
-            if len(lines) > 1:
-                location = geocode_location_string("".join(lines[1:]))
+        location = None
+        tried = set()
+        for candidate in location_candidates(full_location):
+            key = canonical_location_string(candidate)
+            if not key or key in tried:
+                continue
+            tried.add(key)
+            location = geocode_location_string(candidate)
+            if location is not None:
+                break
         if location is None:
             raise FreskAddressNotFound(full_location)
 
@@ -0,0 +1,172 @@
+import logging
+import os
+import tempfile
+
+
+from trouver_une_fresque_scraper.utils import location
+from trouver_une_fresque_scraper.utils.geocoder_backends import OfflineBackend
+
+
+def run_canonical_location_string_tests():
+    # tuple fields:
+    # 1. Test case name or ID
+    # 2. Input location strings, which should all share a cache key
+    # 3. Expected cache key
+    test_cases = [
+        (
+            "Case and whitespace",
+            [
+                "  12 rue de la Paix,  Paris ",
+                "12 Rue de la Paix, PARIS",
+                "12  rue de la paix ,Paris",
+            ],
+            "12 rue de la paix, paris",
+        ),
+        (
+            "Accents and hyphens",
+            [
+                "Place de l'Hôtel-de-Ville, Saint-Étienne",
+                "Place de l Hotel de Ville, Saint Etienne",
+            ],
+            "place de l hotel de ville, saint etienne",
+        ),
+        (
+            "Line breaks",
+            ["La Base\n31 rue Bichat\n75010 Paris", "La Base, 31 rue Bichat, 75010 Paris"],
+            "la base, 31 rue bichat, 75010 paris",
+        ),
+        (
+            "Parenthetical note",
+            [
+                "Mairie (salle du conseil), 1 place du Marché, Lyon",
+                "Mairie (Salle du Conseil), 1 place du Marché, Lyon",
+            ],
+            "mairie salle du conseil, 1 place du marche, lyon",
+        ),
+    ]
+    for test_case in test_cases:
+        logging.info(f"Running {test_case[0]}")
+        for input_string in test_case[1]:
+            actual = location.canonical_location_string(input_string)
+            if actual == test_case[2]:
+                logging.info("Result matches")
+            else:
+                logging.error(f"{test_case[0]}: expected {test_case[2]} but got {actual}")
+
+    # Location strings which are different queries, and must not share a cache key
+    distinct_cases = [
+        (
+            "Without parenthetical note",
+            "Le Lieu (2e étage), 3 rue X, Paris",
+            "Le Lieu, 3 rue X, Paris",
+        ),
+        ("Different parenthetical notes", "Salle X (Lyon)", "Salle X (Paris)"),
+    ]
+    for name, first_string, second_string in distinct_cases:
+        logging.info(f"Running {name}")
+        first_key = location.canonical_location_string(first_string)
+        second_key = location.canonical_location_string(second_string)
+        if first_key != second_key:
+            logging.info("Result matches")
+        else:
+            logging.error(f"{name}: {first_string} and {second_string} share key {first_key}")
+
+
+def run_location_candidates_tests():
+    # tuple fields:
+    # 1. Test case name or ID
+    # 2. Input location string
+    # 3. Expected candidates, in order
+    test_cases = [
+        (
+            "Venue, address",
+            "Le Lieu (2e étage), 3 rue X, Paris",
+            [
+                "Le Lieu (2e étage), 3 rue X, Paris",
+                "Le Lieu , 3 rue X, Paris",
+                " 3 rue X, Paris",
+            ],
+        ),
+        (
+            "Multiline",
+            "Le Lieu\n3 rue X\nParis",
+            ["Le Lieu\n3 rue X\nParis", "Le Lieu\n3 rue X\nParis", "3 rue X\nParis"],
+        ),
+    ]
+    for test_case in test_cases:
+        logging.info(f"Running {test_case[0]}")
+        actual = list(location.location_candidates(test_case[1]))
+        if actual == test_case[2]:
+            logging.info("Result matches")
+        else:
+            logging.error(f"{test_case[0]}: expected {test_case[2]} but got {actual}")
+
+
+def run_offline_backend_tests():
+    ban_csv = (
+        "id;numero;rep;nom_voie;code_postal;code_insee;nom_commune;lon;lat\n"
+        "44109_1;18;;Rue de Savenay;44000;44109;Nantes;-1.5646;47.2141\n"
+        "44109_2;20;bis;Allée de la Maison Rouge;44000;44109;Nantes;-1.5560;47.2110\n"
+        "69266_1;229;;Cours Emile Zola;69100;69266;Villeurbanne;4.8800;45.7680\n"
+        "44109_3;5;;Rue de Paris;44000;44109;Nantes;-1.5500;47.2200\n"
+    )
+    # tuple fields:
+    # 1. Test case name or ID
+    # 2. Input location string
+    # 3. Expected address details, or None
+    test_cases = [
+        (
+            "Venue, number, street, postcode",
+            "L'Epicerie d'ADDA, 18 Rue de Savenay, 44000 Nantes, France",
+            {"house_number": "18", "road": "Rue de Savenay", "county": "Loire-Atlantique"},
+        ),
+        (
+            "Bis, accents",
+            "Le Grand Bain, 20 bis Allee de la maison rouge, Nantes",
+            {"house_number": "20 bis", "road": "Allée de la Maison Rouge", "city": "Nantes"},
+        ),
+        (
+            "Unknown house number",
+            "1 Cours Emile Zola, 69100 Villeurbanne",
+            {"road": "Cours Emile Zola", "postcode": "69100"},
+        ),
+        ("Unknown street", "3 rue du Président Roosevelt 51100 Reims", None),
+        ("Street words in another order", "Maison de Paris, 12 Rue de Nantes, 44000 Nantes", None),
+        (
+            "No comma after the street",
+            "5 rue de Paris 44000 Nantes",
+            {"house_number": "5", "road": "Rue de Paris"},
+        ),
+    ]
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "ban.csv")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(ban_csv)
+        backend = OfflineBackend([path], location.departments)
+
+        for test_case in test_cases:
+            logging.info(f"Running {test_case[0]}")
+            result = backend.geocode(test_case[1])
+            if test_case[2] is None:
+                if result is None:
+                    logging.info("Result matches")
+                else:
+                    logging.error(f"{test_case[0]}: expected no result but got {result.raw}")
+                continue
+            actual = result.raw["address"] if result else None
+            expected = test_case[2]
+            if (
+                actual
+                and all(actual.get(k) == v for k, v in expected.items())
+                and ("house_number" in expected or "house_number" not in actual)
+            ):
+                logging.info("Result matches")
+            else:
+                logging.error(f"{test_case[0]}: expected {expected} but got {actual}")
+
+
+def run_tests():
+    run_canonical_location_string_tests()
+    run_location_candidates_tests()
+    run_offline_backend_tests()
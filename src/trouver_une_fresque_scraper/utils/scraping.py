@@ -150,3 +150,36 @@ def safe_find_element(
         if required:
             raise
         return None
+
+
+def wait_until_ready(driver, locator=None, timeout=DEFAULT_TIMEOUT) -> bool:
+    """
+    Wait for a page to be ready to scrape, instead of sleeping a fixed delay.
+
+    Waits for the document to be fully loaded, then for an element matching
+    the locator (if any) to be present, for at most timeout seconds overall.
+
+    Args:
+        driver: Selenium WebDriver instance
+        locator: Optional (by, value) tuple of an element rendered by scripts
+        timeout: Maximum wait time in seconds (default: 10)
+
+    Returns:
+        True if the page is ready, False on timeout
+
+    Example:
+        driver.get(link)
+        wait_until_ready(driver, (By.TAG_NAME, "h1"))
+    """
+
+    def is_ready(driver):
+        if driver.execute_script("return document.readyState") != "complete":
+            return False
+        return locator is None or EC.presence_of_element_located(locator)(driver)
+
+    try:
+        WebDriverWait(driver, timeout).until(is_ready)
+        return True
+    except TimeoutException:
+        logging.debug(f"Page not ready after {timeout}s: {locator}")
+        return False
@@ -0,0 +1,43 @@
+import logging
+import os
+import sqlite3
+import threading
+
+
+class SQLiteStore:
+    """
+    Base class of the persistent stores kept across runs in a SQLite file.
+
+    Statements run in autocommit mode, so that every write survives a crash,
+    and the file can be shared by scrapers running in parallel processes.
+    Without a path, the store lives in memory for the duration of the run.
+
+    Subclasses define the SCHEMA of their table and run their statements
+    through execute().
+    """
+
+    SCHEMA = None
+
+    def __init__(self, path=None):
+        self.path = path or ":memory:"
+        self._lock = threading.RLock()
+        self._conn = None
+        self._pid = None
+
+    def _connection(self):
+        # SQLite connections can't be used across fork(): reopen in each process.
+        if self._conn is None or self._pid != os.getpid():
+            self._conn = sqlite3.connect(
+                self.path, timeout=30, isolation_level=None, check_same_thread=False
+            )
+            self._pid = os.getpid()
+            if self.path != ":memory:":
+                self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(self.SCHEMA)
+            logging.info(f"Opened {type(self).__name__} {self.path}")
+        return self._conn
+
+    def execute(self, sql, parameters=()):
+        """Runs a statement and returns all the rows of its result."""
+        with self._lock:
+            return self._connection().execute(sql, parameters).fetchall()
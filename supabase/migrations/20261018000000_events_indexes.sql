@@ -0,0 +1,18 @@
+-- Indexes of the event tables, also defined in tables.sql for new databases.
+
+-- Last scrape of an event, looked up by db.etl.update_most_recent
+create index if not exists "events_scraped_id_workshop_type_scrape_date_idx"
+    on "private"."events_scraped" ("id", "workshop_type", "scrape_date");
+
+-- Events that started recently, checked again by db.etl.update_most_recent
+create index if not exists "events_scraped_start_date_idx"
+    on "private"."events_scraped" ("start_date");
+
+-- Past events of the public view
+create index if not exists "events_scraped_most_recent_idx"
+    on "private"."events_scraped" ("id", "workshop_type")
+    where "most_recent";
+
+-- Events matched by db.etl.merge and update_most_recent
+create index if not exists "events_future_id_workshop_type_idx"
+    on "private"."events_future" ("id", "workshop_type");
@@ -0,0 +1,10 @@
+-- Single row recording the last push, also defined in tables.sql for new
+-- databases. Rows of events_future keep the scrape date of their last change,
+-- this row tells when they were last seen (see db.etl.record_push).
+create table if not exists "private"."events_last_push" (
+    "id" boolean primary key default true check ("id"),
+    "push_date" timestamptz not null,
+    "scrape_date" timestamptz
+);
+
+alter table "private"."events_last_push" enable row level security;
@@ -29,6 +29,22 @@ create table "private"."events_scraped" (
     like "private"."events_future"
 );
 
+create table "private"."events_last_push" (
+    "id" boolean primary key default true check ("id"),
+    "push_date" timestamptz not null,
+    "scrape_date" timestamptz
+);
+
+create index "events_scraped_id_workshop_type_scrape_date_idx"
+    on "private"."events_scraped" ("id", "workshop_type", "scrape_date");
+create index "events_scraped_start_date_idx"
+    on "private"."events_scraped" ("start_date");
+create index "events_scraped_most_recent_idx"
+    on "private"."events_scraped" ("id", "workshop_type")
+    where "most_recent";
+create index "events_future_id_workshop_type_idx"
+    on "private"."events_future" ("id", "workshop_type");
+
 create view "public"."events" as ( 
     select * from "private"."events_future"
     union all
@@ -37,3 +53,4 @@ create view "public"."events" as (
 
 alter table "private"."events_future" enable row level security;
 alter table "private"."events_scraped" enable row level security;
+alter table "private"."events_last_push" enable row level security;
@@ -1,9 +1,15 @@
 from trouver_une_fresque_scraper.apis import ics_test
+from trouver_une_fresque_scraper.db import schema_test
+from trouver_une_fresque_scraper.scraper import eventbrite_new_test
 from trouver_une_fresque_scraper.utils import date_and_time_test
 from trouver_une_fresque_scraper.utils import language_test
+from trouver_une_fresque_scraper.utils import location_test
 
 
 if __name__ == "__main__":
     ics_test.run_tests()
     date_and_time_test.run_tests()
     language_test.run_tests()
+    location_test.run_tests()
+    schema_test.run_tests()
+    eventbrite_new_test.run_tests()